@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Compare serving a bundled file through Flask and ``AssetMiddleware``.
+
+Run it from the project root::
+
+    $ python benchmarks/bench_assets.py
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import os
+import pathlib
+import sys
+import time
+
+from flask import Flask
+
+from werkzeug.test import EnvironBuilder
+
+PATH = pathlib.Path(os.path.abspath(os.path.dirname(__file__))).parent
+
+sys.path.insert(0, str(PATH))
+
+from flask_semanticui import SemanticUI  # noqa
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+REPEAT = 5_000
+
+URL = "/static/semantic/css/semantic.min.css"
+
+HEADERS = (
+    ("fresh", {"Accept-Encoding": "gzip, br"}),
+    ("revalidated", {"Accept-Encoding": "gzip, br", "If-None-Match": None}),
+)
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def create_app(middleware):
+    app = Flask(__name__)
+    app.config["SEMANTIC_ASSET_MIDDLEWARE"] = middleware
+    SemanticUI(app)
+    return app
+
+
+def microseconds(app, headers):
+    environ = EnvironBuilder(URL, headers=headers).get_environ()
+
+    def start_response(status, headers):
+        start_response.headers = dict(headers)
+
+    b"".join(app(dict(environ), start_response))
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        body = app(dict(environ), start_response)
+        b"".join(body)
+        getattr(body, "close", lambda: None)()
+    elapsed = time.perf_counter() - start
+    return elapsed / REPEAT * 1_000_000, start_response.headers["ETag"]
+
+
+def main():
+    print(f"{'request':<12} {'flask µs':>10} {'middleware µs':>14}")
+    etags = {}
+    for name, headers in HEADERS:
+        timings = []
+        for middleware in (False, True):
+            app = create_app(middleware)
+            if "If-None-Match" in headers:
+                headers = dict(headers, **{"If-None-Match": etags[middleware]})
+            elapsed, etags[middleware] = microseconds(app, headers)
+            timings.append(elapsed)
+        print(f"{name:<12} {timings[0]:>10,.1f} {timings[1]:>14,.1f}")
+
+
+if __name__ == "__main__":
+    main()
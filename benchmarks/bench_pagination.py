@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Compare the count strategies of ``CountedPagination`` with ``paginate()``.
+
+Every strategy renders the first, a middle and the last page with the
+``render_ui_pagination`` macro, from a filtered query over an SQLite table.
+
+Run it from the project root::
+
+    $ python benchmarks/bench_pagination.py
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import os
+import pathlib
+import sys
+import time
+
+from flask import Flask, render_template_string
+
+from flask_sqlalchemy import SQLAlchemy
+
+PATH = pathlib.Path(os.path.abspath(os.path.dirname(__file__))).parent
+
+sys.path.insert(0, str(PATH))
+
+from flask_semanticui import (  # noqa
+    CachedCount,
+    CappedCount,
+    CountedPagination,
+    ExactCount,
+    ProbeCount,
+    SemanticUI,
+)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+ROWS = 1_000_000
+
+PER_PAGE = 20
+
+REPEAT = 20
+
+MACRO = """{% from 'semantic/pagination.html' import render_ui_pagination %}
+{{- render_ui_pagination(pagination) }}"""
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def create_app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    SemanticUI(app)
+    db = SQLAlchemy(app)
+
+    @app.route("/messages")
+    def messages():
+        return ""
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        author = db.Column(db.Integer, index=True)
+
+    with app.app_context():
+        db.create_all()
+        db.session.execute(
+            Message.__table__.insert(),
+            [{"author": i % 7} for i in range(ROWS)],
+        )
+        db.session.commit()
+    return app, Message
+
+
+def milliseconds(paginate, pages):
+    timings = []
+    for page in pages:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            render_template_string(MACRO, pagination=paginate(page))
+        timings.append((time.perf_counter() - start) / REPEAT * 1000)
+    return timings
+
+
+def main():
+    app, Message = create_app()  # noqa: N806
+    query = Message.query.filter(Message.author != 3).order_by(Message.id)
+    strategies = {
+        "paginate()": lambda page: query.paginate(page, PER_PAGE),
+        "ExactCount": lambda page: CountedPagination(
+            query, page, PER_PAGE, count=ExactCount()
+        ),
+    }
+    for name, count in (
+        ("CachedCount", CachedCount()),
+        ("ProbeCount", ProbeCount(10)),
+        ("CappedCount", CappedCount(1000)),
+    ):
+        strategies[name] = lambda page, count=count: CountedPagination(
+            query, page, PER_PAGE, count=count
+        )
+
+    with app.test_request_context("/messages"):
+        last = query.paginate(1, PER_PAGE).pages
+        pages = (1, last // 2, last)
+        print(f"{ROWS:,} rows, ms per rendered page")
+        print(f"{'strategy':<12}" + "".join(f"{p:>12,}" for p in pages))
+        for name, paginate in strategies.items():
+            timings = milliseconds(paginate, pages)
+            print(f"{name:<12}" + "".join(f"{t:>12.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
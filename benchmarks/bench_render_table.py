@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Compare the ``render_ui_table`` macro with ``render_table``.
+
+Run it from the project root::
+
+    $ python benchmarks/bench_render_table.py
+
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import os
+import pathlib
+import sys
+import time
+
+from flask import Flask, render_template_string
+
+PATH = pathlib.Path(os.path.abspath(os.path.dirname(__file__))).parent
+
+sys.path.insert(0, str(PATH))
+
+from flask_semanticui import SemanticUI, render_table  # noqa
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+SIZES = (1_000, 10_000, 100_000)
+
+TITLES = [("id", "#"), ("text", "Message"), ("author", "Author")]
+
+OPTIONS = {
+    "show_actions": True,
+    "view_url": ("view_message", [("message_id", ":id")]),
+    "edit_url": "/edit",
+}
+
+MACRO = """{% from 'semantic/table.html' import render_ui_table %}
+{{- render_ui_table(data, titles, **options) }}"""
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def create_app():
+    app = Flask(__name__)
+    SemanticUI(app)
+
+    @app.route("/messages/<int:message_id>")
+    def view_message(message_id):
+        return ""
+
+    return app
+
+
+def rows_per_second(func, data):
+    start = time.perf_counter()
+    html = func(data)
+    elapsed = time.perf_counter() - start
+    return len(data) / elapsed, html
+
+
+def main():
+    app = create_app()
+    with app.test_request_context("/"):
+        print(f"{'rows':>8} {'macro rows/s':>14} {'python rows/s':>14}")
+        for size in SIZES:
+            data = [
+                {"id": i, "text": f"Message {i}", "author": "me"}
+                for i in range(size)
+            ]
+            macro, macro_html = rows_per_second(
+                lambda d: render_template_string(
+                    MACRO, data=d, titles=TITLES, options=OPTIONS
+                ),
+                data,
+            )
+            python, python_html = rows_per_second(
+                lambda d: render_table(d, TITLES, **OPTIONS), data
+            )
+            assert macro_html == python_html
+            print(f"{size:>8} {macro:>14,.0f} {python:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,4 +34,13 @@ __version__ = "0.0.2"
 
 from .core import *  # noqa
 
+from .pagination import (  # noqa
+    CachedCount,
+    CappedCount,
+    CountedPagination,
+    CursorPagination,
+    ExactCount,
+    ProbeCount,
+)
+
 from .semantic import *  # noqa
@@ -0,0 +1,495 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+Content-hashed names for the bundled static files.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import gzip
+import hashlib
+import io
+import json
+import mimetypes
+import pathlib
+import posixpath
+import re
+import threading
+
+from flask import abort, request, send_file
+
+try:  # pragma: no cover
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+#: The folder of the bundled Semantic UI and jQuery files.
+STATIC_ROOT = pathlib.Path(__file__).parent / "static"
+
+#: Cache hashed files for a year, they never change under their name.
+IMMUTABLE_MAX_AGE = 31536000
+
+#: The files worth compressing, the others already are.
+COMPRESSIBLE_SUFFIXES = (".css", ".js", ".map", ".svg", ".ttf", ".otf", ".eot")
+
+
+def _gzip(data):
+    """Compress ``data`` with gzip, with a fixed header for stable output.
+
+    ``gzip.compress`` only takes ``mtime`` from Python 3.8.
+    """
+    buffer = io.BytesIO()
+    with gzip.GzipFile(
+        fileobj=buffer, mode="wb", compresslevel=9, mtime=0
+    ) as fp:
+        fp.write(data)
+    return buffer.getvalue()
+
+
+#: Compressors by content coding, in order of preference.
+ENCODINGS = {
+    "br": (".br", brotli and brotli.compress),
+    "gzip": (".gz", _gzip),
+}
+
+#: The file mapping the plain paths to the hashed ones, written by
+#: :func:`collect_assets`.
+MANIFEST_NAME = "manifest.json"
+
+_CSS_URL = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+_URL_SUFFIX = re.compile(r"([^?#]*)(.*)", re.S)
+
+_EXTERNAL_URL = re.compile(r"^(?:[a-z][a-z0-9+.-]*:|//|/|#)", re.I)
+
+_manifests = {}
+
+_manifests_lock = threading.Lock()
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def hashed_name(path, digest, length=8):
+    """Insert the first ``length`` characters of ``digest`` in ``path``.
+
+    ``css/semantic.min.css`` becomes ``css/semantic.min.3f9a1c2b.css``.
+    """
+    head, dot, suffix = path.rpartition(".")
+    if not dot or "/" in suffix:
+        return f"{path}.{digest[:length]}"
+    return f"{head}.{digest[:length]}.{suffix}"
+
+
+def rewrite_css_urls(css, path, rename, target=None):
+    """Replace the relative ``url()`` references of a stylesheet.
+
+    Parameters
+    ----------
+    css: ``str``
+        The stylesheet.
+    path: ``str``
+        The path of the stylesheet, the references are relative to it.
+    rename: ``callable``
+        Take the path of a referenced file, relative to the static root,
+        and return its new path or ``None`` to keep the reference.
+    target: ``str``
+        The path the stylesheet moves to, ``path`` by default. The new
+        references are relative to it.
+
+    Return
+    ------
+        The stylesheet with the new references, the query strings and
+        fragments (e.g. ``?#iefix``) are kept.
+    """
+    folder = posixpath.dirname(path)
+    target_folder = posixpath.dirname(path if target is None else target)
+
+    def replace(match):
+        quote, url = match.groups()
+        if _EXTERNAL_URL.match(url):
+            return match.group(0)
+        ref, suffix = _URL_SUFFIX.match(url).groups()
+        new = rename(posixpath.normpath(posixpath.join(folder, ref)))
+        if new is None:
+            return match.group(0)
+        new_ref = posixpath.relpath(new, target_folder or ".")
+        return f"url({quote}{new_ref}{suffix}{quote})"
+
+    return _CSS_URL.sub(replace, css)
+
+
+def compress_assets(output, root=STATIC_ROOT, encodings=None):
+    """Write the precompressed sidecars of the compressible files.
+
+    Files that compression wouldn't make smaller are skipped.
+
+    The sidecars, ``semantic.min.css.gz`` and friends, are written under
+    ``output`` at the path of their file, the stylesheets with rewritten
+    references get sidecars named after their hashed path. The
+    application reads them next to the files, pass ``root`` itself as
+    ``output`` to use them, e.g. when building an image; without sidecars
+    the files are compressed once per process, on first request.
+
+    Parameters
+    ----------
+    output: ``str`` or ``pathlib.Path``
+        The folder to write to, there's no default as the package folder
+        may be read-only.
+    root: ``pathlib.Path``
+        The static folder.
+    encodings: ``iterable``
+        The content codings to write, all the available ones by default.
+
+    Return
+    ------
+        The list of written files.
+    """
+    written = []
+    output, root = pathlib.Path(output), pathlib.Path(root)
+    encodings = [
+        encoding
+        for encoding in (ENCODINGS if encodings is None else encodings)
+        if ENCODINGS[encoding][1] is not None
+    ]
+    for asset in AssetManifest(root).files.values():
+        if not asset.compressible:
+            continue
+        for encoding in encodings:
+            suffix, compress = ENCODINGS[encoding]
+            sidecar = output / asset.sidecar(suffix).relative_to(root)
+            if sidecar in written:
+                continue
+            data = asset.read()
+            content = compress(data)
+            if len(content) < len(data):
+                sidecar.parent.mkdir(parents=True, exist_ok=True)
+                sidecar.write_bytes(content)
+                written.append(sidecar)
+    return written
+
+
+def collect_assets(manifest, output, exclude=None, encodings=None):
+    """Write the files of ``manifest`` into ``output`` for a front server.
+
+    Each file is written under its plain and hashed path, with the
+    precompressed sidecars smaller than it, and :data:`MANIFEST_NAME`
+    maps the plain paths to the hashed ones. Files of earlier collections
+    are left in place, so pages rendered before a deployment still find
+    their assets.
+
+    Parameters
+    ----------
+    manifest: :class:`AssetManifest`
+        The files to write, including the ones built at runtime.
+    output: ``str`` or ``pathlib.Path``
+        The target folder.
+    exclude: ``callable``
+        Called with each path, the files it's true for are skipped.
+    encodings: ``iterable``
+        The content codings to write, all the available ones by default.
+
+    Return
+    ------
+        The list of written files.
+    """
+    output = pathlib.Path(output)
+    encodings = [
+        encoding
+        for encoding in (ENCODINGS if encodings is None else encodings)
+        if ENCODINGS[encoding][1] is not None
+    ]
+    written = []
+    for path, asset in sorted(manifest.files.items()):
+        if exclude is not None and exclude(path):
+            continue
+        target = output / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(asset.read())
+        written.append(target)
+        for encoding in encodings:
+            content = asset.encoded(encoding)
+            if content is not None:
+                suffix = ENCODINGS[encoding][0]
+                sidecar = target.with_name(target.name + suffix)
+                sidecar.write_bytes(content)
+                written.append(sidecar)
+    names = {
+        path: hashed
+        for path, hashed in manifest.names.items()
+        if exclude is None or not exclude(path)
+    }
+    target = output / MANIFEST_NAME
+    target.write_text(json.dumps(names, indent=2, sort_keys=True) + "\n")
+    written.append(target)
+    return written
+
+
+def send_asset(filename):
+    """Serve a bundled file by its plain or hashed path."""
+    return get_manifest().send(filename)
+
+
+def _is_fresh(sidecar, source):
+    """Tell whether ``sidecar`` exists and is newer than ``source``."""
+    try:
+        return sidecar.stat().st_mtime >= source.stat().st_mtime
+    except OSError:
+        return False
+
+
+def get_manifest(root=STATIC_ROOT):
+    """Return the :class:`AssetManifest` of ``root``, built once."""
+    root = pathlib.Path(root)
+    with _manifests_lock:
+        manifest = _manifests.get(root)
+        if manifest is None:
+            manifest = _manifests[root] = AssetManifest(root)
+    return manifest
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class Asset(object):
+    """A static file served under its plain or hashed name.
+
+    Compressible files are served in the best content coding the client
+    accepts, read from a precompressed sidecar (``.br``, ``.gz``) next to
+    the file when it's up to date, otherwise compressed once and kept in
+    memory.
+
+    Parameters
+    ----------
+    path: ``str``
+        The served path, relative to the static root.
+    source: ``pathlib.Path``
+        The file on disk.
+    digest: ``str``
+        The SHA-256 of the served content, used as strong ETag.
+    data: ``bytes``
+        The served content when it differs from the file, e.g. a
+        stylesheet with rewritten references.
+    immutable: ``bool``
+        Whether the content never changes under this name.
+    encoded: ``dict``
+        The cache of compressed contents, shared by the assets serving the
+        same content.
+    """
+
+    def __init__(
+        self,
+        path,
+        source,
+        digest,
+        data=None,
+        immutable=False,
+        encoded=None,
+    ):
+        self.path = path
+        self.source = source
+        self.digest = digest
+        self.data = data
+        self.immutable = immutable
+        self.compressible = source.suffix in COMPRESSIBLE_SUFFIXES
+        self._encoded = {} if encoded is None else encoded
+
+    def encoded(self, encoding):
+        """Return the content compressed with ``encoding``, or ``None``.
+
+        ``None`` is also returned when compressing doesn't make the content
+        smaller.
+        """
+        try:
+            return self._encoded[encoding]
+        except KeyError:
+            pass
+        suffix, compress = ENCODINGS[encoding]
+        content = None
+        if self.compressible and compress is not None:
+            sidecar = self.sidecar(suffix)
+            if _is_fresh(sidecar, self.source):
+                content = sidecar.read_bytes()
+            else:
+                data = self.read()
+                content = compress(data)
+                if len(content) >= len(data):
+                    content = None
+        self._encoded[encoding] = content
+        return content
+
+    def read(self):
+        """Return the served content."""
+        if self.data is not None:
+            return self.data
+        return self.source.read_bytes()
+
+    def sidecar(self, suffix):
+        """Return the path of the precompressed file with ``suffix``.
+
+        Rewritten contents are only found under their hashed name, the
+        other ones next to their source.
+        """
+        name = self.source.name
+        if self.data is not None:
+            name = posixpath.basename(self.path)
+        return self.source.with_name(name + suffix)
+
+    def negotiate(self):
+        """Return the best ``(encoding, content)`` the client accepts.
+
+        Both are ``None`` for the identity coding.
+        """
+        offers = [name for name in ENCODINGS if ENCODINGS[name][1]]
+        while self.compressible and offers:
+            encoding = request.accept_encodings.best_match(offers)
+            if encoding is None:
+                break
+            content = self.encoded(encoding)
+            if content is not None:
+                return encoding, content
+            offers.remove(encoding)
+        return None, None
+
+    def send(self):
+        """Return the response serving this file."""
+        if self.immutable:
+            max_age = IMMUTABLE_MAX_AGE
+        else:
+            max_age = None
+        etag = self.digest
+        encoding, content = self.negotiate()
+        if content is not None:
+            file = io.BytesIO(content)
+            etag = f"{etag}-{encoding}"
+        elif self.data is not None:
+            file = io.BytesIO(self.data)
+        else:
+            file = str(self.source)
+        mimetype, _ = mimetypes.guess_type(self.path)
+        response = send_file(
+            file,
+            mimetype=mimetype or "application/octet-stream",
+            conditional=True,
+            etag=etag,
+            max_age=max_age,
+        )
+        if self.compressible:
+            response.vary.add("Accept-Encoding")
+            if encoding is not None:
+                response.content_encoding = encoding
+        if self.immutable:
+            response.cache_control.immutable = True
+        return response
+
+
+class AssetManifest(object):
+    """Content hashes of the files under a static folder.
+
+    Each file is available under its plain path and under a hashed path
+    holding a digest of its content, e.g. ``css/semantic.min.css`` and
+    ``css/semantic.min.3f9a1c2b.css``. Hashed paths change with the
+    content, so they can be cached forever.
+
+    The ``url()`` references of the stylesheets point at the hashed
+    paths too, stylesheets are then hashed after the files they use.
+
+    Parameters
+    ----------
+    root: ``pathlib.Path``
+        The static folder.
+    hash_length: ``int``
+        The number of hexadecimal digits of the digest in hashed paths.
+    """
+
+    def __init__(self, root=STATIC_ROOT, hash_length=8):
+        self.root = pathlib.Path(root)
+        self.hash_length = hash_length
+        #: Plain paths to hashed paths.
+        self.names = {}
+        #: Plain and hashed paths to their :class:`Asset`.
+        self.files = {}
+        self.build()
+
+    def build(self):
+        """Hash every file of the static folder."""
+        self.names, self.files = {}, {}
+        sidecars = tuple(suffix for suffix, _ in ENCODINGS.values())
+        sources = sorted(
+            (
+                source
+                for source in self.root.rglob("*")
+                if source.is_file() and source.suffix not in sidecars
+            ),
+            key=lambda source: (source.suffix == ".css", source),
+        )
+        for source in sources:
+            path = source.relative_to(self.root).as_posix()
+            self._add(path, source, source.read_bytes(), None)
+
+    def add(self, path, data):
+        """Serve ``data`` at ``path`` and its hashed path.
+
+        It makes files built at runtime, e.g. the component stylesheets,
+        available like the ones on disk.
+        """
+        self._add(path, self.root / path, data, data)
+
+    def _add(self, path, source, data, content):
+        """Add the plain and hashed :class:`Asset` of a file."""
+        encoded = {}
+        self.files[path] = Asset(
+            path,
+            source,
+            hashlib.sha256(data).hexdigest(),
+            content,
+            encoded=encoded,
+        )
+        if source.suffix == ".css":
+            css = rewrite_css_urls(data.decode("utf-8"), path, self.names.get)
+            if css.encode("utf-8") != data:
+                content = data = css.encode("utf-8")
+                encoded = {}
+        digest = hashlib.sha256(data).hexdigest()
+        hashed = hashed_name(path, digest, self.hash_length)
+        self.names[path] = hashed
+        self.files[hashed] = Asset(
+            hashed,
+            source,
+            digest,
+            content,
+            immutable=True,
+            encoded=encoded,
+        )
+
+    def url_path(self, path):
+        """Return the hashed path of ``path``, or ``path`` if unknown."""
+        return self.names.get(path, path)
+
+    def send(self, filename):
+        """Serve the file at the plain or hashed path ``filename``."""
+        asset = self.files.get(filename)
+        if asset is None:
+            abort(404)
+        return asset.send()
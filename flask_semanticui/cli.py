@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+The ``flask semantic`` commands.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import functools
+import os
+
+import click
+
+from flask import current_app
+from flask.cli import with_appcontext
+
+from . import core
+from .assets import MANIFEST_NAME, STATIC_ROOT, collect_assets, get_manifest
+from .components import build_bundle
+from .fonts import (
+    FONTS_FOLDER,
+    LOCAL_STYLESHEET,
+    apply_profile,
+    local_stylesheet,
+    profile_excludes,
+    use_local_fonts,
+)
+from .icons import (
+    ICON_FONTS,
+    build_icon_subset,
+    icon_tokens,
+    load_icon_subset,
+)
+from .purge import (
+    DEFAULT_SAFELIST,
+    collect_tokens,
+    crawl_paths,
+    crawl_tokens,
+    module_tokens,
+    purge_css,
+    template_tokens,
+)
+from .scripts import module_bundle, resolve_modules
+from .sri import CDN_FILES, fetch_cdn_integrity, get_sri_manifest
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def _crawl(app, crawl, urls):
+    """Return the tokens of the pages rendered at ``urls``.
+
+    With ``crawl``, the pages of the GET routes without arguments too.
+    """
+    paths = list(urls)
+    if crawl:
+        paths += [path for path in crawl_paths(app) if path not in paths]
+    tokens = set()
+    if paths:
+        tokens, failures = crawl_tokens(app, paths)
+        for path in failures:
+            click.echo(f"Skipped {path}: no HTML page", err=True)
+    return tokens
+
+
+def _app_tokens(app, crawl, urls):
+    """Return the tokens of the templates and, optionally, of the pages."""
+    return template_tokens(app) | module_tokens() | _crawl(app, crawl, urls)
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+
+
+@click.group("semantic")
+def semantic_cli():
+    """Manage the Semantic UI files."""
+
+
+@semantic_cli.command("sri")
+@click.option(
+    "--cdn",
+    "packages",
+    multiple=True,
+    metavar="PACKAGE@VERSION",
+    help="Also download and register the CDN files of a version, "
+    "e.g. semantic-ui@2.4.1.",
+)
+@click.option(
+    "--registry",
+    type=click.Path(dir_okay=False),
+    help="The registry of the CDN hashes, SEMANTIC_SRI_REGISTRY by default.",
+)
+@with_appcontext
+def sri_command(packages, registry):
+    """Compute the Subresource Integrity hashes of the files."""
+    for spec in packages:
+        package, _, version = spec.partition("@")
+        if package not in CDN_FILES or not version:
+            raise click.BadParameter(
+                f"expected one of {', '.join(CDN_FILES)} with a version, "
+                f"got {spec!r}",
+                param_hint="--cdn",
+            )
+    registry = registry or current_app.config["SEMANTIC_SRI_REGISTRY"]
+    if packages and not registry:
+        raise click.UsageError("Set SEMANTIC_SRI_REGISTRY or pass --registry.")
+
+    manifest = get_sri_manifest(current_app.config.get("SEMANTIC_SRI_CACHE"))
+    hashes = manifest.build(force=True)
+    if manifest.save(create=True):
+        click.echo(f"Hashed {len(hashes)} files into {manifest.cache_path}")
+    else:
+        click.echo(f"Hashed {len(hashes)} files")
+
+    for spec in packages:
+        package, _, version = spec.partition("@")
+        hashes = fetch_cdn_integrity(
+            core.cdn_base, package, version, registry
+        )
+        for filename, value in hashes.items():
+            click.echo(f"{package}@{version}/{filename} {value}")
+    if packages:
+        click.echo(f"Registered the CDN hashes in {registry}")
+
+
+@semantic_cli.command("purge")
+@click.option(
+    "--crawl",
+    is_flag=True,
+    help="Also scan the pages of the GET routes without arguments.",
+)
+@click.option(
+    "--url",
+    "urls",
+    multiple=True,
+    metavar="PATH",
+    help="Also scan the page at PATH.",
+)
+@click.option(
+    "--keep",
+    multiple=True,
+    metavar="CLASS",
+    help="Keep the rules using CLASS, e.g. added by your scripts.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False),
+    help="Where to write the stylesheet, SEMANTIC_PURGED_CSS by default.",
+)
+@with_appcontext
+def purge_command(crawl, urls, keep, output):
+    """Write a stylesheet without the rules the application doesn't use.
+
+    The class names come from the templates of the application and of the
+    extension, and optionally from the rendered pages. ``load_css`` serves
+    the stylesheet once the application restarts.
+    """
+    app = current_app._get_current_object()
+    tokens = _app_tokens(app, crawl, urls) | set(DEFAULT_SAFELIST) | set(keep)
+    components = app.config["SEMANTIC_COMPONENTS"]
+    profile = app.config["SEMANTIC_ASSET_PROFILE"]
+    if components:
+        _, source = build_bundle(components, profile=profile)
+    else:
+        source = (STATIC_ROOT / "css/semantic.min.css").read_text("utf-8")
+        source = use_local_fonts(source, LOCAL_STYLESHEET)
+        source = apply_profile(source, profile).encode("utf-8")
+    css = purge_css(source.decode("utf-8"), tokens).encode("utf-8")
+
+    output = output or app.config["SEMANTIC_PURGED_CSS"]
+    folder = os.path.dirname(os.path.abspath(output))
+    os.makedirs(folder, exist_ok=True)
+    with open(output, "wb") as fp:
+        fp.write(css)
+    click.echo(
+        f"Wrote {output}: {len(css) // 1024} KB, "
+        f"{len(css) / len(source):.0%} of {len(source) // 1024} KB"
+    )
+
+
+@semantic_cli.command("icons")
+@click.option(
+    "--crawl",
+    is_flag=True,
+    help="Also scan the pages of the GET routes without arguments.",
+)
+@click.option(
+    "--url",
+    "urls",
+    multiple=True,
+    metavar="PATH",
+    help="Also scan the page at PATH.",
+)
+@click.option(
+    "--keep",
+    multiple=True,
+    metavar="ICON",
+    help="Keep the icon ICON, e.g. 'angle down' added by your scripts.",
+)
+@click.option(
+    "--output",
+    type=click.Path(file_okay=False),
+    help="Where to write the fonts, SEMANTIC_ICON_SUBSET by default.",
+)
+@with_appcontext
+def icons_command(crawl, urls, keep, output):
+    """Write icon fonts holding only the icons the application uses.
+
+    The icon names come from the templates of the application, the icons
+    of the macros, and optionally from the rendered pages. ``load_css`` serves
+    stylesheets using the fonts once the application restarts.
+    """
+    app = current_app._get_current_object()
+    tokens = icon_tokens(app) | _crawl(app, crawl, urls)
+    tokens |= collect_tokens(" ".join(keep))
+    try:
+        icons = build_icon_subset(tokens)
+    except RuntimeError as error:
+        raise click.ClickException(str(error))
+
+    output = output or app.config["SEMANTIC_ICON_SUBSET"]
+    icons.save(output)
+    size = sum(len(data) for data in icons.fonts.values())
+    full = sum(
+        (STATIC_ROOT / FONTS_FOLDER / ICON_FONTS[family])
+        .with_suffix(".woff2")
+        .stat()
+        .st_size
+        for family in icons.families
+    )
+    click.echo(
+        f"Wrote {len(icons.fonts)} fonts into {output}: {size / 1024:.1f} "
+        f"KB, {size / max(full, 1):.0%} of {full // 1024} KB"
+    )
+
+
+@semantic_cli.command("collect")
+@click.argument("output", type=click.Path(file_okay=False))
+@with_appcontext
+def collect_command(output):
+    """Write the Semantic UI files into OUTPUT for a front server.
+
+    Each file is written under its plain and hashed name, with its
+    precompressed sidecars, and manifest.json maps the names. Set
+    SEMANTIC_STATIC_URL to the URL OUTPUT is served at and the tags use
+    the hashed files from there.
+
+    The files are known ahead of time: the bundled ones, those built for
+    the settings of the application and the icon sprite. The "auto"
+    script bundles aren't, so init_app refuses them with
+    SEMANTIC_STATIC_URL.
+    """
+    app = current_app._get_current_object()
+    manifest = get_manifest()
+    profile = app.config["SEMANTIC_ASSET_PROFILE"]
+    icons = None
+    if app.config["SEMANTIC_ICON_SUBSET"]:
+        icons = load_icon_subset(app.config["SEMANTIC_ICON_SUBSET"])
+    local_stylesheet(manifest, profile, icons)
+    modules = app.config["SEMANTIC_JS_MODULES"]
+    if modules and modules != "auto":
+        module_bundle(manifest, resolve_modules(modules))
+    if app.config["SEMANTIC_ICON_MODE"] == "svg":
+        app.extensions["semantic"].icon_sprite(app).register(manifest)
+
+    written = collect_assets(
+        manifest, output, exclude=functools.partial(profile_excludes, profile)
+    )
+    size = sum(path.stat().st_size for path in written)
+    click.echo(
+        f"Wrote {len(written)} files into {output}: {size // 1024} KB, "
+        f"names in {MANIFEST_NAME}"
+    )
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+Stylesheets holding only some of the Semantic UI components.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import functools
+import hashlib
+import re
+
+from .assets import STATIC_ROOT, rewrite_css_urls
+from .fonts import apply_profile, profile_path, use_local_fonts
+from .purge import purge_css
+
+#: The Semantic UI components, in the order of ``semantic.min.css``.
+COMPONENTS = (
+    "reset",
+    "site",
+    "button",
+    "container",
+    "divider",
+    "flag",
+    "header",
+    "icon",
+    "image",
+    "input",
+    "label",
+    "list",
+    "loader",
+    "placeholder",
+    "rail",
+    "reveal",
+    "segment",
+    "step",
+    "breadcrumb",
+    "form",
+    "grid",
+    "menu",
+    "message",
+    "table",
+    "ad",
+    "card",
+    "comment",
+    "feed",
+    "item",
+    "statistic",
+    "accordion",
+    "checkbox",
+    "dimmer",
+    "dropdown",
+    "embed",
+    "modal",
+    "nag",
+    "popup",
+    "progress",
+    "rating",
+    "search",
+    "shape",
+    "sidebar",
+    "sticky",
+    "tab",
+    "transition",
+)
+
+#: The global styles every bundle starts with.
+GLOBALS = ("reset", "site")
+
+#: Named component lists for ``SEMANTIC_COMPONENTS``.
+PRESETS = {
+    # What the macros of form_ui.html, table.html, pagination.html, nav.html
+    # and utils.html render.
+    "macros": (
+        "breadcrumb",
+        "button",
+        "checkbox",
+        "container",
+        "form",
+        "header",
+        "icon",
+        "menu",
+        "message",
+        "table",
+    ),
+}
+
+#: The preset of ``SEMANTIC_COMPONENTS = True``.
+DEFAULT_PRESET = "macros"
+
+#: The components of the macros rendered above the fold.
+CRITICAL_COMPONENTS = (
+    "reset",
+    "site",
+    "container",
+    "header",
+    "form",
+    "menu",
+    "message",
+)
+
+#: The classes of their markup with the default arguments of the macros.
+CRITICAL_CLASSES = frozenset(
+    (
+        "active",
+        "button",
+        "checkbox",
+        "container",
+        "dividing",
+        "error",
+        "field",
+        "fields",
+        "form",
+        "grouped",
+        "header",
+        "icon",
+        "inline",
+        "item",
+        "list",
+        "menu",
+        "message",
+        "primary",
+        "radio",
+        "required",
+        "sixteen",
+        "submit",
+        "ui",
+        "wide",
+    )
+)
+
+# What the first paint doesn't need: interaction states, print styles,
+# animations, fonts and the font @import, the full stylesheet brings them.
+_NOT_CRITICAL = re.compile(
+    r":(?:hover|focus|active|visited)\b"
+    r"|^@(?:import|font-face|media print|(?:-[a-z]+-)?keyframes)"
+)
+
+#: The folder of the component stylesheets, relative to the static root.
+COMPONENTS_FOLDER = "css/components"
+
+_BANNER = re.compile(r"/\*!\s*\* # Semantic UI [\d.]+ - ")
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def resolve_components(components):
+    """Return the components of a ``SEMANTIC_COMPONENTS`` value.
+
+    Parameters
+    ----------
+    components: ``str``, ``bool`` or ``iterable``
+        ``True`` for the default preset, the name of a preset or the
+        component names.
+
+    Return
+    ------
+        A ``tuple`` of component names in the order of
+        :data:`COMPONENTS`, starting with the :data:`GLOBALS`.
+    """
+    if components is True:
+        components = DEFAULT_PRESET
+    if isinstance(components, str):
+        try:
+            components = PRESETS[components]
+        except KeyError:
+            raise ValueError(
+                f"Unknown Semantic UI components preset {components!r}"
+            ) from None
+    names = set(components) | set(GLOBALS)
+    unknown = names.difference(COMPONENTS)
+    if unknown:
+        raise ValueError(
+            "Unknown Semantic UI components: " + ", ".join(sorted(unknown))
+        )
+    return tuple(name for name in COMPONENTS if name in names)
+
+
+def bundle_path(components):
+    """Return the path of the stylesheet of ``components``.
+
+    Presets get their name, ``css/semantic.macros.min.css``, other
+    lists a digest of their components.
+    """
+    names = resolve_components(components)
+    for preset, members in PRESETS.items():
+        if resolve_components(members) == names:
+            return f"css/semantic.{preset}.min.css"
+    digest = hashlib.sha256(",".join(names).encode("ascii")).hexdigest()
+    return f"css/semantic.custom-{digest[:8]}.min.css"
+
+
+def build_bundle(components, root=STATIC_ROOT, profile=None):
+    """Concatenate the stylesheets of ``components``.
+
+    Parameters
+    ----------
+    components: ``str``, ``bool`` or ``iterable``
+        See :func:`resolve_components`.
+    root: ``pathlib.Path``
+        The static folder holding :data:`COMPONENTS_FOLDER`.
+    profile: ``str``
+        The asset profile, see :func:`~flask_semanticui.fonts.apply_profile`.
+
+    Return
+    ------
+        A ``(path, content)`` tuple, the ``url()`` references of the
+        content are relative to ``path``. The fonts are the bundled ones.
+    """
+    path = profile_path(bundle_path(components), profile)
+    parts = []
+    for name in resolve_components(components):
+        source = f"{COMPONENTS_FOLDER}/{name}.min.css"
+        css = (root / source).read_text(encoding="utf-8")
+        parts.append(rewrite_css_urls(css, source, str, target=path))
+    css = apply_profile(use_local_fonts("".join(parts), path), profile)
+    return path, css.encode("utf-8")
+
+
+def critical_css(components=None):
+    """Return the rules the macros rendered above the fold need.
+
+    Parameters
+    ----------
+    components: ``str``, ``bool`` or ``iterable``
+        The components of the stylesheet, see :func:`resolve_components`,
+        ``None`` for all of them.
+
+    Return
+    ------
+        The rules of the :data:`CRITICAL_COMPONENTS` of ``components``
+        applying to the :data:`CRITICAL_CLASSES`, computed once per
+        component set.
+    """
+    names = resolve_components(CRITICAL_COMPONENTS)
+    if components is not None:
+        names = tuple(set(names) & set(resolve_components(components)))
+    return _critical_css(resolve_components(names))
+
+
+@functools.lru_cache(maxsize=None)
+def _critical_css(names):
+    """Compute :func:`critical_css` for resolved component names."""
+    _, css = build_bundle(names)
+    return purge_css(css.decode("utf-8"), CRITICAL_CLASSES, _NOT_CRITICAL)
+
+
+def split_components(css):
+    """Split ``semantic.min.css`` into its components.
+
+    The minified file keeps the license banner of each component,
+    except the one of the menu, which follows the grid.
+
+    Return
+    ------
+        A ``dict`` mapping the names of :data:`COMPONENTS` to their
+        styles. The header of the file, with the font ``@import``, goes
+        with the ``reset`` styles.
+    """
+    starts = [match.start() for match in _BANNER.finditer(css)]
+    menu = COMPONENTS.index("menu")
+    if len(starts) == len(COMPONENTS) - 1:
+        starts.insert(menu, css.find(".ui.menu{", starts[menu - 1]))
+    if len(starts) != len(COMPONENTS) or starts != sorted(starts):
+        raise ValueError("Not a Semantic UI 2.4 stylesheet")
+    starts[0] = 0
+    ends = starts[1:] + [len(css)]
+    return {
+        name: css[start:end]
+        for name, start, end in zip(COMPONENTS, starts, ends)
+    }
+
+
+def write_components(root=STATIC_ROOT, source="css/semantic.min.css"):
+    """Write the component stylesheets from the full one.
+
+    It's the build step of the ``css/components`` files shipped with the
+    extension, run it after updating ``semantic.min.css``.
+
+    Return
+    ------
+        The list of written files.
+    """
+    css = (root / source).read_text(encoding="utf-8")
+    folder = root / COMPONENTS_FOLDER
+    folder.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, styles in split_components(css).items():
+        path = f"{COMPONENTS_FOLDER}/{name}.min.css"
+        styles = rewrite_css_urls(styles, source, str, target=path)
+        (root / path).write_text(styles, encoding="utf-8")
+        written.append(root / path)
+    return written
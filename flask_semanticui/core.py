@@ -30,9 +30,72 @@ Implementation of SemanticUI in Flask.
 # =============================================================================
 
 
+import datetime
+import functools
+import os
+import posixpath
 import warnings
-
-from flask import Blueprint, Markup, current_app, url_for
+import weakref
+from urllib.parse import urlsplit
+
+from flask import (
+    Blueprint,
+    Markup,
+    abort,
+    current_app,
+    g,
+    has_request_context,
+    request,
+    url_for,
+)
+
+from .assets import STATIC_ROOT, get_manifest, send_asset
+from .cli import semantic_cli
+from .components import build_bundle, bundle_path, critical_css
+from .fonts import (
+    check_profile,
+    local_stylesheet,
+    profile_excludes,
+    profile_path,
+)
+from .hints import (
+    Hint,
+    font_hints,
+    hint_tags,
+    link_header,
+    preconnect_hints,
+)
+from .icons import (
+    ICON_MODES,
+    IconSprite,
+    SPRITE_PATH,
+    icon_tokens,
+    load_icon_subset,
+    render_svg_icon,
+    resolve_icon,
+    used_glyphs,
+    used_symbols,
+)
+from .middleware import AssetMiddleware
+from .purge import purged_path
+from .scripts import (
+    ON_DEMAND_SELECTOR,
+    bundle_modules,
+    check_strategy,
+    loader_script,
+    module_bundle,
+    resolve_modules,
+)
+from .sri import cdn_integrity, get_sri_manifest, integrity
+from .tables import (
+    ActionUrl,
+    delete_script,
+    get_table_titles,
+    prefetch_action_records,
+    render_table,
+    stream_table,
+)
+from .urls import page_url_builder
 
 try:  # pragma: no cover
     from wtforms.fields import HiddenField
@@ -50,26 +113,88 @@ else:
 
 cdn_base = "https://cdn.jsdelivr.net/npm"
 
+#: The settings the ``load_css``/``load_js`` tags depend on.
+asset_config_keys = (
+    "SEMANTIC_SERVE_LOCAL",
+    "SEMANTIC_FINGERPRINT",
+    "SEMANTIC_COMPONENTS",
+    "SEMANTIC_ASSET_PROFILE",
+    "SEMANTIC_ICON_MODE",
+    "SEMANTIC_JS_STRATEGY",
+    "SEMANTIC_JS_MODULES",
+    "SEMANTIC_STATIC_URL",
+    "SEMANTIC_SRI_CACHE",
+    "SEMANTIC_SRI_REGISTRY",
+)
+
 
 # docstr-coverage:excused `no one is reading this anyways`
 def raise_helper(message):  # pragma: no cover
     raise RuntimeError(message)
 
 
-def get_table_titles(data, primary_key, primary_key_title):
-    """Detect and build the table titles tuple from ORM object.
+def send_profile_asset(filename):
+    """Serve a bundled file, unless the asset profile leaves it out.
+
+    The files built on demand, like the icon sprite, are built when this
+    process didn't build them yet.
+    """
+    profile = current_app.config["SEMANTIC_ASSET_PROFILE"]
+    if profile_excludes(profile, filename):
+        abort(404)
+    if filename not in get_manifest().files:
+        app = current_app._get_current_object()
+        app.extensions["semantic"]._build_asset(app, filename)
+    return send_asset(filename)
+
+
+def _add_stylesheet(path, build, icons=None):
+    """Serve the stylesheet ``build()`` returns at ``path``.
 
-    .. note::
-        Currently only support SQLAlchemy.
+    The stylesheets built for an application are served like the bundled
+    files, with the fonts of the ``icons`` subset when there's one.
+
+    Return
+    ------
+        The served path.
+    """
+    manifest = get_manifest()
+    if icons is not None:
+        path = icons.stylesheet_path(path)
+    if path not in manifest.files:
+        data = build()
+        if icons is not None:
+            icons.register(manifest)
+            data = icons.apply(data.decode("utf-8"), path).encode("utf-8")
+        manifest.add(path, data)
+    return path
+
+
+def _hashable(value):
+    """Return ``value`` with its lists and sets turned into tuples."""
+    if isinstance(value, (set, frozenset)):
+        value = sorted(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _asset_key(app, stylesheet=None):
+    """Return what the asset tags of ``app`` depend on, besides arguments.
+
+    The URLs of local files, including the ``stylesheet`` built for the
+    application, also depend on the script root and scheme of the request,
+    the CDN ones don't.
     """
-    if not data:
-        return []
-    titles = []
-    for k in data[0].__table__.columns.keys():
-        if not k.startswith("_"):
-            titles.append((k, k.replace("_", " ").title()))
-    titles[0] = (primary_key, primary_key_title)
-    return titles
+    config = tuple(
+        _hashable(app.config.get(name)) for name in asset_config_keys
+    )
+    config += (stylesheet,)
+    if (
+        app.config.get("SEMANTIC_SERVE_LOCAL") or stylesheet
+    ) and has_request_context():
+        return config + (request.script_root, request.scheme)
+    return config
 
 
 # docstr-coverage:excused `no one is reading this anyways`
@@ -82,14 +207,31 @@ def simple_link_css(url):
     return f'<link rel="stylesheet" href="{url}">'
 
 
+def preload_css_with_critical(url, sri, critical):
+    """Inline ``critical`` and load the stylesheet without blocking.
+
+    The stylesheet is preloaded and applied once loaded, the
+    ``<noscript>`` fallback links it when scripts are disabled.
+    """
+    attrs = f' integrity="{sri}" crossorigin="anonymous"' if sri else ""
+    return (
+        f"<style>{critical}</style>\n"
+        f'<link rel="preload" href="{url}" as="style"{attrs} '
+        "onload=\"this.onload=null;this.rel='stylesheet'\">\n"
+        f'<noscript><link rel="stylesheet" href="{url}"{attrs}></noscript>'
+    )
+
+
 # docstr-coverage:excused `no one is reading this anyways`
-def scripts_with_sri(url, sri):
-    return f'<script src="{url}" integrity="{sri}" crossorigin="anonymous"></script>'  # noqa: E501
+def scripts_with_sri(url, sri, defer=False):
+    defer = " defer" if defer else ""
+    return f'<script src="{url}"{defer} integrity="{sri}" crossorigin="anonymous"></script>'  # noqa: E501
 
 
 # docstr-coverage:excused `no one is reading this anyways`
-def simple_scripts_js(url):
-    return f'<script src="{url}"></script>'
+def simple_scripts_js(url, defer=False):
+    defer = " defer" if defer else ""
+    return f'<script src="{url}"{defer}></script>'
 
 
 class _SemanticUI(object):
@@ -109,6 +251,10 @@ class _SemanticUI(object):
     jquery_filename = "jquery.min.js"
 
     def __init__(self, app=None):
+        self._asset_tags = weakref.WeakKeyDictionary()
+        self._stylesheets = weakref.WeakKeyDictionary()
+        self._icon_subsets = weakref.WeakKeyDictionary()
+        self._icon_sprites = weakref.WeakKeyDictionary()
         if app is not None:
             self.init_app(app)
 
@@ -117,9 +263,35 @@ class _SemanticUI(object):
 
         # default settings
         app.config.setdefault("SEMANTIC_SERVE_LOCAL", False)
+        app.config.setdefault("SEMANTIC_FINGERPRINT", False)
+        app.config.setdefault("SEMANTIC_STATIC_URL", None)
+        app.config.setdefault("SEMANTIC_COMPONENTS", None)
+        app.config.setdefault("SEMANTIC_ASSET_PROFILE", None)
+        app.config.setdefault(
+            "SEMANTIC_PURGED_CSS",
+            os.path.join(app.instance_path, "semantic.purged.min.css"),
+        )
+        app.config.setdefault(
+            "SEMANTIC_ICON_SUBSET",
+            os.path.join(app.instance_path, "semantic-icons"),
+        )
+        app.config.setdefault("SEMANTIC_ASSET_MIDDLEWARE", False)
+        app.config.setdefault("SEMANTIC_EARLY_HINTS", False)
+        app.config.setdefault("SEMANTIC_JS_STRATEGY", None)
+        app.config.setdefault("SEMANTIC_JS_MODULES", None)
+        app.config.setdefault(
+            "SEMANTIC_SRI_CACHE",
+            os.path.join(app.instance_path, "semantic-sri.json"),
+        )
+        app.config.setdefault(
+            "SEMANTIC_SRI_REGISTRY",
+            os.path.join(app.instance_path, "semantic-sri-registry.json"),
+        )
         app.config.setdefault("SEMANTIC_BUTTON_STYLE", "primary")
         app.config.setdefault("SEMANTIC_BUTTON_SIZE", "")
         app.config.setdefault("SEMANTIC_ICON_COLOR", None)
+        app.config.setdefault("SEMANTIC_ICON_MODE", "font")
+        app.config.setdefault("SEMANTIC_SVG_ICONS", ())
         app.config.setdefault("SEMANTIC_ICON_SIZE", None)
         app.config.setdefault(
             "SEMANTIC_ERROR_HEADER", "Action Forbidden"
@@ -147,55 +319,432 @@ class _SemanticUI(object):
             static_url_path=f"{app.static_url_path}",
             template_folder="templates",
         )
+        blueprint.add_url_rule(
+            f"{app.static_url_path or ''}/semantic/<path:filename>",
+            "asset",
+            send_profile_asset,
+        )
 
         app.register_blueprint(blueprint)
+        app.cli.add_command(semantic_cli)
 
         app.jinja_env.globals["semantic"] = self
         app.jinja_env.globals[
             "semantic_is_hidden_field"
         ] = is_hidden_field_filter
         app.jinja_env.globals["get_table_titles"] = get_table_titles
+        app.jinja_env.globals[
+            "prefetch_action_records"
+        ] = prefetch_action_records
+        app.jinja_env.globals["compile_action_url"] = ActionUrl
+        app.jinja_env.globals["semantic_delete_script"] = delete_script
+        app.jinja_env.globals["render_table"] = render_table
+        app.jinja_env.globals["stream_table"] = stream_table
+        app.jinja_env.globals["page_url_builder"] = page_url_builder
         app.jinja_env.globals["warn"] = warnings.warn
         app.jinja_env.globals["raise"] = raise_helper
         app.jinja_env.add_extension("jinja2.ext.do")
 
-    def load_css(self, s_version=None, semantic_sri=None):
+        # Serve the stylesheets built for the app like the bundled files.
+        stylesheet = None
+        profile = app.config["SEMANTIC_ASSET_PROFILE"]
+        check_profile(profile)
+        check_strategy(app.config["SEMANTIC_JS_STRATEGY"])
+        modules = app.config["SEMANTIC_JS_MODULES"]
+        if modules == "auto" and app.config["SEMANTIC_STATIC_URL"]:
+            # The bundles depend on the rendered pages, flask semantic
+            # collect can't list them ahead of time.
+            raise ValueError(
+                'SEMANTIC_JS_MODULES = "auto" can\'t be used with '
+                "SEMANTIC_STATIC_URL"
+            )
+        if modules and modules != "auto":
+            module_bundle(get_manifest(), resolve_modules(modules))
+        if app.config["SEMANTIC_ICON_MODE"] not in ICON_MODES:
+            raise ValueError(
+                "Unknown SEMANTIC_ICON_MODE "
+                f"{app.config['SEMANTIC_ICON_MODE']!r}"
+            )
+        icons = None
+        if app.config["SEMANTIC_ICON_SUBSET"]:
+            icons = load_icon_subset(app.config["SEMANTIC_ICON_SUBSET"])
+        self._icon_subsets[app] = icons
+        components = app.config["SEMANTIC_COMPONENTS"]
+        if components:
+            stylesheet = _add_stylesheet(
+                profile_path(bundle_path(components), profile),
+                lambda: build_bundle(components, profile=profile)[1],
+                icons,
+            )
+        purged = app.config["SEMANTIC_PURGED_CSS"]
+        if purged and os.path.isfile(purged):
+            with open(purged, "rb") as fp:
+                data = fp.read()
+            stylesheet = _add_stylesheet(
+                purged_path(data), lambda: data, icons
+            )
+        self._stylesheets[app] = stylesheet
+        if app.config["SEMANTIC_FINGERPRINT"]:
+            get_manifest()
+        if app.config["SEMANTIC_SERVE_LOCAL"]:
+            local_stylesheet(get_manifest(), profile, icons)
+            get_sri_manifest(app.config["SEMANTIC_SRI_CACHE"]).build()
+        if app.config["SEMANTIC_EARLY_HINTS"]:
+            app.after_request(self._add_link_header)
+        if app.config["SEMANTIC_ASSET_MIDDLEWARE"]:
+            max_age = app.config["SEND_FILE_MAX_AGE_DEFAULT"]
+            if isinstance(max_age, datetime.timedelta):
+                max_age = int(max_age.total_seconds())
+            app.wsgi_app = AssetMiddleware(
+                app.wsgi_app,
+                f"{app.static_url_path or ''}/semantic",
+                max_age=max_age,
+                exclude=functools.partial(profile_excludes, profile),
+                build=functools.partial(self._build_asset, app),
+            )
+
+        # The CDN tags don't need a request, render the default ones now.
+        tags = self._asset_tags.setdefault(app, {})
+        if not app.config["SEMANTIC_SERVE_LOCAL"]:
+            key = _asset_key(app, stylesheet)
+            if stylesheet is None:
+                tags["css", None, None, None, key] = self._build_css(
+                    None, None, None, None, False
+                )
+            strategy = app.config["SEMANTIC_JS_STRATEGY"]
+            if app.config["SEMANTIC_JS_MODULES"] is None:
+                js_key = ("js", None, None, None, None, strategy, None, key)
+                tags[js_key] = self._build_js(
+                    None, None, None, None, strategy, None, False
+                )
+
+    def render_table(self, data, **kwargs):
+        """Render a table with given data in Python.
+
+        Accept the same arguments as the ``render_ui_table`` macro and
+        return the same markup, without the per-cell cost of the macro.
+        """
+        return render_table(data, **kwargs)
+
+    def stream_table(self, data, **kwargs):
+        """Render a table with given data chunk by chunk.
+
+        Accept the same arguments as :meth:`render_table` plus
+        ``chunk_size``, ``data`` can be any iterable.
+        """
+        return stream_table(data, **kwargs)
+
+    def svg_icon(self, name, color=None):
+        """Render the icon ``name`` from the SVG sprite of the application.
+
+        It's what ``render_ui_icon`` renders with ``SEMANTIC_ICON_MODE``
+        set to ``"svg"``. The icons the sprite lacks, see
+        :meth:`icon_sprite`, are rendered as font icons.
+
+        Parameters
+        ----------
+        name: ``str``
+            The icon classes, e.g. ``"angle double left"``.
+        color: ``str``
+            A Semantic UI color or a CSS one.
+        """
+        sprite = self.icon_sprite(current_app._get_current_object())
+        symbol, _ = resolve_icon(name)
+        url = None
+        if symbol in sprite:
+            url = self._sprite_url(sprite.path)
+        return render_svg_icon(name, color, url)
+
+    def icon_sprite(self, app):
+        """Return the :class:`~flask_semanticui.icons.IconSprite` of ``app``.
+
+        It holds the icons of the templates of the application, see
+        :func:`~flask_semanticui.icons.icon_tokens`, of the macros and of
+        ``SEMANTIC_SVG_ICONS``. It's built on first use, from those
+        only, so every process builds the same sprite.
+        """
+        sprite = self._icon_sprites.get(app)
+        if sprite is None:
+            symbols = used_symbols(icon_tokens(app))
+            for name in app.config["SEMANTIC_SVG_ICONS"]:
+                symbol, _ = resolve_icon(name)
+                if symbol is None:
+                    raise ValueError(f"Unknown icon {name!r}")
+                symbols.add(symbol)
+            sprite = self._icon_sprites.setdefault(app, IconSprite(symbols))
+        return sprite
+
+    def _sprite_url(self, path):
+        """Return the URL of the sprite at the hashed ``path``.
+
+        ``<use>`` only reads sprites of the page origin, the sprite stays
+        served by the application when ``SEMANTIC_STATIC_URL`` is on
+        another one.
+        """
+        static_url = current_app.config["SEMANTIC_STATIC_URL"]
+        if static_url:
+            origin = urlsplit(static_url).netloc
+            host = request.host if has_request_context() else None
+            if origin and origin != host:
+                return url_for("semantic.asset", filename=path)
+        return self._asset_url(path)
+
+    def _build_asset(self, app, filename):
+        """Build the file served at ``filename`` if it's made on demand.
+
+        The icon sprite of ``app`` holds a fixed list of icons, so it's
+        the same whichever process rendered the page linking it. With
+        ``SEMANTIC_JS_MODULES = "auto"``, the name of a module bundle
+        tells its modules.
+
+        Return
+        ------
+            Whether ``filename`` is served.
+        """
+        manifest = get_manifest()
+        sprite_name = posixpath.splitext(SPRITE_PATH)[0]
+        if (
+            app.config["SEMANTIC_ICON_MODE"] == "svg"
+            and filename.startswith(sprite_name)
+        ):
+            self.icon_sprite(app).register(manifest)
+        if app.config["SEMANTIC_JS_MODULES"] == "auto":
+            modules = bundle_modules(filename)
+            if modules:
+                module_bundle(manifest, modules)
+        return filename in manifest.files
+
+    def _cached_tag(self, key, build, *args):
+        """Return the tag cached under ``key``, built with ``build(*args)``.
+
+        The tags are cached per application, their key holds the settings
+        and request attributes they depend on, so changing them picks
+        another entry.
+        """
+        app = current_app._get_current_object()
+        tags = self._asset_tags.setdefault(app, {})
+        key += (_asset_key(app, self._stylesheets.get(app)),)
+        try:
+            return tags[key]
+        except KeyError:
+            serve_local = app.config["SEMANTIC_SERVE_LOCAL"]
+            tag = tags[key] = build(*args, serve_local)
+            return tag
+
+    def load_css(self, s_version=None, semantic_sri=None, mode=None):
         """Load Semantic's css resources with given version.
 
+        The tags are built once and cached, see :meth:`_cached_tag`.
+
         Parameters
         ----------
         s_version: ``str``
             The version of Semantic UI.
         semantic_sri: ``str``
             Subresource Integrity.
+        mode: ``str``
+            ``"critical"`` to inline the rules of the macros rendered above
+            the fold in a ``<style>`` tag and load the stylesheet without
+            blocking the first paint, ``None`` for a ``<link>`` tag.
         Return
         ------
             Semantic-ui CDN File.
         """
+        if mode not in (None, "critical"):
+            raise ValueError(f"Unknown load_css mode {mode!r}")
+        return self._cached_tag(
+            ("css", s_version, semantic_sri, mode),
+            self._build_css,
+            s_version,
+            semantic_sri,
+            mode,
+            self._stylesheets.get(current_app._get_current_object()),
+        )
 
-        serve_local = current_app.config["SEMANTIC_SERVE_LOCAL"]
-        s_version = self.semantic_version if s_version is None else s_version
-        semantic_sri = self._get_sri("semantic_css", s_version, semantic_sri)
-
-        if serve_local:
-            base_path = "css"
-            url = url_for(
-                "semantic.static",
-                filename=f"{base_path}/{self.semantic_css_filename}",
-            )
-        else:
-            base_path = cdn_base + f"/semantic-ui@{s_version}/dist/"
-            url = base_path + self.semantic_css_filename
+    def _build_css(
+        self, s_version, semantic_sri, mode, stylesheet, serve_local
+    ):
+        """Build the tags of :meth:`load_css`.
 
-        if semantic_sri:
+        The ``stylesheet`` built for the application, from
+        ``SEMANTIC_COMPONENTS`` or ``SEMANTIC_PURGED_CSS``, is served
+        locally whatever ``serve_local``. The local files use the bundled
+        Lato fonts, see :mod:`flask_semanticui.fonts`.
+        """
+        url, semantic_sri, _ = self._css_url(
+            s_version, semantic_sri, stylesheet, serve_local
+        )
+        if mode == "critical":
+            critical = critical_css(current_app.config["SEMANTIC_COMPONENTS"])
+            css = preload_css_with_critical(url, semantic_sri, critical)
+        elif stylesheet or semantic_sri:
             css = link_css_with_sri(url, semantic_sri)
         else:
             css = f'<link rel="stylesheet" type="text/css" href="{url}">'
         return Markup(css)
 
-    def _get_js_script(self, version, name, sri):
-        """Get <script> tag for JavaScipt resources."""
-        serve_local = current_app.config["SEMANTIC_SERVE_LOCAL"]
+    def resource_hints(self, s_version=None, jq_version=None):
+        """Return the resource hints of the Semantic UI files.
+
+        Put them at the top of ``<head>``: the browser opens the connection
+        to the CDN and fetches the stylesheet, the scripts and the WOFF2
+        fonts of the icons the templates use before it finds their tags.
+        The hints are built once and cached, see :meth:`_cached_tag`.
+
+        Parameters
+        ----------
+        s_version: ``str``
+            The version of Semantic UI.
+        jq_version: ``str``
+            The version of jQuery.
+        Return
+        ------
+            The ``<link rel="preconnect">`` and ``<link rel="preload">``
+            tags.
+        """
+        return Markup(hint_tags(self._hints(s_version, jq_version)))
+
+    def _hints(self, s_version=None, jq_version=None):
+        """Return the :class:`~flask_semanticui.hints.Hint` of the files."""
+        # The modules of SEMANTIC_JS_MODULES = "auto" are only known once
+        # the page is rendered.
+        modules = current_app.config["SEMANTIC_JS_MODULES"]
+        if modules == "auto":
+            modules = ()
+        elif modules is not None:
+            modules = resolve_modules(modules)
+        return self._cached_tag(
+            ("hints", s_version, jq_version, modules),
+            self._build_hints,
+            s_version,
+            jq_version,
+            modules,
+        )
+
+    def _build_hints(self, s_version, jq_version, modules, serve_local):
+        """Build the hints of :meth:`resource_hints`.
+
+        They match the tags of :meth:`load_css` and :meth:`load_js`, so the
+        preloaded responses are used, and the fonts are read from the
+        stylesheet actually served.
+        """
+        app = current_app._get_current_object()
+        stylesheet = self._stylesheets.get(app)
+        url, sri, path = self._css_url(
+            s_version, None, stylesheet, serve_local
+        )
+        hints = [Hint(url, "preload", "style", None, bool(stylesheet or sri))]
+
+        if path is None:
+            source = STATIC_ROOT / "css" / self.semantic_css_filename
+            css = source.read_bytes()
+        else:
+            manifest = get_manifest()
+            if (
+                app.config["SEMANTIC_FINGERPRINT"]
+                or app.config["SEMANTIC_STATIC_URL"]
+            ):
+                path = manifest.url_path(path)
+            asset = manifest.files[path]
+            css = asset.data or asset.source.read_bytes()
+        css = css.decode("utf-8")
+        families = {"Lato"}
+        if app.config["SEMANTIC_ICON_MODE"] == "font":
+            families.update(used_glyphs(icon_tokens(app)))
+        hints.extend(font_hints(css, url, families))
+
+        # The on-demand scripts are only loaded by the pages needing them.
+        scripts = self._scripts(
+            s_version, jq_version, None, None, modules, serve_local
+        )
+        if app.config["SEMANTIC_JS_STRATEGY"] == "on-demand":
+            scripts = ()
+        for url, sri in scripts:
+            hints.append(Hint(url, "preload", "script", None, bool(sri)))
+        return tuple(preconnect_hints(hints, css) + hints)
+
+    def _add_link_header(self, response):
+        """Add the resource hints to the ``Link`` header of the pages.
+
+        Registered with ``SEMANTIC_EARLY_HINTS``, the servers and CDNs
+        supporting it send them in a 103 Early Hints response while the
+        page is rendered.
+        """
+        if response.status_code == 200 and response.mimetype == "text/html":
+            response.headers.add("Link", link_header(self._hints()))
+        return response
+
+    def _css_url(self, s_version, semantic_sri, stylesheet, serve_local):
+        """Return the URL, ``integrity`` and local path of the stylesheet.
+
+        The path is ``None`` for the CDN stylesheet.
+        """
+        s_version = self.semantic_version if s_version is None else s_version
+        if stylesheet:
+            semantic_sri = semantic_sri or self._local_sri(stylesheet)
+            url = self._local_url(stylesheet)
+            return url, semantic_sri, stylesheet
+        if serve_local:
+            # The bundled stylesheet with the Lato files of the extension
+            # in place of the Google Fonts @import.
+            app = current_app._get_current_object()
+            path = local_stylesheet(
+                get_manifest(),
+                app.config["SEMANTIC_ASSET_PROFILE"],
+                self._icon_subsets.get(app),
+            )
+            semantic_sri = semantic_sri or self._local_sri(path)
+            return self._local_url(path), semantic_sri, path
+        semantic_sri = self._get_sri(
+            "semantic_css", s_version, semantic_sri, serve_local
+        )
+        base_path = cdn_base + f"/semantic-ui@{s_version}/dist/"
+        return base_path + self.semantic_css_filename, semantic_sri, None
+
+    def _local_url(self, filename):
+        """Return the URL of a bundled file, served by ``semantic.asset``.
+
+        With ``SEMANTIC_FINGERPRINT`` or ``SEMANTIC_STATIC_URL`` the URL
+        holds a hash of the file content, see :meth:`_asset_url`.
+        """
+        config = current_app.config
+        if config["SEMANTIC_FINGERPRINT"] or config["SEMANTIC_STATIC_URL"]:
+            return self._asset_url(filename)
+        return url_for("semantic.asset", filename=filename)
+
+    def _asset_url(self, path):
+        """Return the URL of the hashed path of the file ``path``.
+
+        The hashed files are served with a one-year immutable caching, by
+        the application or, under ``SEMANTIC_STATIC_URL``, by the front
+        server the ``flask semantic collect`` command wrote them for.
+        """
+        filename = get_manifest().url_path(path)
+        static_url = current_app.config["SEMANTIC_STATIC_URL"]
+        if static_url:
+            return f"{static_url.rstrip('/')}/{filename}"
+        return url_for("semantic.asset", filename=filename)
+
+    def _local_sri(self, path):
+        """Return the ``integrity`` of the file served for ``path``.
+
+        Files built at runtime, like the stylesheets with rewritten
+        references, are hashed from their content, the others come from
+        :class:`~flask_semanticui.sri.SriManifest`.
+        """
+        config = current_app.config
+        manifest = get_manifest()
+        served = path
+        if config["SEMANTIC_FINGERPRINT"] or config["SEMANTIC_STATIC_URL"]:
+            served = manifest.url_path(path)
+        asset = manifest.files.get(served)
+        if asset is not None and asset.data is not None:
+            return integrity(asset.data)
+        manifest = get_sri_manifest(config.get("SEMANTIC_SRI_CACHE"))
+        return manifest.local(path)
+
+    def _js_url(self, version, name, serve_local):
+        """Return the URL of a JavaScript resource."""
         paths = {
             "semantic-ui": f"{self.semantic_js_filename}",
             "jquery": f"{self.jquery_filename}",
@@ -203,36 +752,54 @@ class _SemanticUI(object):
 
         if serve_local:
             path = "js/semantic"
-            url = url_for("semantic.static", filename=f"{path}/{paths[name]}")
-        else:
-            url = cdn_base + f"/{name}@{version}/dist/{paths[name]}"
+            return self._local_url(f"{path}/{paths[name]}")
+        return cdn_base + f"/{name}@{version}/dist/{paths[name]}"
 
-        if sri:
-            script_html = scripts_with_sri(url, sri)
-        else:
-            script_html = simple_scripts_js(url)
-        return script_html
+    def _get_sri(self, name, version, sri, serve_local=None):
+        """Return the ``integrity`` of a file, ``None`` if unknown.
+
+        An explicit ``sri`` wins. Local files are hashed once, see
+        :class:`~flask_semanticui.sri.SriManifest`, and the CDN files are
+        looked up in ``SEMANTIC_SRI_REGISTRY`` and the bundled registry.
+        """
+        if sri is not None:
+            return sri
+        if serve_local is None:
+            serve_local = current_app.config["SEMANTIC_SERVE_LOCAL"]
 
-    def _get_sri(self, name, version, sri):
-        serve_local = current_app.config["SEMANTIC_SERVE_LOCAL"]
+        if serve_local:
+            path = {
+                "semantic_css": f"css/{self.semantic_css_filename}",
+                "semantic_js": f"js/semantic/{self.semantic_js_filename}",
+                "jquery": f"js/semantic/{self.jquery_filename}",
+            }[name]
+            return self._local_sri(path)
 
         sris = {
             "semantic_css": self.semantic_css_integrity,
             "semantic_js": self.semantic_js_integrity,
             "jquery": self.jquery_integrity,
         }
-
+        files = {
+            "semantic_css": ("semantic-ui", self.semantic_css_filename),
+            "semantic_js": ("semantic-ui", self.semantic_js_filename),
+            "jquery": ("jquery", self.jquery_filename),
+        }
         versions = {
             "semantic_css": self.semantic_version,
             "semantic_js": self.semantic_version,
             "jquery": self.jquery_version,
         }
 
-        if sri is not None:
-            return sri
-        if version == versions[name] and serve_local is False:
+        if version == versions[name]:
             return sris[name]
-        return None
+        package, filename = files[name]
+        return cdn_integrity(
+            package,
+            version,
+            filename,
+            current_app.config.get("SEMANTIC_SRI_REGISTRY"),
+        )
 
     def load_js(
         self,
@@ -240,9 +807,24 @@ class _SemanticUI(object):
         jq_version=None,  # noqa: C901
         semantic_sri=None,
         jquery_sri=None,
+        strategy=None,
     ):
         """Load Seomantic UI and other resources with given version.
 
+        By default the ``<script>`` tags block the parser. The
+        ``strategy`` loads them without blocking it:
+
+        - ``"defer"``: the tags get ``defer``, the scripts run in order
+          once the document is parsed.
+        - ``"async-ordered"``: an inline loader inserts them right away,
+          they run in order as soon as they're downloaded.
+        - ``"on-demand"``: the loader only inserts them when the page has
+          elements of Semantic UI modules, like dropdowns, checkboxes or
+          modals, see :data:`~flask_semanticui.scripts.ON_DEMAND_SELECTOR`.
+
+        The loader dispatches ``semantic:load`` on ``document`` once the
+        scripts ran.
+
         Parameter
         ---------
         version: ``str``
@@ -253,16 +835,129 @@ class _SemanticUI(object):
             Subresource Integrity for Semantic UI..
         jquery_sri: ``str``
             Subresource Integrity for jQuery.
+        strategy: ``str``
+            ``"defer"``, ``"async-ordered"`` or ``"on-demand"``, by default
+            ``SEMANTIC_JS_STRATEGY``.
         Return
         ------
             Semantic-ui CDN File.
         """
+        check_strategy(strategy)
+        if strategy is None:
+            strategy = current_app.config["SEMANTIC_JS_STRATEGY"]
+        modules = self._js_modules()
+        return self._cached_tag(
+            (
+                "js",
+                version,
+                jq_version,
+                semantic_sri,
+                jquery_sri,
+                strategy,
+                modules,
+            ),
+            self._build_js,
+            version,
+            jq_version,
+            semantic_sri,
+            jquery_sri,
+            strategy,
+            modules,
+        )
+
+    def require_js(self, *modules):
+        """Record Semantic UI modules the page being rendered needs.
 
+        With ``SEMANTIC_JS_MODULES = "auto"``, :meth:`load_js` loads a
+        bundle of the modules recorded during the request, the macros
+        record theirs, e.g. ``checkbox`` for checkboxes and radio buttons.
+        Call it from the templates using other modules, before
+        :meth:`load_js`:
+
+        .. code-block:: jinja
+
+            {% do semantic.require_js("dropdown", "modal") %}
+
+        Parameters
+        ----------
+        modules: ``str``
+            Names of :data:`~flask_semanticui.scripts.MODULES` or
+            :data:`~flask_semanticui.scripts.BEHAVIOURS`.
+        Return
+        ------
+            An empty string, so ``{{ }}`` works too.
+        """
+        resolve_modules(modules)
+        g.setdefault("_semantic_js_modules", set()).update(modules)
+        return ""
+
+    def _js_modules(self):
+        """Return the modules :meth:`load_js` bundles, ``None`` for all."""
+        setting = current_app.config["SEMANTIC_JS_MODULES"]
+        if setting == "auto":
+            return resolve_modules(g.get("_semantic_js_modules", ()))
+        if setting:
+            return resolve_modules(setting)
+        return None
+
+    def _build_js(
+        self,
+        version,
+        jq_version,
+        semantic_sri,
+        jquery_sri,
+        strategy,
+        modules,
+        serve_local,
+    ):
+        """Build the ``<script>`` tags of :meth:`load_js`."""
+        scripts = self._scripts(
+            version, jq_version, semantic_sri, jquery_sri, modules, serve_local
+        )
+        if strategy in ("async-ordered", "on-demand"):
+            selector = None
+            if strategy == "on-demand":
+                selector = ON_DEMAND_SELECTOR
+            return Markup(loader_script(scripts, selector))
+        defer = strategy == "defer"
+        tags = [
+            scripts_with_sri(url, sri, defer)
+            if sri
+            else simple_scripts_js(url, defer)
+            for url, sri in scripts
+        ]
+        return Markup("\n                          ".join(tags))
+
+    def _scripts(
+        self,
+        version,
+        jq_version,
+        semantic_sri,
+        jquery_sri,
+        modules,
+        serve_local,
+    ):
+        """Return the ``(url, integrity)`` of the scripts to load, in order.
+
+        jQuery comes first, then ``semantic.min.js``, or the bundle of the
+        ``modules`` when not ``None``, served locally whatever
+        ``serve_local``. No module at all leaves jQuery alone.
+        """
         version = self.semantic_version if version is None else version
         jq_version = self.jquery_version if jq_version is None else jq_version
-        sui_sri = self._get_sri("semantic_js", version, semantic_sri)
-        sui_js = self._get_js_script(version, "semantic-ui", sui_sri)
-        jquery_sri = self._get_sri("jquery", jq_version, jquery_sri)
-        jquery = self._get_js_script(jq_version, "jquery", jquery_sri)
-        return Markup(f"""{jquery}
-                          {sui_js}""")
+        jquery_sri = self._get_sri(
+            "jquery", jq_version, jquery_sri, serve_local
+        )
+        url = self._js_url(jq_version, "jquery", serve_local)
+        scripts = [(url, jquery_sri)]
+        if modules is None:
+            sui_sri = self._get_sri(
+                "semantic_js", version, semantic_sri, serve_local
+            )
+            url = self._js_url(version, "semantic-ui", serve_local)
+            scripts.append((url, sui_sri))
+        elif modules:
+            path = module_bundle(get_manifest(), modules)
+            url = self._asset_url(path)
+            scripts.append((url, semantic_sri or self._local_sri(path)))
+        return scripts
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+The web fonts of the stylesheets: the self-hosted Lato and the formats of
+the icon fonts.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import posixpath
+import re
+
+from .assets import STATIC_ROOT
+
+#: The folder of the font files, relative to the static root.
+FONTS_FOLDER = "css/themes/default/assets/fonts"
+
+#: The stylesheet served locally, ``semantic.min.css`` with local fonts.
+LOCAL_STYLESHEET = "css/semantic.local.min.css"
+
+#: The Lato faces of ``semantic.min.css``: style, weight, local names and
+#: file. The files hold the Latin subset of Lato 1.104, the version Google
+#: Fonts serves.
+LATO_FACES = (
+    ("normal", 400, ("Lato Regular", "Lato-Regular"), "lato-regular.woff2"),
+    ("normal", 700, ("Lato Bold", "Lato-Bold"), "lato-bold.woff2"),
+    ("italic", 400, ("Lato Italic", "Lato-Italic"), "lato-italic.woff2"),
+    (
+        "italic",
+        700,
+        ("Lato Bold Italic", "Lato-BoldItalic"),
+        "lato-bold-italic.woff2",
+    ),
+)
+
+#: The characters of the font files, the ``latin`` subset of Google Fonts.
+LATIN_RANGE = (
+    "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,"
+    "U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,"
+    "U+FFFD"
+)
+
+#: The ``SEMANTIC_ASSET_PROFILE`` values besides ``None``, the default
+#: profile serving every font format.
+PROFILES = ("modern",)
+
+#: The font formats the ``modern`` profile keeps, supported by every
+#: browser since 2015.
+MODERN_FORMATS = ("woff2", "woff")
+
+#: The font files only older browsers use, left out by the ``modern``
+#: profile.
+LEGACY_SUFFIXES = (".eot", ".otf", ".svg", ".ttf")
+
+_FONT_FACE = re.compile(r"@font-face\{([^{}]*)\}")
+
+_SRC = re.compile(r"\s*src\s*:(.*)", re.S)
+
+_FORMAT = re.compile(r"""format\(\s*['"]?([\w-]+)['"]?\s*\)""")
+
+_GOOGLE_FONTS_IMPORT = re.compile(
+    r"@import\s+url\(\s*['\"]?https?://fonts\.googleapis\.com/css\?"
+    r"family=Lato[^)]*\)\s*;"
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def font_face_css(path):
+    """Return the ``@font-face`` rules of Lato for a stylesheet at ``path``.
+
+    The fonts come from the system when installed, from the bundled files
+    otherwise, with ``font-display: swap``.
+    """
+    folder = posixpath.relpath(FONTS_FOLDER, posixpath.dirname(path) or ".")
+    rules = []
+    for style, weight, names, filename in LATO_FACES:
+        local = ",".join(f"local('{name}')" for name in names)
+        rules.append(
+            f"@font-face{{font-family:Lato;font-style:{style};"
+            f"font-weight:{weight};font-display:swap;src:{local},"
+            f"url({folder}/{filename}) format('woff2');"
+            f"unicode-range:{LATIN_RANGE}}}"
+        )
+    return "".join(rules)
+
+
+def use_local_fonts(css, path):
+    """Replace the Google Fonts ``@import`` of ``css`` with local fonts.
+
+    Parameters
+    ----------
+    css: ``str``
+        The stylesheet.
+    path: ``str``
+        The served path of the stylesheet, relative to the static root.
+
+    Return
+    ------
+        The stylesheet with the ``@font-face`` rules of the bundled Lato
+        files in place of the ``@import``.
+    """
+    return _GOOGLE_FONTS_IMPORT.sub(
+        lambda match: font_face_css(path), css, count=1
+    )
+
+
+def check_profile(profile):
+    """Raise ``ValueError`` if ``profile`` isn't an asset profile."""
+    if profile is not None and profile not in PROFILES:
+        raise ValueError(f"Unknown Semantic UI asset profile {profile!r}")
+
+
+def profile_path(path, profile):
+    """Return the path of the stylesheet ``path`` built for ``profile``.
+
+    ``css/semantic.local.min.css`` becomes
+    ``css/semantic.local.modern.min.css``.
+    """
+    if profile is None:
+        return path
+    head, _, _ = path.rpartition(".min.css")
+    return f"{head}.{profile}.min.css"
+
+
+def is_legacy_font(path):
+    """Tell whether ``path`` is a font file only older browsers use."""
+    return path.startswith(FONTS_FOLDER + "/") and path.endswith(
+        LEGACY_SUFFIXES
+    )
+
+
+def profile_excludes(profile, path):
+    """Tell whether the asset ``profile`` leaves the file ``path`` out."""
+    return profile == "modern" and is_legacy_font(path)
+
+
+def modern_font_faces(css):
+    """Keep the WOFF2 and WOFF sources of the ``@font-face`` rules.
+
+    The rules of the icon fonts list EOT, WOFF2, WOFF, TrueType and SVG
+    sources, they get the :data:`MODERN_FORMATS` only and
+    ``font-display: block``, so the icons don't show as letters while
+    loading. The rules without legacy sources, like the inline fonts of
+    the modules, are kept as they are.
+    """
+
+    def replace(match):
+        body = match.group(1)
+        if "url(data:" in body:
+            return match.group(0)
+        declarations = [decl for decl in body.split(";") if decl.strip()]
+        srcs = [
+            index
+            for index, decl in enumerate(declarations)
+            if _SRC.match(decl)
+        ]
+        sources = [
+            source.strip()
+            for index in srcs
+            for source in _SRC.match(declarations[index]).group(1).split(",")
+        ]
+        kept = [
+            source
+            for source in sources
+            if source.startswith("local(")
+            or (_FORMAT.search(source) or [None, None])[1] in MODERN_FORMATS
+        ]
+        if not kept or len(kept) == len(sources):
+            return match.group(0)
+        declarations[srcs[0]] = "src:" + ",".join(kept)
+        declarations = [
+            decl
+            for index, decl in enumerate(declarations)
+            if index not in srcs[1:]
+        ]
+        if "font-display" not in body:
+            declarations.append("font-display:block")
+        return f"@font-face{{{';'.join(declarations)}}}"
+
+    return _FONT_FACE.sub(replace, css)
+
+
+def apply_profile(css, profile):
+    """Return the stylesheet ``css`` for the asset ``profile``."""
+    check_profile(profile)
+    if profile == "modern":
+        css = modern_font_faces(css)
+    return css
+
+
+def local_stylesheet(
+    manifest, profile=None, icons=None, source="css/semantic.min.css"
+):
+    """Serve :data:`LOCAL_STYLESHEET` from ``manifest`` and return its path.
+
+    It's built once per ``profile`` and
+    :class:`~flask_semanticui.icons.IconSubset`, from the bundled
+    ``source``.
+    """
+    path = profile_path(LOCAL_STYLESHEET, profile)
+    if icons is not None:
+        path = icons.stylesheet_path(path)
+    if path not in manifest.files:
+        css = (STATIC_ROOT / source).read_text(encoding="utf-8")
+        css = apply_profile(use_local_fonts(css, path), profile)
+        if icons is not None:
+            icons.register(manifest)
+            css = icons.apply(css, path)
+        manifest.add(path, css.encode("utf-8"))
+    return path
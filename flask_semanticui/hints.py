@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+Resource hints: ``<link rel="preconnect">`` and ``<link rel="preload">``
+tags, and the ``Link`` header carrying them, e.g. for 103 Early Hints.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import collections
+import re
+from urllib.parse import urljoin, urlsplit
+
+from markupsafe import escape
+
+#: A resource hint: the URL, the ``rel``, the ``as`` destination, the MIME
+#: type and whether the resource is fetched with CORS.
+Hint = collections.namedtuple(
+    "Hint", ["url", "rel", "destination", "type", "crossorigin"]
+)
+
+#: The origins of the Google Fonts stylesheet and of its font files.
+GOOGLE_FONTS_ORIGINS = (
+    ("https://fonts.googleapis.com", False),
+    ("https://fonts.gstatic.com", True),
+)
+
+_FONT_FACE = re.compile(r"@font-face\{([^{}]*)\}")
+
+_FAMILY = re.compile(r"""font-family:\s*['"]?([^;'"]+)""")
+
+_WOFF2 = re.compile(
+    r"""url\(\s*['"]?([^)'"]+)['"]?\s*\)\s*format\(\s*['"]?woff2['"]?\s*\)"""
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def font_hints(css, base, families):
+    """Return the preload hints of the WOFF2 fonts of a stylesheet.
+
+    The italic faces are left out, they seldom show before the page is
+    loaded.
+
+    Parameters
+    ----------
+    css: ``str``
+        The stylesheet.
+    base: ``str``
+        The URL of the stylesheet, its ``url()`` references are relative
+        to it.
+    families: ``set``
+        The font families to preload.
+
+    Return
+    ------
+        The :class:`Hint` of each font file, in stylesheet order.
+    """
+    hints = []
+    for match in _FONT_FACE.finditer(css):
+        body = match.group(1)
+        family = _FAMILY.search(body)
+        if family is None or family[1].strip() not in families:
+            continue
+        if "font-style:italic" in body.replace(" ", ""):
+            continue
+        for ref in _WOFF2.findall(body):
+            url = urljoin(base, ref)
+            hint = Hint(url, "preload", "font", "font/woff2", True)
+            if hint not in hints:
+                hints.append(hint)
+    return hints
+
+
+def preconnect_hints(hints, css=""):
+    """Return the preconnect hints of the other origins of ``hints``.
+
+    An origin gets a hint per kind of connection its resources use, with
+    and without CORS. The Google Fonts origins are added when ``css``
+    imports Lato from there.
+    """
+    origins = []
+    for hint in hints:
+        parts = urlsplit(hint.url)
+        if parts.netloc:
+            origin = (f"{parts.scheme}://{parts.netloc}", hint.crossorigin)
+            if origin not in origins:
+                origins.append(origin)
+    if "//fonts.googleapis.com/" in css:
+        origins.extend(GOOGLE_FONTS_ORIGINS)
+    return [
+        Hint(origin, "preconnect", None, None, crossorigin)
+        for origin, crossorigin in origins
+    ]
+
+
+def hint_tags(hints):
+    """Return the ``<link>`` tags of ``hints``, one per line."""
+    tags = []
+    for hint in hints:
+        attrs = f'rel="{hint.rel}" href="{escape(hint.url)}"'
+        if hint.destination:
+            attrs += f' as="{hint.destination}"'
+        if hint.type:
+            attrs += f' type="{hint.type}"'
+        if hint.crossorigin:
+            attrs += ' crossorigin="anonymous"'
+        tags.append(f"<link {attrs}>")
+    return "\n".join(tags)
+
+
+def link_header(hints):
+    """Return the value of the ``Link`` header carrying ``hints``."""
+    links = []
+    for hint in hints:
+        link = f"<{hint.url}>; rel={hint.rel}"
+        if hint.destination:
+            link += f"; as={hint.destination}"
+        if hint.type:
+            link += f'; type="{hint.type}"'
+        if hint.crossorigin:
+            link += "; crossorigin"
+        links.append(link)
+    return ", ".join(links)
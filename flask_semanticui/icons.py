@@ -0,0 +1,556 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+Icon fonts holding only the glyphs the application uses.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import functools
+import hashlib
+import io
+import pathlib
+import posixpath
+import re
+from xml.etree import ElementTree
+
+from markupsafe import Markup, escape
+
+from .assets import (
+    STATIC_ROOT,
+    brotli,
+    get_manifest,
+    hashed_name,
+    rewrite_css_urls,
+)
+from .components import COMPONENTS_FOLDER
+from .fonts import FONTS_FOLDER, profile_path
+from .purge import collect_tokens, selector_is_used, template_tokens
+from .tables import semantic_colors
+
+try:  # pragma: no cover
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError:  # pragma: no cover
+    subset = TTFont = None
+
+#: The icon font families and the bundled font files they're made from.
+ICON_FONTS = {
+    "Icons": "icons.ttf",
+    "outline-icons": "outline-icons.ttf",
+    "brand-icons": "brand-icons.ttf",
+}
+
+#: The SVG fonts of the icon font families, the glyphs of the sprites.
+SVG_FONTS = {
+    "Icons": "icons.svg",
+    "outline-icons": "outline-icons.svg",
+    "brand-icons": "brand-icons.svg",
+}
+
+#: The plain path of the icon sprites, relative to the static root.
+SPRITE_PATH = "css/themes/default/assets/images/icons.sprite.svg"
+
+#: The icons the macros and :func:`~flask_semanticui.tables.render_table`
+#: render unless told otherwise.
+MACRO_ICONS = (
+    "close",
+    "eye",
+    "left chevron",
+    "pencil",
+    "plus",
+    "right chevron",
+    "trash",
+)
+
+#: The values of ``SEMANTIC_ICON_MODE``.
+ICON_MODES = ("font", "svg")
+
+#: The file of the ``@font-face`` rules of an icon subset, in its folder.
+FRAGMENT_NAME = "icons.css"
+
+#: The stylesheet of the icons, relative to the static root.
+ICONS_STYLESHEET = f"{COMPONENTS_FOLDER}/icon.min.css"
+
+# The fragment is written as if it were in the folder of the stylesheets.
+_FRAGMENT_PATH = f"css/{FRAGMENT_NAME}"
+
+_GLYPH = re.compile(r"([^{}]+)\{content:\"\\([0-9a-fA-F]+)\"\}")
+
+_FAMILY = re.compile(r"([^{}]+)\{font-family:([\w-]+)\}")
+
+_FONT_FACE = re.compile(r"@font-face\{[^{}]*font-family:([\w-]+)[^{}]*\}")
+
+_ESCAPED_DIGIT = re.compile(r"\\3(\d) ")
+
+_FONT_URL = re.compile(r"url\(([^)]+)\)")
+
+_SVG = "{http://www.w3.org/2000/svg}"
+
+_COMMENT = re.compile(r"<!--(.*?)-->", re.S)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def _names(selector):
+    """Return the classes of a simple ``i.icon`` selector, in order."""
+    return [
+        _ESCAPED_DIGIT.sub(r"\1", name)
+        for name in selector.split(":")[0].split(".")[1:]
+    ]
+
+
+def icon_glyphs(css=None):
+    """Return the glyphs of the icon stylesheet.
+
+    Parameters
+    ----------
+    css: ``str``
+        The stylesheet, the bundled ``icon`` component by default.
+
+    Return
+    ------
+        A list of ``(selector, family, codepoint)`` tuples, one per
+        ``i.icon`` selector, ``selector`` without the ``:before``.
+    """
+    if css is None:
+        css = (STATIC_ROOT / ICONS_STYLESHEET).read_text(encoding="utf-8")
+    families = [
+        (frozenset(_names(selector)), family)
+        for selectors, family in _FAMILY.findall(css)
+        if family in ICON_FONTS
+        for selector in selectors.split(",")
+    ]
+    glyphs = []
+    for selectors, codepoint in _GLYPH.findall(css):
+        for selector in selectors.split(","):
+            selector = selector.strip()
+            if not selector.startswith("i.icon.") or ":" not in selector:
+                continue
+            classes = frozenset(_names(selector))
+            family = "Icons"
+            for required, name in families:
+                if required <= classes:
+                    family = name
+            glyphs.append(
+                (selector.split(":")[0], family, int(codepoint, 16))
+            )
+    return glyphs
+
+
+def icon_tokens(app):
+    """Return the tokens naming the icons ``app`` renders.
+
+    They're the words of the templates of the application and of its
+    blueprints, and the :data:`MACRO_ICONS`. The other words of the
+    macros, like ``js`` or ``radio``, aren't icons.
+    """
+    macros = collect_tokens(" ".join(MACRO_ICONS + ("icon",)))
+    return template_tokens(app, macros=False) | macros
+
+
+def used_glyphs(tokens, css=None):
+    """Return the glyphs of the icons whose classes are all in ``tokens``.
+
+    Parameters
+    ----------
+    tokens: ``set``
+        The words of the templates, see
+        :func:`~flask_semanticui.purge.collect_tokens`.
+    css: ``str``
+        See :func:`icon_glyphs`.
+
+    Return
+    ------
+        A ``dict`` mapping the font families to the ``dict`` of their used
+        code points and icon names, e.g. ``{"Icons": {0xf067: {"plus"}}}``.
+    """
+    used = {}
+    for selector, family, codepoint in icon_glyphs(css):
+        if selector_is_used(selector, tokens):
+            name = " ".join(_names(selector)[1:])
+            used.setdefault(family, {}).setdefault(codepoint, set()).add(name)
+    return used
+
+
+@functools.lru_cache(maxsize=None)
+def _icon_index():
+    """Return the glyphs of the bundled icons, the most specific first.
+
+    Return
+    ------
+        A list of ``(symbol, classes, family, codepoint)`` tuples, the
+        symbol ids join the classes of the selectors, e.g.
+        ``angle-double-left``.
+    """
+    index = []
+    for selector, family, codepoint in icon_glyphs():
+        names = _names(selector)[1:]
+        index.append(("-".join(names), frozenset(names), family, codepoint))
+    index.sort(key=lambda glyph: -len(glyph[1]))
+    return index
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_icon(name):
+    """Return the symbol of the icon ``name`` and its other classes.
+
+    The symbol is the one of the most specific icon whose classes are all
+    in ``name``, the other words are modifiers, e.g. ``"large red plus"``
+    gives ``("plus", ("large", "red"))``. The symbol is ``None`` when no
+    icon matches.
+    """
+    words = tuple((name or "").split())
+    for symbol, classes, _, _ in _icon_index():
+        if classes.issubset(words):
+            return symbol, tuple(w for w in words if w not in classes)
+    return None, words
+
+
+def used_symbols(tokens):
+    """Return the symbols of the icons whose classes are all in ``tokens``."""
+    return {
+        symbol
+        for symbol, classes, _, _ in _icon_index()
+        if classes <= tokens
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _svg_font(family, root=STATIC_ROOT):
+    """Read the SVG font of ``family``.
+
+    Return
+    ------
+        A ``(header, units_per_em, ascent, glyphs)`` tuple, ``header`` is
+        the license comment of the file and ``glyphs`` maps the code
+        points to their advance and path.
+    """
+    text = (root / FONTS_FOLDER / SVG_FONTS[family]).read_text("utf-8")
+    comment = _COMMENT.search(text)
+    header = comment.group(1).strip() if comment else ""
+    font = ElementTree.fromstring(text.encode("utf-8")).find(
+        f"{_SVG}defs/{_SVG}font"
+    )
+    face = font.find(f"{_SVG}font-face")
+    default = font.get("horiz-adv-x")
+    glyphs = {}
+    for glyph in font.iter(f"{_SVG}glyph"):
+        char = glyph.get("unicode") or ""
+        if len(char) == 1 and glyph.get("d"):
+            advance = glyph.get("horiz-adv-x", default)
+            glyphs[ord(char)] = (advance, glyph.get("d").strip())
+    return header, face.get("units-per-em"), face.get("ascent"), glyphs
+
+
+def _sprite_glyphs(symbols, root=STATIC_ROOT):
+    """Return the ``(symbol, family, codepoint)`` of the known ``symbols``.
+
+    They're sorted, the symbols without a glyph in the SVG fonts are left
+    out.
+    """
+    glyphs = {symbol: (family, cp) for symbol, _, family, cp in _icon_index()}
+    found = []
+    for symbol in sorted(set(symbols)):
+        if symbol in glyphs:
+            family, codepoint = glyphs[symbol]
+            if codepoint in _svg_font(family, root)[3]:
+                found.append((symbol, family, codepoint))
+    return found
+
+
+def build_sprite(symbols, root=STATIC_ROOT):
+    """Return an SVG sprite holding the icons ``symbols``.
+
+    Parameters
+    ----------
+    symbols: ``iterable``
+        Symbol ids, see :func:`resolve_icon`. The unknown ones are skipped.
+    root: ``pathlib.Path``
+        The static folder holding the SVG fonts.
+
+    Return
+    ------
+        The ``bytes`` of the sprite, one ``<symbol>`` per icon covering
+        the em box of the font, to be used like a glyph.
+    """
+    headers, parts = [], []
+    for symbol, family, codepoint in _sprite_glyphs(symbols, root):
+        header, em, ascent, paths = _svg_font(family, root)
+        if header not in headers:
+            headers.append(header)
+        advance, path = paths[codepoint]
+        parts.append(
+            f'<symbol id="{symbol}" viewBox="0 -{ascent} {advance} {em}">'
+            f'<path transform="scale(1,-1)" d="{path}"/></symbol>'
+        )
+    comments = "".join(f"<!--\n{header}\n-->\n" for header in headers)
+    return (
+        f"{comments}"
+        '<svg xmlns="http://www.w3.org/2000/svg">'
+        f"{''.join(parts)}</svg>\n"
+    ).encode("utf-8")
+
+
+def render_svg_icon(name, color, sprite_url):
+    """Render the icon ``name`` as a ``<use>`` of its sprite symbol.
+
+    Like the ``render_ui_icon`` macro, the ``<i>`` element carries the
+    Semantic UI color and size classes, or the ``color`` style, but not
+    the glyph classes, so no icon font is loaded. Icons without a symbol,
+    or without a ``sprite_url``, are rendered as font icons.
+    """
+    symbol, classes = resolve_icon(name)
+    if sprite_url is None:
+        symbol = None
+    if symbol is None:
+        classes = [name]
+    classes = list(classes)
+    style = ""
+    if color in semantic_colors:
+        classes.append(color)
+    elif color:
+        style = f' style="color: {escape(color)}"'
+    classes.append("icon")
+    html = f'<i class="{escape(" ".join(classes))}"{style}>'
+    if symbol is not None:
+        html += (
+            '<svg width="1em" height="1em" fill="currentColor" '
+            'style="vertical-align:-.125em" aria-hidden="true">'
+            f'<use href="{escape(sprite_url)}#{symbol}"/></svg>'
+        )
+    return Markup(html + "</i>")
+
+
+def subset_font(source, codepoints, flavor=None):
+    """Return the font ``source`` with the glyphs of ``codepoints`` only.
+
+    Parameters
+    ----------
+    source: ``pathlib.Path``
+        The font file.
+    codepoints: ``iterable``
+        The code points to keep.
+    flavor: ``str``
+        ``"woff2"``, ``"woff"`` or ``None`` for the format of ``source``.
+
+    Return
+    ------
+        The ``bytes`` of the subset font.
+    """
+    if subset is None:
+        raise RuntimeError(
+            "fontTools is not installed, "
+            "pip install Flask-SemanticUI[icons]"
+        )
+    options = subset.Options()
+    options.flavor = flavor
+    options.notdef_outline = True
+    options.name_IDs = ["*"]
+    font = TTFont(str(source))
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=sorted(codepoints))
+    subsetter.subset(font)
+    stream = io.BytesIO()
+    subset.save_font(font, stream, options)
+    return stream.getvalue()
+
+
+def build_icon_subset(tokens, root=STATIC_ROOT, flavor=None):
+    """Subset the icon fonts to the icons whose classes are in ``tokens``.
+
+    Parameters
+    ----------
+    tokens: ``set``
+        See :func:`used_glyphs`.
+    root: ``pathlib.Path``
+        The static folder holding the icon fonts.
+    flavor: ``str``
+        The format of the fonts, ``"woff2"`` when Brotli is installed,
+        ``"woff"`` otherwise.
+
+    Return
+    ------
+        An :class:`IconSubset`, without the families no icon uses.
+    """
+    if flavor is None:
+        flavor = "woff2" if brotli is not None else "woff"
+    css = (root / ICONS_STYLESHEET).read_text(encoding="utf-8")
+    used = used_glyphs(tokens, css)
+    fonts, rules = {}, []
+    for family, filename in ICON_FONTS.items():
+        glyphs = used.get(family)
+        if not glyphs:
+            continue
+        data = subset_font(root / FONTS_FOLDER / filename, glyphs, flavor)
+        digest = hashlib.sha256(data).hexdigest()
+        name = f"{filename.rpartition('.')[0]}.subset-{digest[:8]}.{flavor}"
+        fonts[name] = data
+        icons = ", ".join(sorted(set().union(*glyphs.values())))
+        rules.append(
+            f"/* {family}: {icons} */\n"
+            f"@font-face{{font-family:{family};"
+            f"src:url({posixpath.relpath(FONTS_FOLDER, 'css')}/{name}) "
+            f"format('{flavor}');font-style:normal;font-weight:400;"
+            "font-display:block}\n"
+        )
+    return IconSubset("".join(rules), fonts)
+
+
+def load_icon_subset(folder):
+    """Return the :class:`IconSubset` saved in ``folder``, or ``None``."""
+    folder = pathlib.Path(folder)
+    try:
+        css = (folder / FRAGMENT_NAME).read_text(encoding="utf-8")
+        fonts = {}
+        for url in _FONT_URL.findall(css):
+            name = posixpath.basename(url)
+            fonts[name] = (folder / name).read_bytes()
+    except OSError:
+        return None
+    return IconSubset(css, fonts)
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class IconSubset(object):
+    """The subset icon fonts and the ``@font-face`` rules using them.
+
+    Parameters
+    ----------
+    css: ``str``
+        The ``@font-face`` rules, with references relative to the folder
+        of the stylesheets.
+    fonts: ``dict``
+        The font file names and their content.
+    """
+
+    def __init__(self, css, fonts):
+        self.css = css
+        self.fonts = fonts
+        self.digest = hashlib.sha256(css.encode("utf-8")).hexdigest()
+
+    @property
+    def families(self):
+        """The icon font families of the subset."""
+        return [
+            family
+            for family in _FONT_FACE.findall(self.css)
+            if family in ICON_FONTS
+        ]
+
+    def save(self, folder):
+        """Write the fonts and :data:`FRAGMENT_NAME` into ``folder``.
+
+        Return
+        ------
+            The list of written files.
+        """
+        folder = pathlib.Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        for stale in folder.glob("*.subset-*"):
+            if stale.name not in self.fonts:
+                stale.unlink()
+        written = []
+        for name, data in self.fonts.items():
+            (folder / name).write_bytes(data)
+            written.append(folder / name)
+        (folder / FRAGMENT_NAME).write_text(self.css, encoding="utf-8")
+        written.append(folder / FRAGMENT_NAME)
+        return written
+
+    def stylesheet_path(self, path):
+        """Return the path of the stylesheet ``path`` using the subset."""
+        return profile_path(path, f"icons-{self.digest[:8]}")
+
+    def register(self, manifest):
+        """Serve the fonts from ``manifest``, next to the bundled ones."""
+        for name, data in self.fonts.items():
+            path = f"{FONTS_FOLDER}/{name}"
+            if path not in manifest.files:
+                manifest.add(path, data)
+
+    def apply(self, css, path):
+        """Use the subset fonts in the stylesheet ``css`` served at ``path``.
+
+        The ``@font-face`` rules of the subset families are replaced, the
+        families no template uses are kept as they are, and so are the
+        stylesheets without icons.
+        """
+        families = set(self.families)
+        fragment = rewrite_css_urls(self.css, _FRAGMENT_PATH, str, path)
+        inserted = False
+
+        def replace(match):
+            nonlocal inserted
+            if match.group(1) not in families:
+                return match.group(0)
+            if inserted:
+                return ""
+            inserted = True
+            return fragment
+
+        return _FONT_FACE.sub(replace, css)
+
+
+class IconSprite(object):
+    """The sprite of a fixed list of icons.
+
+    It's built once, from ``symbols`` known in advance such as the icons
+    of the templates, so every process builds the same file under the
+    same hashed path of :data:`SPRITE_PATH`, served from the
+    :class:`~flask_semanticui.assets.AssetManifest`. The icons it lacks
+    are rendered as font icons, the sprite never changes.
+
+    Parameters
+    ----------
+    symbols: ``iterable``
+        The symbols of the sprite, see :func:`resolve_icon`.
+    root: ``pathlib.Path``
+        The static folder.
+    """
+
+    def __init__(self, symbols=(), root=STATIC_ROOT):
+        self.root = pathlib.Path(root)
+        glyphs = _sprite_glyphs(symbols, self.root)
+        self.symbols = frozenset(symbol for symbol, _, _ in glyphs)
+        self.data = build_sprite(self.symbols, self.root)
+        manifest = get_manifest(self.root)
+        self.path = hashed_name(
+            SPRITE_PATH,
+            hashlib.sha256(self.data).hexdigest(),
+            manifest.hash_length,
+        )
+        self.register(manifest)
+
+    def register(self, manifest):
+        """Serve the sprite from ``manifest``, if it doesn't yet."""
+        if self.path not in manifest.files:
+            manifest.add(SPRITE_PATH, self.data)
+
+    def __contains__(self, symbol):
+        """Tell whether the sprite holds ``symbol``."""
+        return symbol in self.symbols
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+WSGI middleware serving the bundled files from memory.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import functools
+import mimetypes
+
+from werkzeug.http import parse_accept_header, parse_etags
+from werkzeug.utils import get_content_type
+
+from .assets import ENCODINGS, IMMUTABLE_MAX_AGE, get_manifest
+
+
+_NOT_MODIFIED = "304 Not Modified"
+
+_OK = "200 OK"
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+@functools.lru_cache(maxsize=128)
+def accepted_encodings(header):
+    """Return the available codings ``header`` accepts, best first."""
+    accept = parse_accept_header(header)
+    offers = [name for name in ENCODINGS if ENCODINGS[name][1]]
+    accepted = []
+    while offers:
+        encoding = accept.best_match(offers)
+        if encoding is None:
+            break
+        accepted.append(encoding)
+        offers.remove(encoding)
+    return tuple(accepted)
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class _Entry(object):
+    """The response parts of an :class:`~flask_semanticui.assets.Asset`."""
+
+    __slots__ = ("asset", "cache_control", "content_type", "variants")
+
+    def __init__(self, asset, body, max_age):
+        self.asset = asset
+        mimetype, _ = mimetypes.guess_type(asset.path)
+        self.content_type = get_content_type(
+            mimetype or "application/octet-stream", "utf-8"
+        )
+        if asset.immutable:
+            self.cache_control = (
+                f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+            )
+        elif max_age:
+            self.cache_control = f"public, max-age={max_age}"
+        else:
+            self.cache_control = "no-cache"
+        self.variants = {None: self._variant(None, body)}
+
+    def _variant(self, encoding, body):
+        """Return the ``(etag, headers, body)`` of a coding."""
+        etag = self.asset.digest
+        if encoding is not None:
+            etag = f"{etag}-{encoding}"
+        headers = [
+            ("Content-Type", self.content_type),
+            ("Content-Length", str(len(body))),
+            ("ETag", f'"{etag}"'),
+            ("Cache-Control", self.cache_control),
+        ]
+        if self.asset.compressible:
+            headers.append(("Vary", "Accept-Encoding"))
+        if encoding is not None:
+            headers.append(("Content-Encoding", encoding))
+        return etag, headers, body
+
+    def variant(self, encodings):
+        """Return the variant of the first coding in ``encodings``.
+
+        Compressed variants are made on first use, from the sidecars of the
+        files when they exist.
+        """
+        if not self.asset.compressible:
+            return self.variants[None]
+        for encoding in encodings:
+            try:
+                variant = self.variants[encoding]
+            except KeyError:
+                body = self.asset.encoded(encoding)
+                variant = body and self._variant(encoding, body)
+                self.variants[encoding] = variant
+            if variant:
+                return variant
+        return self.variants[None]
+
+
+class AssetMiddleware(object):
+    """Serve the bundled files before the application sees the request.
+
+    Every file of the :class:`~flask_semanticui.assets.AssetManifest`,
+    under its plain and hashed path, is loaded in memory with its
+    response headers. ``GET`` and ``HEAD`` requests for them are then
+    answered from that table, with ``Accept-Encoding`` negotiation and
+    ``If-None-Match`` support, without the Flask dispatch: no request
+    context, no ``before_request`` hooks and no file system access. The
+    bodies are the stored ``bytes`` objects, handed to the server
+    without copy. A compressed variant is made on its first request,
+    from the precompressed sidecar of the file when there is one.
+
+    Other requests, including ``Range`` requests, go to the application.
+
+    Parameters
+    ----------
+    wsgi_app: ``callable``
+        The WSGI application to wrap, usually ``app.wsgi_app``.
+    prefix: ``str``
+        The URL path of the files, e.g. ``/static/semantic``.
+    manifest: ``AssetManifest``
+        The files to serve, the bundled ones by default.
+    max_age: ``int``
+        The ``Cache-Control`` max-age of the plain paths, the hashed ones
+        are cached for a year.
+    exclude: ``callable``
+        Take a path and tell whether to leave the file out, e.g. the
+        legacy fonts of an asset profile. Those requests go to the
+        application.
+    build: ``callable``
+        Take the path of a file missing from the table, build it into the
+        manifest if it's made on demand and tell whether it's served, e.g.
+        the icon sprite. The files it builds join the table.
+    """
+
+    def __init__(
+        self,
+        wsgi_app,
+        prefix,
+        manifest=None,
+        max_age=None,
+        exclude=None,
+        build=None,
+    ):
+        self.wsgi_app = wsgi_app
+        self.prefix = prefix.rstrip("/") + "/"
+        manifest = get_manifest() if manifest is None else manifest
+        self.manifest = manifest
+        self.max_age = max_age
+        self.exclude = exclude
+        self.build = build
+        bodies, table = {}, {}
+        for path, asset in manifest.files.items():
+            if exclude is not None and exclude(path):
+                continue
+            if asset.data is not None:
+                body = asset.data
+            else:
+                body = bodies.get(asset.source)
+                if body is None:
+                    body = bodies[asset.source] = asset.read()
+            table[self.prefix + path] = _Entry(asset, body, max_age)
+        self.table = table
+
+    def _built_entry(self, path_info):
+        """Return the entry of a file built on demand, ``None`` if none."""
+        if self.build is None or not path_info.startswith(self.prefix):
+            return None
+        path = path_info[len(self.prefix):]
+        if self.exclude is not None and self.exclude(path):
+            return None
+        if not self.build(path):
+            return None
+        asset = self.manifest.files[path]
+        entry = self.table[path_info] = _Entry(
+            asset, asset.read(), self.max_age
+        )
+        return entry
+
+    def __call__(self, environ, start_response):
+        path_info = environ.get("PATH_INFO") or ""
+        entry = self.table.get(path_info)
+        if entry is None:
+            entry = self._built_entry(path_info)
+        method = environ.get("REQUEST_METHOD")
+        if (
+            entry is None
+            or method not in ("GET", "HEAD")
+            or "HTTP_RANGE" in environ
+        ):
+            return self.wsgi_app(environ, start_response)
+
+        encodings = accepted_encodings(
+            environ.get("HTTP_ACCEPT_ENCODING", "")
+        )
+        etag, headers, body = entry.variant(encodings)
+        if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and parse_etags(if_none_match).contains(etag):
+            start_response(_NOT_MODIFIED, headers[2:])
+            return []
+        start_response(_OK, headers)
+        if method == "HEAD":
+            return []
+        return [body]
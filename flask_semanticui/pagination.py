@@ -0,0 +1,631 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+Pagination objects for the pagination macros.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import base64
+import binascii
+import datetime as dt
+import decimal
+import json
+import math
+import re
+import threading
+import time
+import uuid
+
+from flask import abort
+
+from .tables import get_field
+
+try:  # pragma: no cover
+    from sqlalchemy import func, select, tuple_
+except ImportError:  # pragma: no cover
+    func = select = tuple_ = None
+
+
+_SESSION_REQUIRED = "The session argument is required to paginate a Select."
+
+_UTC_OFFSET = re.compile(r"([+-])(\d\d):(\d\d)(?::(\d\d)(?:\.(\d{6}))?)?$")
+
+#: The JSON values a cursor holds as they are.
+_SCALARS = (str, int, float, bool, type(None))
+
+
+# =============================================================================
+# CURSORS
+# =============================================================================
+
+
+def _dump_value(value):
+    """Turn a sort key value into something JSON can hold."""
+    if isinstance(value, dt.datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, dt.date):
+        return {"d": value.isoformat()}
+    if isinstance(value, dt.time):
+        return {"t": value.isoformat()}
+    if isinstance(value, decimal.Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _parse_iso(text, fmt):
+    """Parse the ``isoformat()`` of a datetime or a time.
+
+    ``fromisoformat`` needs Python 3.7 and ``strptime`` reads the UTC
+    offsets with a colon from 3.7 too, they're parsed here.
+
+    Return
+    ------
+        The naive ``datetime`` and the ``tzinfo``, ``None`` if none.
+    """
+    tzinfo = None
+    match = _UTC_OFFSET.search(text)
+    if match is not None:
+        sign, hours, minutes, seconds, microseconds = match.groups()
+        offset = dt.timedelta(
+            hours=int(hours),
+            minutes=int(minutes),
+            seconds=int(seconds or 0),
+            microseconds=int(microseconds or 0),
+        )
+        tzinfo = dt.timezone(-offset if sign == "-" else offset)
+        text = text[: match.start()]
+    if "." in text:
+        fmt += ".%f"
+    return dt.datetime.strptime(text, fmt), tzinfo
+
+
+def _load_datetime(text):
+    """Parse the ``isoformat()`` of a ``datetime``."""
+    value, tzinfo = _parse_iso(text, "%Y-%m-%dT%H:%M:%S")
+    return value.replace(tzinfo=tzinfo)
+
+
+def _load_date(text):
+    """Parse the ``isoformat()`` of a ``date``."""
+    return dt.datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def _load_time(text):
+    """Parse the ``isoformat()`` of a ``time``."""
+    value, tzinfo = _parse_iso(text, "%H:%M:%S")
+    return value.time().replace(tzinfo=tzinfo)
+
+
+def _load_decimal(text):
+    """Parse the ``str()`` of a finite ``Decimal``."""
+    try:
+        value = decimal.Decimal(text)
+    except decimal.InvalidOperation as err:
+        raise ValueError(f"Invalid decimal {text!r}") from err
+    if not value.is_finite():
+        raise ValueError(f"Invalid decimal {text!r}")
+    return value
+
+
+_TYPES = {
+    "dt": _load_datetime,
+    "d": _load_date,
+    "t": _load_time,
+    "dec": _load_decimal,
+    "uuid": uuid.UUID,
+}
+
+
+def _load_value(value):
+    """Undo :func:`_dump_value`.
+
+    Raises
+    ------
+    ValueError
+        When ``value`` is neither a scalar nor a dumped value.
+    """
+    if isinstance(value, dict):
+        ((kind, text),) = value.items()
+        if not isinstance(text, str):
+            raise ValueError(f"Invalid {kind} value {text!r}")
+        return _TYPES[kind](text)
+    if not isinstance(value, _SCALARS) or (
+        isinstance(value, float) and not math.isfinite(value)
+    ):
+        raise ValueError(f"Invalid value {value!r}")
+    return value
+
+
+def encode_cursor(direction, values):
+    """Encode a position in an ordered query as an opaque URL-safe token.
+
+    Parameters
+    ----------
+    direction: ``str``
+        ``"next"`` for the rows after ``values``, ``"prev"`` for the rows
+        before them.
+    values: ``iterable``
+        The sort key values of the row to start from.
+
+    Return
+    ------
+        The cursor token, without base64 padding.
+    """
+    payload = json.dumps(
+        [direction[0], [_dump_value(value) for value in values]],
+        separators=(",", ":"),
+    )
+    token = base64.urlsafe_b64encode(payload.encode("utf-8"))
+    return token.decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """Decode a token made by :func:`encode_cursor`.
+
+    Return
+    ------
+        A ``(direction, values)`` tuple.
+
+    Raises
+    ------
+    ValueError
+        When the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = base64.urlsafe_b64decode(padded.encode("ascii"))
+        direction, values = json.loads(payload.decode("utf-8"))
+        if not isinstance(direction, str) or not isinstance(values, list):
+            raise ValueError(f"Invalid cursor {token!r}")
+        values = [_load_value(value) for value in values]
+    except (
+        binascii.Error,
+        KeyError,
+        TypeError,
+        UnicodeError,
+        ValueError,
+    ) as err:
+        raise ValueError(f"Invalid cursor {token!r}") from err
+    directions = {"n": "next", "p": "prev"}
+    if direction not in directions:
+        raise ValueError(f"Invalid cursor {token!r}")
+    return directions[direction], values
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+
+def _is_orm_query(query):
+    """Tell an ORM ``Query`` from a ``Select`` statement."""
+    return hasattr(query, "all")
+
+
+def _where(query, condition):
+    """Add a ``WHERE`` condition to a ``Query`` or a ``Select``."""
+    if _is_orm_query(query):
+        return query.filter(condition)
+    return query.where(condition)
+
+
+def _all(query, session):
+    """Return the rows of a ``Query`` or a ``Select``.
+
+    A ``Select`` of a single entity returns its instances, like a
+    ``Query`` does.
+    """
+    if _is_orm_query(query):
+        return query.all()
+    if session is None:
+        raise RuntimeError(_SESSION_REQUIRED)
+    result = session.execute(query)
+    descriptions = getattr(query, "column_descriptions", ())
+    if len(descriptions) == 1 and descriptions[0]["entity"] is not None:
+        if descriptions[0]["expr"] is descriptions[0]["entity"]:
+            result = result.scalars()
+    return result.all()
+
+
+def _count(query, session, offset=0, limit=None):
+    """Count the rows of a query, only up to ``limit`` of them if given.
+
+    With a ``limit`` the database stops scanning once it found enough
+    rows, unlike a plain ``COUNT(*)``.
+    """
+    query = query.order_by(None)
+    if limit is not None:
+        query = query.limit(limit).offset(offset)
+    if _is_orm_query(query):
+        return query.count()
+    if session is None:
+        raise RuntimeError(_SESSION_REQUIRED)
+    count = select(func.count()).select_from(query.subquery())
+    return session.execute(count).scalar()
+
+
+def query_fingerprint(query):
+    """Return a hashable key of the SQL and parameters of a query."""
+    statement = query.statement if _is_orm_query(query) else query
+    compiled = statement.compile()
+    params = sorted(compiled.params.items())
+    return str(compiled), repr(params)
+
+
+# =============================================================================
+# COUNT STRATEGIES
+# =============================================================================
+
+
+class ExactCount(object):
+    """Count every row with ``COUNT(*)``, like ``paginate()`` does."""
+
+    def __call__(self, query, session, page, per_page):
+        """Return the ``(total, exact)`` count of the rows of ``query``."""
+        return _count(query, session), True
+
+
+class CachedCount(ExactCount):
+    """Exact count, reused while the same query is paginated again.
+
+    Counts are cached per query fingerprint (its SQL and parameters) for
+    ``ttl`` seconds, so browsing through the pages of a listing runs a
+    single ``COUNT(*)``. New rows show up once the count expires.
+
+    Parameters
+    ----------
+    ttl: ``float``
+        The number of seconds a count is reused.
+    maxsize: ``int``
+        The number of counts kept, the oldest ones are dropped first.
+    """
+
+    def __init__(self, ttl=60, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, query, session, page, per_page):
+        """Return the cached ``(total, exact)`` count of ``query``."""
+        key = query_fingerprint(query)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._counts.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1], True
+        total, exact = super().__call__(query, session, page, per_page)
+        with self._lock:
+            self._counts.pop(key, None)
+            while len(self._counts) >= self.maxsize:
+                del self._counts[next(iter(self._counts))]
+            self._counts[key] = (now + self.ttl, total)
+        return total, exact
+
+    def clear(self):
+        """Forget every cached count."""
+        with self._lock:
+            self._counts.clear()
+
+
+class ProbeCount(object):
+    """Only check how many of the next ``pages`` pages exist.
+
+    The count is bounded to the rows of the current page and the
+    ``pages`` following it, so its cost doesn't grow with the table. The
+    total is exact near the end of the results and a lower bound
+    otherwise.
+
+    Parameters
+    ----------
+    pages: ``int``
+        The number of pages to look ahead.
+    """
+
+    def __init__(self, pages=5):
+        self.pages = pages
+
+    def __call__(self, query, session, page, per_page):
+        """Return the ``(total, exact)`` count up to ``pages`` ahead."""
+        offset = (page - 1) * per_page
+        window = per_page * (self.pages + 1)
+        found = _count(query, session, offset, window + 1)
+        if found > window:
+            return offset + window, False
+        return offset + found, True
+
+
+class CappedCount(object):
+    """Count the rows up to a cap, e.g. to show "1000+ results".
+
+    Parameters
+    ----------
+    cap: ``int``
+        The highest exact count.
+    """
+
+    def __init__(self, cap=1000):
+        self.cap = cap
+
+    def __call__(self, query, session, page, per_page):
+        """Return the ``(total, exact)`` count, ``total`` at most ``cap``."""
+        found = _count(query, session, 0, self.cap + 1)
+        if found > self.cap:
+            return self.cap, False
+        return found, True
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class CursorPagination(object):
+    """Keyset pagination of a query ordered by unique sort keys.
+
+    Instead of an ``OFFSET`` and a ``COUNT(*)``, each page is fetched with
+    ``WHERE (keys) > (:cursor) ORDER BY keys LIMIT per_page + 1``, where
+    ``cursor`` holds the sort keys of the last row of the previous page.
+    Deep pages then cost the same as the first one, as long as an index
+    covers the keys. The cursor travels in the URL as an opaque token,
+    see ``render_ui_cursor_pager``.
+
+    Parameters
+    ----------
+    query: ``Select`` or ``Query``
+        A SQLAlchemy :func:`~sqlalchemy.sql.expression.select` or an ORM
+        query (e.g. ``Model.query``), without ordering nor limit.
+    order_by: ``iterable``
+        The columns to sort on, together unique for every row (add the
+        primary key last to break ties).
+    per_page: ``int``
+        The number of items per page.
+    cursor: ``str``
+        The token of the page to show, ``None`` for the first page.
+    session: ``Session``
+        The session executing ``query`` when it's a ``Select``.
+    descending: ``bool``
+        Sort the keys in descending order.
+    error_out: ``bool``
+        Abort with a 404 error when ``cursor`` is malformed, otherwise
+        show the first page.
+    """
+
+    def __init__(
+        self,
+        query,
+        order_by,
+        per_page=20,
+        cursor=None,
+        session=None,
+        descending=False,
+        error_out=True,
+    ):
+        self.query = query
+        self.order_by = tuple(order_by)
+        self.keys = tuple(column.key for column in self.order_by)
+        self.per_page = per_page
+        self.cursor = cursor
+        self.session = session
+        self.descending = descending
+
+        direction, values = "next", None
+        if cursor:
+            try:
+                direction, values = decode_cursor(cursor)
+            except ValueError:
+                if error_out:
+                    abort(404)
+            else:
+                if len(values) != len(self.keys):
+                    if error_out:
+                        abort(404)
+                    direction, values = "next", None
+        self.direction = direction if values is not None else "next"
+
+        items = self._fetch(values)
+        more = len(items) > per_page
+        items = items[:per_page]
+        if self.direction == "prev":
+            items.reverse()
+            self.has_prev, self.has_next = more, True
+        else:
+            self.has_prev, self.has_next = values is not None, more
+        self.items = items
+
+    def _fetch(self, values):
+        """Run the query for the page after (or before) ``values``."""
+        backward = self.direction == "prev"
+        descending = self.descending != backward
+        query = self.query
+        if values is not None:
+            if len(self.order_by) == 1:
+                column, bound = self.order_by[0], values[0]
+            else:
+                column, bound = tuple_(*self.order_by), tuple_(*values)
+            condition = column < bound if descending else column > bound
+            query = _where(query, condition)
+        query = query.order_by(
+            *(
+                column.desc() if descending else column.asc()
+                for column in self.order_by
+            )
+        ).limit(self.per_page + 1)
+        return _all(query, self.session)
+
+    def _item_cursor(self, direction, item):
+        """Return the cursor of the page next to ``item``."""
+        return encode_cursor(
+            direction, [get_field(item, key) for key in self.keys]
+        )
+
+    @property
+    def next_cursor(self):
+        """The token of the next page, ``None`` if there is none."""
+        if not self.has_next or not self.items:
+            return None
+        return self._item_cursor("next", self.items[-1])
+
+    @property
+    def prev_cursor(self):
+        """The token of the previous page, ``None`` if there is none."""
+        if not self.has_prev or not self.items:
+            return None
+        return self._item_cursor("prev", self.items[0])
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+class CountedPagination(object):
+    """Numbered pagination with a pluggable count of the total.
+
+    It renders with ``render_ui_pagination`` and ``render_ui_pager`` like
+    the ``Pagination`` of Flask-SQLAlchemy, but the ``COUNT(*)`` behind
+    :attr:`pages` is left to ``count``, one of :class:`ExactCount`,
+    :class:`CachedCount`, :class:`ProbeCount` and :class:`CappedCount`
+    or any callable taking ``(query, session, page, per_page)`` and
+    returning a ``(total, exact)`` tuple.
+
+    One row more than a page is fetched, so :attr:`has_next` is always
+    known and the last page gets its total without counting. When the
+    total isn't exact, :meth:`iter_pages` ends with an ellipsis instead
+    of the last pages.
+
+    Parameters
+    ----------
+    query: ``Select`` or ``Query``
+        A SQLAlchemy :func:`~sqlalchemy.sql.expression.select` or an ORM
+        query (e.g. ``Model.query``), ordered.
+    page: ``int``
+        The page to show, from 1.
+    per_page: ``int``
+        The number of items per page.
+    count: ``callable``
+        The count strategy, :class:`ExactCount` by default.
+    session: ``Session``
+        The session executing ``query`` when it's a ``Select``.
+    error_out: ``bool``
+        Abort with a 404 error when ``page`` is out of range.
+    """
+
+    def __init__(
+        self,
+        query,
+        page=1,
+        per_page=20,
+        count=None,
+        session=None,
+        error_out=True,
+    ):
+        if page < 1:
+            if error_out:
+                abort(404)
+            page = 1
+        self.query = query
+        self.page = page
+        self.per_page = per_page
+        self.session = session
+
+        offset = (page - 1) * per_page
+        items = _all(query.limit(per_page + 1).offset(offset), session)
+        if not items and page != 1 and error_out:
+            abort(404)
+        self._more = len(items) > per_page
+        self.items = items[:per_page]
+
+        if self._more:
+            count = ExactCount() if count is None else count
+            total, exact = count(query, session, page, per_page)
+            exact = exact and total > offset + per_page
+            total = max(total, offset + per_page + 1)
+        else:
+            # The last page tells the total without counting.
+            total, exact = offset + len(self.items), True
+        #: The number of items, a lower bound when :attr:`total_is_exact`
+        #: is false.
+        self.total = total
+        #: Whether :attr:`total` is the exact number of items.
+        self.total_is_exact = exact
+
+    @property
+    def total_display(self):
+        """The total for humans, e.g. ``"1000+"`` when it isn't exact."""
+        return str(self.total) + ("" if self.total_is_exact else "+")
+
+    @property
+    def pages(self):
+        """The number of pages, a lower bound for inexact totals."""
+        if self.per_page == 0:
+            return 0
+        return int(math.ceil(self.total / float(self.per_page)))
+
+    @property
+    def has_prev(self):
+        """True if a previous page exists."""
+        return self.page > 1
+
+    @property
+    def prev_num(self):
+        """Number of the previous page."""
+        return self.page - 1 if self.has_prev else None
+
+    @property
+    def has_next(self):
+        """True if a next page exists."""
+        return self._more
+
+    @property
+    def next_num(self):
+        """Number of the next page."""
+        return self.page + 1 if self.has_next else None
+
+    def iter_pages(
+        self, left_edge=2, left_current=2, right_current=5, right_edge=2
+    ):
+        """Iterate over the page numbers, ``None`` for skipped pages.
+
+        The arguments work as in Flask-SQLAlchemy, but the right edge is
+        only shown when the number of pages is known.
+        """
+        pages = self.pages
+        if not self.total_is_exact:
+            right_edge = 0
+        last = 0
+        for num in range(1, pages + 1):
+            if (
+                num <= left_edge
+                or self.page - left_current - 1
+                < num
+                < self.page + right_current
+                or num > pages - right_edge
+            ):
+                if last + 1 != num:
+                    yield None
+                yield num
+                last = num
+        if not self.total_is_exact:
+            yield None
+
+    def __iter__(self):
+        return iter(self.items)
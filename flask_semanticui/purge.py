@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+Remove the rules of a stylesheet no page of the application uses.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import hashlib
+import re
+
+from .tables import RENDERED_CLASSES
+
+#: Classes the Semantic UI modules add at runtime, always kept.
+DEFAULT_SAFELIST = (
+    "active",
+    "animating",
+    "checked",
+    "dimmable",
+    "dimmed",
+    "disabled",
+    "error",
+    "hidden",
+    "in",
+    "indeterminate",
+    "loading",
+    "out",
+    "selected",
+    "transition",
+    "visible",
+)
+
+_WORD = re.compile(r"[A-Za-z0-9_-]+")
+
+_CLASS = re.compile(r"\.((?:\\.|[\w-])+)")
+
+_CLASS_ATTRIBUTE = re.compile(r"""\[class[*~^|$]?=\s*(['"]?)([^'"\]]*)\1""")
+
+_NOT = re.compile(r":not\((?:[^()]|\([^()]*\))*\)")
+
+_ANIMATION = re.compile(r"animation(?:-name)?\s*:\s*([^;}]+)")
+
+_KEYFRAMES = re.compile(
+    r"@(?:-[a-z]+-)?keyframes\s+([^\s{]+)\s*\{(?:[^{}]|\{[^{}]*\})*\}"
+)
+
+_NESTED_AT_RULES = ("@media", "@supports", "@document", "@-moz-document")
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def collect_tokens(text):
+    """Return the words of ``text`` that may be class names.
+
+    Every word counts, not only the ones of ``class`` attributes, since
+    templates build them with expressions, e.g.
+    ``class="ui {{ color }} button"``.
+    """
+    return set(_WORD.findall(text))
+
+
+def template_tokens(app, macros=True):
+    """Return the tokens of every template ``app`` can render.
+
+    It covers the templates of the application, of its blueprints and,
+    with ``macros``, the macros of this extension.
+    """
+    tokens = set()
+    env = app.jinja_env
+    for name in env.list_templates():
+        if not macros and name.startswith("semantic/"):
+            continue
+        source, _, _ = env.loader.get_source(env, name)
+        tokens |= collect_tokens(source)
+    return tokens
+
+
+def module_tokens():
+    """Return the classes this extension writes from Python.
+
+    They're the :data:`~flask_semanticui.tables.RENDERED_CLASSES` of
+    :func:`~flask_semanticui.tables.render_table`, the module sources
+    aren't scanned: their docstrings and URLs would count as classes.
+    """
+    return set(RENDERED_CLASSES)
+
+
+def crawl_paths(app):
+    """Return the paths of the ``GET`` routes of ``app`` without arguments."""
+    return sorted(
+        rule.rule
+        for rule in app.url_map.iter_rules()
+        if "GET" in rule.methods
+        and not rule.arguments
+        and not rule.endpoint.startswith("semantic.")
+        and rule.endpoint != "static"
+    )
+
+
+def crawl_tokens(app, paths):
+    """Return the tokens of the pages ``app`` renders at ``paths``.
+
+    The pages are requested with the test client.
+
+    Return
+    ------
+        A ``(tokens, failures)`` tuple, ``failures`` lists the paths that
+        didn't answer with a page.
+    """
+    tokens, failures = set(), []
+    client = app.test_client()
+    for path in paths:
+        try:
+            response = client.get(path)
+        except Exception:  # noqa: B902
+            failures.append(path)
+            continue
+        if response.mimetype != "text/html" or response.status_code >= 400:
+            failures.append(path)
+        else:
+            tokens |= collect_tokens(response.get_data(as_text=True))
+        response.close()
+    return tokens, failures
+
+
+def purged_path(data):
+    """Return the served path of a purged stylesheet."""
+    digest = hashlib.sha256(data).hexdigest()
+    return f"css/semantic.purged-{digest[:8]}.min.css"
+
+
+def _split(css, start=0, end=None):
+    """Split a stylesheet into its top level statements and blocks.
+
+    Return
+    ------
+        A list of ``(prelude, body)`` tuples, ``body`` is ``None`` for
+        statements like ``@import`` and comments.
+    """
+    end = len(css) if end is None else end
+    items, prelude_start, pos = [], start, start
+    while pos < end:
+        char = css[pos]
+        if css.startswith("/*", pos):
+            close = css.find("*/", pos + 2)
+            close = end if close < 0 else close + 2
+            if not css[prelude_start:pos].strip():
+                items.append((css[pos:close], None))
+                prelude_start = close
+            pos = close
+        elif char in "'\"":
+            pos = _skip_string(css, pos)
+        elif char == ";":
+            prelude = css[prelude_start:pos].strip()
+            if prelude:
+                items.append((prelude + ";", None))
+            pos = prelude_start = pos + 1
+        elif char == "{":
+            close = _match_brace(css, pos)
+            items.append((css[prelude_start:pos].strip(), (pos + 1, close)))
+            pos = prelude_start = close + 1
+        else:
+            pos += 1
+    return items
+
+
+def _skip_string(css, pos):
+    """Return the position after the string starting at ``pos``."""
+    quote, pos = css[pos], pos + 1
+    while pos < len(css) and css[pos] != quote:
+        pos += 2 if css[pos] == "\\" else 1
+    return pos + 1
+
+
+def _match_brace(css, pos):
+    """Return the position of the brace closing the one at ``pos``."""
+    depth = 0
+    while pos < len(css):
+        char = css[pos]
+        if char in "'\"":
+            pos = _skip_string(css, pos)
+            continue
+        if css.startswith("/*", pos):
+            close = css.find("*/", pos + 2)
+            pos = len(css) if close < 0 else close + 2
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if not depth:
+                return pos
+        pos += 1
+    return pos
+
+
+def split_selectors(selectors):
+    """Split a selector list on its top level commas."""
+    parts, depth, start, pos = [], 0, 0, 0
+    while pos < len(selectors):
+        char = selectors[pos]
+        if char in "'\"":
+            pos = _skip_string(selectors, pos)
+            continue
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and not depth:
+            parts.append(selectors[start:pos])
+            start = pos + 1
+        pos += 1
+    parts.append(selectors[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def selector_is_used(selector, tokens):
+    """Tell whether the classes ``selector`` requires are in ``tokens``.
+
+    The classes of ``:not()`` are ignored, the words of
+    ``[class*="four wide"]`` attributes count as classes.
+    """
+    selector = _NOT.sub("", selector)
+    for name in _CLASS.findall(selector):
+        if name.replace("\\", "") not in tokens:
+            return False
+    for _, value in _CLASS_ATTRIBUTE.findall(selector):
+        if not collect_tokens(value) <= tokens:
+            return False
+    return True
+
+
+def purge_css(css, tokens, exclude=None):
+    """Remove the rules of ``css`` whose selectors match no token.
+
+    Parameters
+    ----------
+    css: ``str``
+        The stylesheet.
+    tokens: ``set``
+        The class names in use, see :func:`collect_tokens`.
+    exclude: ``re.Pattern``
+        Also remove the selectors and at-rules it finds a match in.
+
+    Return
+    ------
+        The stylesheet with the rules using at least one of their
+        selectors, the at-rules left empty are removed, and so are the
+        ``@keyframes`` no kept rule animates. ``@import``,
+        ``@font-face`` and the copyright comments are kept.
+    """
+    purged = _purge(css, _split(css), tokens, exclude)
+    animations = set()
+    for match in _ANIMATION.finditer(purged):
+        animations |= collect_tokens(match.group(1))
+
+    return _KEYFRAMES.sub(
+        lambda match: match.group(0) if match.group(1) in animations else "",
+        purged,
+    )
+
+
+def _purge(css, items, tokens, exclude):
+    """Return the kept ``items`` of ``css`` as a stylesheet."""
+    kept = []
+    for prelude, body in items:
+        if prelude.startswith("/*"):
+            if "Copyright" in prelude:
+                kept.append(prelude)
+            continue
+        if (
+            exclude is not None
+            and prelude.startswith("@")
+            and exclude.search(prelude)
+        ):
+            continue
+        if body is None:
+            kept.append(prelude)
+            continue
+        start, end = body
+        if prelude.startswith(_NESTED_AT_RULES):
+            inner = _purge(css, _split(css, start, end), tokens, exclude)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            kept.append(f"{prelude}{{{css[start:end]}}}")
+        else:
+            selectors = [
+                selector
+                for selector in split_selectors(prelude)
+                if selector_is_used(selector, tokens)
+                and (exclude is None or not exclude.search(selector))
+            ]
+            if selectors:
+                kept.append(f"{','.join(selectors)}{{{css[start:end]}}}")
+    return "".join(kept)
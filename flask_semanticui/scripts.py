@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+The scripts of ``load_js``: bundles holding only some of the Semantic UI
+modules, and how they're loaded without blocking the parser.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import json
+import re
+
+from .assets import STATIC_ROOT
+
+#: The Semantic UI modules, in the order of ``semantic.min.js``.
+MODULES = (
+    "site",
+    "form",
+    "accordion",
+    "checkbox",
+    "dimmer",
+    "dropdown",
+    "embed",
+    "modal",
+    "nag",
+    "popup",
+    "progress",
+    "rating",
+    "search",
+    "shape",
+    "sidebar",
+    "sticky",
+    "tab",
+    "transition",
+    "api",
+    "visibility",
+)
+
+#: The behaviours the macros need besides the modules, added after them.
+BEHAVIOURS = {
+    # Close the dismissible messages of render_ui_messages.
+    "message": (
+        "!function(e){e(document).on('click','.message .close',function(){"
+        "e(this).closest('.message').transition('fade')})}(jQuery);"
+    ),
+}
+
+#: The modules each module or behaviour uses.
+REQUIRES = {
+    "dimmer": ("transition",),
+    "dropdown": ("transition",),
+    "message": ("transition",),
+    "modal": ("dimmer", "transition"),
+    "popup": ("transition",),
+    "search": ("api", "transition"),
+    "sidebar": ("transition",),
+}
+
+#: Named module lists for ``SEMANTIC_JS_MODULES``.
+JS_PRESETS = {
+    # What the macros of form_ui.html and utils.html need.
+    "macros": ("checkbox", "dropdown", "message", "transition"),
+}
+
+#: The folder of the module scripts, relative to the static root.
+MODULES_FOLDER = "js/semantic/components"
+
+_MODULE_END = "}(jQuery,window,document)"
+
+_MODULE_NAME = re.compile(r"\.fn\.(\w+)=")
+
+_BANNER = re.compile(r"\s*/\*.*?\*/\s*", re.S)
+
+_BUNDLE_PATH = re.compile(
+    r"js/semantic/semantic\.(?:custom-(?P<mask>[0-9a-f]+)|(?P<preset>\w+))"
+    r"\.min(?:\.[0-9a-f]+)?\.js"
+)
+
+#: The ``strategy`` values of ``load_js`` besides ``None``, the blocking
+#: ``<script>`` tags.
+STRATEGIES = ("defer", "async-ordered", "on-demand")
+
+#: The elements of the Semantic UI modules, those needing the scripts.
+ON_DEMAND_SELECTOR = ",".join(
+    f".ui.{name}"
+    for name in (
+        "accordion",
+        "checkbox",
+        "dimmer",
+        "dropdown",
+        "embed",
+        "modal",
+        "popup",
+        "progress",
+        "rating",
+        "search",
+        "shape",
+        "sidebar",
+        "sticky",
+        "tab",
+    )
+)
+
+#: The event dispatched on ``document`` once the scripts are loaded by the
+#: ``async-ordered`` and ``on-demand`` strategies.
+LOAD_EVENT = "semantic:load"
+
+_LOADER = (
+    "(function(d,s,q){function l(){s.forEach(function(x,i){"
+    "var e=d.createElement('script');e.src=x[0];"
+    "if(x[1]){e.integrity=x[1];e.crossOrigin='anonymous';}e.async=false;"
+    "if(i==s.length-1)e.onload=function(){"
+    "d.dispatchEvent(new Event(%(event)s));};"
+    "d.head.appendChild(e);});}"
+    "if(!q||d.querySelector(q))l();"
+    "else if(d.readyState=='loading')"
+    "d.addEventListener('DOMContentLoaded',function(){"
+    "if(d.querySelector(q))l();});"
+    "})(document,%(scripts)s,%(selector)s);"
+)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def resolve_modules(modules):
+    """Return the modules and behaviours of a ``SEMANTIC_JS_MODULES`` value.
+
+    Parameters
+    ----------
+    modules: ``str`` or ``iterable``
+        The name of a preset or module and behaviour names.
+
+    Return
+    ------
+        A ``tuple`` of names, with the modules they use, the modules in
+        the order of :data:`MODULES` and the :data:`BEHAVIOURS` last.
+    """
+    if isinstance(modules, str):
+        try:
+            modules = JS_PRESETS[modules]
+        except KeyError:
+            raise ValueError(
+                f"Unknown Semantic UI modules preset {modules!r}"
+            ) from None
+    names = set(modules)
+    unknown = names.difference(MODULES, BEHAVIOURS)
+    if unknown:
+        raise ValueError(
+            "Unknown Semantic UI modules: " + ", ".join(sorted(unknown))
+        )
+    for name in list(names):
+        names.update(REQUIRES.get(name, ()))
+    order = MODULES + tuple(BEHAVIOURS)
+    return tuple(name for name in order if name in names)
+
+
+def module_bundle_path(modules):
+    """Return the path of the script of ``modules``.
+
+    Presets get their name, ``js/semantic/semantic.macros.min.js``, other
+    lists the bits of their modules in the order of :data:`MODULES` and
+    :data:`BEHAVIOURS`, so :func:`bundle_modules` reads them back.
+    """
+    names = resolve_modules(modules)
+    for preset, members in JS_PRESETS.items():
+        if resolve_modules(members) == names:
+            return f"js/semantic/semantic.{preset}.min.js"
+    order = MODULES + tuple(BEHAVIOURS)
+    mask = sum(1 << order.index(name) for name in names)
+    return f"js/semantic/semantic.custom-{mask:x}.min.js"
+
+
+def bundle_modules(path):
+    """Return the modules of the script at ``path``, the reverse of
+    :func:`module_bundle_path`.
+
+    Parameters
+    ----------
+    path: ``str``
+        The plain or hashed path of a module bundle.
+
+    Return
+    ------
+        A ``tuple`` of names, or ``None`` if ``path`` isn't the one of a
+        module bundle.
+    """
+    match = _BUNDLE_PATH.fullmatch(path)
+    if match is None:
+        return None
+    if match["preset"]:
+        if match["preset"] not in JS_PRESETS:
+            return None
+        return resolve_modules(match["preset"])
+    order = MODULES + tuple(BEHAVIOURS)
+    mask = int(match["mask"], 16)
+    if not mask or mask >> len(order):
+        return None
+    names = tuple(name for i, name in enumerate(order) if mask >> i & 1)
+    # Only the canonical name of a module list, not its aliases.
+    plain = f"js/semantic/semantic.custom-{match['mask']}.min.js"
+    if module_bundle_path(names) != plain:
+        return None
+    return resolve_modules(names)
+
+
+def build_module_bundle(modules, root=STATIC_ROOT):
+    """Concatenate the scripts of ``modules``.
+
+    Parameters
+    ----------
+    modules: ``str`` or ``iterable``
+        See :func:`resolve_modules`.
+    root: ``pathlib.Path``
+        The static folder holding :data:`MODULES_FOLDER`.
+
+    Return
+    ------
+        A ``(path, content)`` tuple. The license banner of the modules
+        starts the content once.
+    """
+    parts = []
+    for name in resolve_modules(modules):
+        if name in BEHAVIOURS:
+            parts.append(BEHAVIOURS[name])
+            continue
+        source = root / f"{MODULES_FOLDER}/{name}.min.js"
+        script = source.read_text(encoding="utf-8")
+        if parts:
+            script = _BANNER.sub("", script, count=1)
+        parts.append(script)
+    js = "\n".join(parts)
+    return module_bundle_path(modules), js.encode("utf-8")
+
+
+def module_bundle(manifest, modules):
+    """Serve the script of ``modules`` from ``manifest`` and return its path.
+
+    It's built once per module list.
+    """
+    path = module_bundle_path(modules)
+    if path not in manifest.files:
+        _, data = build_module_bundle(modules, manifest.root)
+        manifest.add(path, data)
+    return path
+
+
+def split_modules(js):
+    """Split ``semantic.min.js`` into its modules.
+
+    Each module is a function called with ``jQuery``, ``window`` and
+    ``document``, the minified file chains the calls with commas.
+
+    Return
+    ------
+        A ``dict`` mapping the names of :data:`MODULES` to their scripts,
+        each one a statement of its own starting with the license banner
+        of the file.
+    """
+    parts = js.strip().rstrip(";").split(_MODULE_END + ",")
+    if not parts[-1].endswith(_MODULE_END):
+        raise ValueError("Not a Semantic UI 2.4 script")
+    parts[-1] = parts[-1][: -len(_MODULE_END)]
+    names = [_MODULE_NAME.search(part) for part in parts]
+    if [name and name[1] for name in names] != list(MODULES):
+        raise ValueError("Not a Semantic UI 2.4 script")
+    banner = ""
+    match = _BANNER.match(parts[0])
+    if match:
+        banner = match[0].strip() + "\n"
+        parts[0] = parts[0][match.end():]
+    return {
+        name: f"{banner}!{part.lstrip('!')}{_MODULE_END};"
+        for name, part in zip(MODULES, parts)
+    }
+
+
+def write_modules(root=STATIC_ROOT, source="js/semantic/semantic.min.js"):
+    """Write the module scripts from the full one.
+
+    It's the build step of the ``js/semantic/components`` files shipped
+    with the extension, run it after updating ``semantic.min.js``.
+
+    Return
+    ------
+        The list of written files.
+    """
+    js = (root / source).read_text(encoding="utf-8")
+    folder = root / MODULES_FOLDER
+    folder.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, script in split_modules(js).items():
+        path = root / f"{MODULES_FOLDER}/{name}.min.js"
+        path.write_text(script, encoding="utf-8")
+        written.append(path)
+    return written
+
+
+def check_strategy(strategy):
+    """Raise ``ValueError`` if ``strategy`` isn't a ``load_js`` one."""
+    if strategy is not None and strategy not in STRATEGIES:
+        raise ValueError(f"Unknown load_js strategy {strategy!r}")
+
+
+def _js(value):
+    """Return ``value`` as a JavaScript literal safe in a ``<script>``."""
+    return json.dumps(value).replace("</", "<\\/")
+
+
+def loader_script(scripts, selector=None):
+    """Return the inline ``<script>`` loading ``scripts`` in order.
+
+    The scripts are inserted with ``async = false``: they're downloaded
+    in parallel without blocking the parser and run in order, with their
+    ``integrity``. :data:`LOAD_EVENT` is dispatched once the last one ran.
+
+    Parameters
+    ----------
+    scripts: ``list``
+        The ``(url, integrity)`` pairs, ``integrity`` may be ``None``.
+    selector: ``str``
+        Only load the scripts when an element matches it, when the loader
+        runs or once the document is parsed. ``None`` loads them anyway.
+    """
+    loader = _LOADER % {
+        "event": _js(LOAD_EVENT),
+        "scripts": _js([list(script) for script in scripts]),
+        "selector": _js(selector),
+    }
+    return f"<script>{loader}</script>"
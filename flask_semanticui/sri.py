@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+Subresource Integrity hashes of the local and CDN files.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import base64
+import concurrent.futures
+import hashlib
+import json
+import os
+import pathlib
+import threading
+import urllib.request
+
+from .assets import ENCODINGS, STATIC_ROOT
+
+#: The hashes of the CDN files of the versions the extension defaults to,
+#: the ones added by ``flask semantic sri`` go in ``SEMANTIC_SRI_REGISTRY``.
+REGISTRY_PATH = pathlib.Path(__file__).parent / "sri.json"
+
+#: The files of each package ``load_css``/``load_js`` take from the CDN.
+CDN_FILES = {
+    "semantic-ui": ("semantic.min.css", "semantic.min.js"),
+    "jquery": ("jquery.min.js",),
+}
+
+_registries = {}
+
+_manifests = {}
+
+_lock = threading.Lock()
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def integrity(data, algorithm="sha384"):
+    """Return the ``integrity`` attribute value of ``data``."""
+    digest = hashlib.new(algorithm, data).digest()
+    return f"{algorithm}-{base64.b64encode(digest).decode('ascii')}"
+
+
+def load_registry(path=REGISTRY_PATH):
+    """Return the registry at ``path``, read once.
+
+    The registry maps package names to versions to file names to their
+    ``integrity`` value, a missing file is an empty registry.
+    """
+    path = pathlib.Path(path)
+    with _lock:
+        registry = _registries.get(path)
+        if registry is None:
+            registry = _registries[path] = _read_registry(path)
+    return registry
+
+
+def _read_registry(path):
+    """Return the registry at ``path``, empty if there's no such file."""
+    try:
+        with open(path, encoding="utf-8") as fp:
+            return json.load(fp)
+    except FileNotFoundError:
+        return {}
+
+
+def cdn_integrity(package, version, filename, registry_path=None):
+    """Return the ``integrity`` of a CDN file, ``None`` if unknown.
+
+    The registry at ``registry_path``, e.g. ``SEMANTIC_SRI_REGISTRY``, is
+    looked up first, then the bundled one.
+    """
+    paths = [REGISTRY_PATH]
+    if registry_path is not None:
+        paths.insert(0, registry_path)
+    for path in paths:
+        registry = load_registry(path)
+        value = registry.get(package, {}).get(version, {}).get(filename)
+        if value is not None:
+            return value
+    return None
+
+
+def fetch_cdn_integrity(base, package, version, registry_path):
+    """Download the CDN files of a version and add them to the registry.
+
+    Parameters
+    ----------
+    base: ``str``
+        The base URL of the CDN.
+    package: ``str``
+        A key of :data:`CDN_FILES`.
+    version: ``str``
+        The version to add.
+    registry_path: ``pathlib.Path``
+        The registry to update, created if needed.
+
+    Return
+    ------
+        A ``dict`` mapping the file names to their ``integrity``.
+    """
+    hashes = {}
+    for filename in CDN_FILES[package]:
+        url = f"{base}/{package}@{version}/dist/{filename}"
+        with urllib.request.urlopen(url) as response:  # noqa: S310
+            hashes[filename] = integrity(response.read())
+
+    registry_path = pathlib.Path(registry_path)
+    with _lock:
+        registry = _read_registry(registry_path)
+        registry.setdefault(package, {})[version] = hashes
+        os.makedirs(registry_path.parent, exist_ok=True)
+        with open(registry_path, "w", encoding="utf-8") as fp:
+            json.dump(registry, fp, indent=2, sort_keys=True)
+            fp.write("\n")
+        _registries.pop(registry_path, None)
+    return hashes
+
+
+def get_sri_manifest(cache_path=None, root=STATIC_ROOT):
+    """Return the :class:`SriManifest` of ``root`` and ``cache_path``."""
+    key = (pathlib.Path(root), cache_path and pathlib.Path(cache_path))
+    with _lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = _manifests[key] = SriManifest(root, cache_path)
+    return manifest
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class SriManifest(object):
+    """The ``integrity`` values of the files under a static folder.
+
+    The files are hashed once with SHA-384, several at a time in a thread
+    pool since :mod:`hashlib` releases the GIL on large inputs. The hashes
+    are kept in a JSON file keyed by path, modification time and size,
+    so a restart only hashes the files that changed.
+
+    Parameters
+    ----------
+    root: ``pathlib.Path``
+        The static folder.
+    cache_path: ``pathlib.Path``
+        The JSON file caching the hashes, ``None`` to keep them in memory
+        only. It's written when its folder exists.
+    max_workers: ``int``
+        The size of the thread pool.
+    """
+
+    def __init__(self, root=STATIC_ROOT, cache_path=None, max_workers=None):
+        self.root = pathlib.Path(root)
+        self.cache_path = cache_path and pathlib.Path(cache_path)
+        self.max_workers = max_workers
+        self._hashes = None
+        self._lock = threading.Lock()
+
+    def _read_cache(self):
+        """Return the cached hashes, empty when there are none."""
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as fp:
+                cache = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def save(self, create=False):
+        """Write the hashes to the cache file.
+
+        Parameters
+        ----------
+        create: ``bool``
+            Create the folder of the cache file if needed, otherwise the
+            hashes are only written when it exists.
+
+        Return
+        ------
+            Whether the file was written.
+        """
+        if self.cache_path is None:
+            return False
+        hashes = self.build()
+        folder = self.cache_path.parent
+        try:
+            if create:
+                os.makedirs(folder, exist_ok=True)
+            if not folder.is_dir():
+                return False
+            with open(self.cache_path, "w", encoding="utf-8") as fp:
+                json.dump(hashes, fp, indent=2, sort_keys=True)
+        except OSError:
+            return False
+        return True
+
+    def build(self, force=False):
+        """Hash the files changed since they were cached.
+
+        Return
+        ------
+            A ``dict`` mapping the paths to their ``mtime``, ``size`` and
+            ``integrity``.
+        """
+        with self._lock:
+            if self._hashes is not None and not force:
+                return self._hashes
+            cache = {} if force else self._read_cache()
+            sidecars = tuple(suffix for suffix, _ in ENCODINGS.values())
+            hashes, stale = {}, []
+            for source in sorted(self.root.rglob("*")):
+                if not source.is_file() or source.suffix in sidecars:
+                    continue
+                path = source.relative_to(self.root).as_posix()
+                stat = source.stat()
+                entry = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+                cached = cache.get(path)
+                if (
+                    isinstance(cached, dict)
+                    and cached.get("mtime") == entry["mtime"]
+                    and cached.get("size") == entry["size"]
+                ):
+                    entry["integrity"] = cached.get("integrity")
+                if not entry.get("integrity"):
+                    stale.append((source, entry))
+                hashes[path] = entry
+
+            if stale:
+                with concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers
+                ) as pool:
+                    values = pool.map(
+                        lambda item: integrity(item[0].read_bytes()), stale
+                    )
+                    for (_, entry), value in zip(stale, values):
+                        entry["integrity"] = value
+            self._hashes = hashes
+
+        if stale or set(cache) != set(hashes):
+            self.save()
+        return hashes
+
+    def local(self, path):
+        """Return the ``integrity`` of ``path``, ``None`` if unknown."""
+        entry = self.build().get(path)
+        return entry and entry["integrity"]
@@ -0,0 +1,780 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+Helpers used to render tables with ``render_ui_table``.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+import itertools
+import operator
+from collections.abc import Mapping
+
+from flask import current_app, request, url_for
+
+from markupsafe import Markup, escape
+
+from .urls import UrlTemplate
+
+try:  # pragma: no cover
+    import dataclasses
+except ImportError:  # pragma: no cover
+    # Python 3.6, where there's no dataclass rows either.
+    dataclasses = None
+
+try:  # pragma: no cover
+    from sqlalchemy import event
+    from sqlalchemy.orm import Mapper, selectinload
+except ImportError:  # pragma: no cover
+    event = Mapper = selectinload = None
+
+
+#: The classes :func:`render_table` writes besides the ones it's given, for
+#: :func:`~flask_semanticui.purge.module_tokens`.
+RENDERED_CLASSES = (
+    "celled",
+    "eye",
+    "green",
+    "icon",
+    "item",
+    "pencil",
+    "plus",
+    "red",
+    "stackable",
+    "table",
+    "trash",
+    "ui",
+    "unstackable",
+)
+
+_MODEL_REQUIRED = "The model argument can't be None when setting action URLs."
+
+_CSRF_REQUIRED = (
+    "You have to enable the CSRFProtect extension from Flask-WTF to use "
+    "delete_url, see the docs for more details "
+    "(https://flask-semanticui.readthedocs.io/en/latest/notes/macros.html"
+    "#render-ui-table)."
+)
+
+#: Submit the shared delete form of a table with the clicked row's URL.
+delete_script = Markup(
+    "(function(f){f.previousElementSibling.addEventListener('click',"
+    "function(e){var a=e.target.closest('a[data-action]');if(a){"
+    "e.preventDefault();f.action=a.getAttribute('data-action');f.submit();"
+    "}});})(document.currentScript.previousElementSibling);"
+)
+
+semantic_colors = (
+    "primary",
+    "secondary",
+    "red",
+    "orange",
+    "yellow",
+    "olive",
+    "green",
+    "teal",
+    "blue",
+    "violet",
+    "purple",
+    "pink",
+    "brown",
+    "grey",
+    "black",
+)
+
+
+# =============================================================================
+# ROW FIELDS
+# =============================================================================
+
+
+def get_field(obj, field):
+    """Resolve ``field`` on ``obj`` the way Jinja resolves ``obj[field]``.
+
+    Subscription is tried first and attribute access second, so dicts,
+    named tuples and ORM objects are all supported. Dotted names walk
+    relationships, e.g. ``"author.name"``.
+
+    Raises
+    ------
+    LookupError
+        When any part of the path can't be resolved.
+    """
+    for name in field.split("."):
+        try:
+            obj = obj[name]
+        except (AttributeError, TypeError, LookupError):
+            try:
+                obj = getattr(obj, name)
+            except AttributeError:
+                raise LookupError(field) from None
+    return obj
+
+
+def _clear_titles_cache(*args):
+    """Forget the detected titles, e.g. when the mappers change."""
+    _titles_cache.clear()
+
+
+_titles_cache = {}
+
+if event is not None:  # pragma: no branch
+    event.listen(Mapper, "after_configured", _clear_titles_cache)
+
+
+def _row_columns(row):
+    """Return the cache key and a lister of the columns of ``row``.
+
+    Classes describing their own columns (SQLAlchemy models, dataclasses,
+    attrs classes and named tuples) are cached per class, while rows
+    whose columns depend on the query (``Row``, ``RowMapping`` and dicts)
+    are cached per class and keys.
+    """
+    cls = type(row)
+    table = getattr(cls, "__table__", None)
+    if table is not None:
+        return cls, table.columns.keys
+    if dataclasses is not None and dataclasses.is_dataclass(cls):
+        return cls, lambda: [f.name for f in dataclasses.fields(cls)]
+    attributes = getattr(cls, "__attrs_attrs__", None)
+    if attributes is not None:
+        return cls, lambda: [a.name for a in attributes]
+    fields = getattr(row, "_fields", None)
+    if fields is not None:
+        fields = tuple(fields)
+        return (cls, fields), lambda: fields
+    if isinstance(row, Mapping):
+        keys = tuple(row.keys())
+        return (cls, keys), lambda: keys
+    raise TypeError(f"Can't detect the table titles of {cls.__name__!r}")
+
+
+def _build_titles(row, columns, primary_key, primary_key_title):
+    """Build the ``(prop, label)`` titles of ``columns``."""
+    titles = [
+        (k, k.replace("_", " ").title())
+        for k in columns
+        if not k.startswith("_")
+    ]
+    if getattr(type(row), "__table__", None) is not None:
+        titles[0] = (primary_key, primary_key_title)
+    else:
+        titles = [
+            (k, primary_key_title if k == primary_key else title)
+            for k, title in titles
+        ]
+    return tuple(titles)
+
+
+def get_table_titles(data, primary_key, primary_key_title):
+    """Detect and build the table titles tuple from the first row.
+
+    The rows can be SQLAlchemy models, ``Row`` and ``RowMapping`` results,
+    dicts, named tuples, dataclasses or attrs classes. The titles are
+    cached per row type, so detecting them again costs a lookup.
+
+    .. note::
+        With SQLAlchemy models the first column is the primary key, with
+        other rows the ``primary_key`` column gets ``primary_key_title``.
+    """
+    if not data:
+        return []
+    row = data[0]
+    key, columns = _row_columns(row)
+    key = (key, primary_key, primary_key_title)
+    titles = _titles_cache.get(key)
+    if titles is None:
+        titles = _titles_cache[key] = _build_titles(
+            row, columns(), primary_key, primary_key_title
+        )
+    return list(titles)
+
+
+def _getitem(row, key):
+    """Read ``row[key]`` like Jinja does, ``""`` when it's undefined."""
+    try:
+        return row[key]
+    except (AttributeError, TypeError, LookupError):
+        return getattr(row, key, "")
+
+
+def _column_getter(key, sample):
+    """Pick the fastest accessor reading ``key`` from rows like ``sample``.
+
+    Jinja tries subscription before attribute access, the accessor keeps
+    that order and is chosen once per column instead of once per cell.
+    """
+    getter = operator.itemgetter(key)
+    try:
+        getter(sample)
+    except (AttributeError, TypeError, LookupError):
+        if "." not in key:
+            getter = operator.attrgetter(key)
+    return getter
+
+
+def _has_field(row, name):
+    """Tell if ``row`` already holds ``name`` without hitting the database.
+
+    Return ``True`` when the value is available, ``None`` when the row is
+    an ORM instance whose attribute is not loaded yet (reading it would
+    emit a lazy load) and ``False`` when the row doesn't have it at all.
+    """
+    state = getattr(row, "_sa_instance_state", None)
+    if state is not None and name in state.mapper.attrs:
+        return None if name in state.unloaded else True
+    try:
+        get_field(row, name)
+    except LookupError:
+        return False
+    return True
+
+
+def _row_key(row, primary_key):
+    """Read the primary key of ``row`` without hitting the database.
+
+    ORM instances that are expired, as they are after a commit, would
+    refresh themselves on attribute access; their key is taken from the
+    identity of their instance state instead.
+    """
+    state = getattr(row, "_sa_instance_state", None)
+    if state is not None and state.identity is not None:
+        mapper = state.mapper
+        keys = [
+            mapper.get_property_by_column(column).key
+            for column in mapper.primary_key
+        ]
+        if keys == [primary_key]:
+            return state.identity[0]
+    return get_field(row, primary_key)
+
+
+def _action_fields(actions):
+    """Collect the top level row fields referenced by the action URLs."""
+    fields = set()
+    for action in actions:
+        if not action or isinstance(action, str):
+            continue
+        for _, db_field in action[1]:
+            if db_field.startswith(":"):
+                fields.add(db_field[1:].split(".", 1)[0])
+    return fields
+
+
+def prefetch_action_records(data, model, primary_key, actions):
+    """Load in one query the records the action URLs can't read from rows.
+
+    The ``:field`` placeholders of the action URLs are resolved against
+    the rows being rendered. Only the rows lacking one of those fields,
+    or holding it unloaded, are fetched again with a single
+    ``WHERE pk IN (...)`` query, eagerly loading the relationships used by
+    ``:rel.field`` placeholders.
+
+    Parameters
+    ----------
+    data: ``iterable``
+        The rows of the table.
+    model: ``db.Model``
+        The model of the rows, may be ``None`` when every row carries the
+        fields used by the action URLs.
+    primary_key: ``str``
+        Primary key identifier for a single row.
+    actions: ``iterable``
+        URL strings or URL tuples of the table actions.
+
+    Return
+    ------
+        A ``dict`` mapping primary keys to the fetched records.
+    """
+    fields = _action_fields(actions)
+    if not fields:
+        return {}
+    pks, absent = [], False
+    for row in data:
+        status = [_has_field(row, name) for name in fields]
+        if not all(status):
+            pks.append(_row_key(row, primary_key))
+            absent = absent or False in status
+    if not pks:
+        return {}
+    if model is None:
+        if absent:
+            raise RuntimeError(_MODEL_REQUIRED)
+        return {}
+
+    mapper = model.__mapper__
+    query = model.query.filter(mapper.primary_key[0].in_(pks))
+    relationships = [name for name in fields if name in mapper.relationships]
+    if relationships and selectinload is not None:
+        query = query.options(
+            *(selectinload(getattr(model, name)) for name in relationships)
+        )
+    return {
+        mapper.primary_key_from_instance(record)[0]: record
+        for record in query
+    }
+
+
+def get_action_params(url_tuples, row, record=None):
+    """Build the ``url_for`` parameters of a table action for one row.
+
+    Parameters
+    ----------
+    url_tuples: ``list``
+        Tuples in the ``('url_parameter_name', ':db_model_fieldname')``
+        format, values not starting with ``:`` are passed unchanged.
+    row: ``object``
+        The row being rendered.
+    record: ``object``
+        The prefetched record of the row, used when the row lacks a field.
+
+    Return
+    ------
+        A ``dict`` of URL parameters.
+    """
+    params = {}
+    for url_parameter, db_field in url_tuples:
+        if not db_field.startswith(":"):
+            params[url_parameter] = db_field
+            continue
+        field = db_field[1:]
+        try:
+            params[url_parameter] = get_field(row, field)
+        except LookupError:
+            if record is None:
+                raise RuntimeError(_MODEL_REQUIRED) from None
+            params[url_parameter] = get_field(record, field)
+    return params
+
+
+class ActionUrl(object):
+    """URL of a table action, compiled once per table.
+
+    Fixed URL strings are returned as they are. URL tuples are compiled
+    into a :class:`~flask_semanticui.urls.UrlTemplate` whose placeholders
+    are the ``:db_model_fieldname`` parameters, so building the URL of a
+    row only substitutes its escaped values instead of calling
+    :func:`~flask.url_for`.
+
+    Parameters
+    ----------
+    action_url: ``str`` or ``tuple``
+        A fixed URL string or an URL tuple in the
+        ``('endpoint', [('url_parameter_name', ':db_model_fieldname')])``
+        format.
+    """
+
+    def __init__(self, action_url):
+        self.url = action_url
+        self.fields = []
+        self.template = None
+        if not action_url or isinstance(action_url, str):
+            return
+        endpoint, url_tuples = action_url[0], action_url[1]
+        values, fields = {}, {}
+        if not endpoint:
+            values.update(request.view_args)
+            values.update(request.args)
+        for url_parameter, db_field in url_tuples:
+            values[url_parameter] = db_field
+            fields.pop(url_parameter, None)
+            if db_field.startswith(":"):
+                fields[url_parameter] = db_field
+        self.fields = list(fields.items())
+        self.template = UrlTemplate(endpoint, values, fields)
+
+    def __call__(self, row, record=None):
+        """Return the URL of the action for ``row``."""
+        if self.template is None:
+            return self.url
+        return self.template.build(
+            get_action_params(self.fields, row, record)
+        )
+
+
+# =============================================================================
+# RENDERER
+# =============================================================================
+
+
+def _escape(value):
+    """Escape ``value`` as a plain ``str``.
+
+    Concatenating a :class:`~markupsafe.Markup` escapes the other operand,
+    so the renderer only joins plain strings.
+    """
+    return str(escape(value))
+
+
+def _csrf_token():
+    """Return the escaped CSRF token of Flask-WTF's ``csrf_token()``."""
+    csrf_token = current_app.jinja_env.globals.get("csrf_token")
+    if csrf_token is None:
+        raise RuntimeError(_CSRF_REQUIRED)
+    return _escape(csrf_token())
+
+
+def _render_icon(name, color):
+    """Python version of the ``render_ui_icon`` macro."""
+    if current_app.config.get("SEMANTIC_ICON_MODE") == "svg":
+        return str(current_app.extensions["semantic"].svg_icon(name, color))
+    if color in semantic_colors:
+        html = f'<i class="{_escape(name + " " + color)} icon"'
+    else:
+        html = f'<i class="{_escape(name)} icon"'
+    if color and color not in semantic_colors:
+        html += f' style="color: {_escape(color)}"'
+    return html + "></i>"
+
+
+class _TableRenderer(object):
+    """Render the markup of ``render_ui_table`` piece by piece.
+
+    Everything that doesn't depend on a row (header, icons, titles,
+    static URLs and column accessors) is computed once per table.
+    """
+
+    def __init__(
+        self,
+        titles,
+        primary_key="id",
+        caption=None,
+        caption_class=None,
+        caption_icon=None,
+        table_classes=None,
+        header_classes=None,
+        responsive=False,
+        responsive_class=None,
+        stackable_class=None,
+        model=None,
+        show_actions=False,
+        actions_title="Actions",
+        custom_actions=None,
+        view_url=None,
+        edit_url=None,
+        delete_url=None,
+        new_url=None,
+        delete_mode="form",
+    ):
+        self.titles = titles
+        self.primary_key = primary_key
+        self.caption = caption
+        self.caption_class = caption_class
+        self.caption_icon = caption_icon
+        self.table_classes = table_classes
+        self.header_classes = header_classes
+        self.responsive = responsive
+        self.responsive_class = responsive_class
+        self.stackable_class = stackable_class
+        self.model = model
+        self.show_actions = show_actions
+        self.actions_title = actions_title
+        self.custom_actions = custom_actions or []
+        self.view_url = view_url
+        self.edit_url = edit_url
+        self.delete_url = delete_url
+        self.new_url = new_url
+        self.shared_delete = (
+            show_actions and delete_url and delete_mode == "shared"
+        )
+        self.action_urls = [view_url, edit_url, delete_url] + [
+            action[2] for action in self.custom_actions
+        ]
+        self._columns = None
+        self._actions = None
+
+    def head(self):
+        """Return the markup up to the opening ``<tbody>``."""
+        config = current_app.config
+        html = []
+        if self.responsive:
+            html.append(f'\n<div class="ui {_escape(self.responsive_class)}">')
+        html.append('\n<table class="ui')
+        if self.stackable_class in ["stackable", "unstackable"]:
+            html.append(f" {_escape(self.stackable_class)}")
+        html.append(" celled table")
+        if self.table_classes:
+            html.append(f" {_escape(self.table_classes)}")
+        html.append('">')
+        if self.caption:
+            html.append("\n<div")
+            if self.caption_class:
+                html.append(f' class="{_escape(self.caption_class)}"')
+            html.append(">")
+            if self.caption_icon:
+                if config.get("SEMANTIC_ICON_MODE") == "svg":
+                    html.append(_render_icon(self.caption_icon, None))
+                else:
+                    icon = _escape(self.caption_icon)
+                    html.append(f'<i class="{icon} icon"></i>')
+            html.append(f"{_escape(self.caption)}</div>")
+        html.append("\n<thead")
+        if self.header_classes:
+            html.append(f' class="{_escape(self.header_classes)}"')
+        html.append(">\n<tr>")
+        html.extend(f"<th>{_escape(title[1])}</th>" for title in self.titles)
+        if self.show_actions:
+            html.append(f'<th scope="col">{_escape(self.actions_title)}')
+            if self.new_url:
+                if self.new_url.startswith("/"):
+                    url = self.new_url
+                else:
+                    url = url_for(self.new_url)
+                icon = _render_icon("plus", config["SEMANTIC_ICON_COLOR"])
+                title = config["SEMANTIC_TABLE_NEW_TITLE"]
+                html.append(
+                    f'<a class="ui item" href="{_escape(url)}" '
+                    f'title="{_escape(title)}">{icon}</a>'
+                )
+            html.append("</th>")
+        html.append("</tr>\n</thead>\n<tbody>")
+        return "".join(html)
+
+    def foot(self):
+        """Return the markup from the closing ``</tbody>``.
+
+        With the ``shared`` delete mode, it carries the single delete form
+        of the table and the script submitting it.
+        """
+        html = "\n</tbody>\n</table>"
+        if self.shared_delete:
+            html += (
+                '\n<form style="display:none" method="post"><input '
+                f'type="hidden" name="csrf_token" value="{_csrf_token()}"/>'
+                f"</form>\n<script>{delete_script}</script>"
+            )
+        if self.responsive:
+            html += "\n</div>"
+        return html
+
+    def _build_columns(self, sample):
+        """Build the ``(prefix, key, getter)`` of every column once."""
+        columns = []
+        for title in self.titles:
+            key = title[0]
+            if key == self.primary_key:
+                prefix = f'<td data-label="{_escape(title[1])}">'
+            else:
+                prefix = "<td>"
+            columns.append((prefix, key, _column_getter(key, sample)))
+        return columns
+
+    def _build_actions(self):
+        """Build the ``(prefix, url, suffix)`` of every action once.
+
+        ``url`` is ``None`` for fixed URL strings, already part of the
+        prefix, or the :class:`ActionUrl` to build for each row.
+        """
+        config = current_app.config
+        color = config["SEMANTIC_ICON_COLOR"]
+        links = [
+            (url, _escape(title), _render_icon(icon, color))
+            for title, icon, url in self.custom_actions
+        ]
+        if self.view_url:
+            title = _escape(config["SEMANTIC_TABLE_VIEW_TITLE"])
+            links.append((self.view_url, title, _render_icon("eye", color)))
+        if self.edit_url:
+            title = _escape(config["SEMANTIC_TABLE_EDIT_TITLE"])
+            icon = _render_icon("pencil", "green")
+            links.append((self.edit_url, title, icon))
+
+        actions = []
+        for url, title, icon in links:
+            suffix = f'" title="{title}">{icon}</a>'
+            actions.append(('<a class="ui item" href="', url, suffix))
+        if self.shared_delete:
+            title = _escape(config["SEMANTIC_TABLE_DELETE_TITLE"])
+            icon = _render_icon("trash", "red")
+            prefix = (
+                '<a class="ui item" href="javascript:{}" data-action="'
+            )
+            suffix = f'" title="{title}">{icon}</a>'
+            actions.append((prefix, self.delete_url, suffix))
+        elif self.delete_url:
+            csrf_token = _csrf_token()
+            title = _escape(config["SEMANTIC_TABLE_DELETE_TITLE"])
+            icon = _render_icon("trash", "red")
+            suffix = (
+                '" method="post"><input type="hidden" name="csrf_token" '
+                f'value="{csrf_token}"/><a class="ui item" '
+                'href="javascript:{}" '
+                "onclick=\"this.closest('form').submit();return false;\" "
+                f'title="{title}">{icon}</a></form>'
+            )
+            prefix = '<form style="display:inline" action="'
+            actions.append((prefix, self.delete_url, suffix))
+
+        return [
+            (prefix + _escape(url), None, suffix)
+            if isinstance(url, str)
+            else (prefix, ActionUrl(url), suffix)
+            for prefix, url, suffix in actions
+        ]
+
+    def rows(self, data, records=None):
+        """Return the list of markup pieces of the ``<tr>`` for ``data``."""
+        html = []
+        append = html.append
+        primary_key = self.primary_key
+        columns = self._columns
+        actions = self._actions
+        for row in data:
+            if columns is None:
+                columns = self._columns = self._build_columns(row)
+            append("\n<tr>")
+            for prefix, key, getter in columns:
+                try:
+                    value = getter(row)
+                except (AttributeError, TypeError, LookupError):
+                    value = _getitem(row, key)
+                append(f"{prefix}{_escape(value)}</td>")
+            if self.show_actions:
+                if actions is None:
+                    actions = self._actions = self._build_actions()
+                record = records.get(_getitem(row, primary_key))
+                append("<td>")
+                for prefix, url, suffix in actions:
+                    append(prefix)
+                    if url is not None:
+                        append(_escape(url(row, record)))
+                    append(suffix)
+                append("</td>")
+            append("</tr>")
+        return html
+
+    def records(self, data):
+        """Prefetch the records the action URLs of ``data`` need."""
+        if not self.show_actions:
+            return {}
+        return prefetch_action_records(
+            data, self.model, self.primary_key, self.action_urls
+        )
+
+    def render(self, data):
+        """Return the whole table markup for ``data``."""
+        html = [self.head()]
+        html.extend(self.rows(data, self.records(data)))
+        html.append(self.foot())
+        return "".join(html)
+
+
+def render_table(
+    data,
+    titles=None,
+    primary_key="id",
+    primary_key_title="#",
+    **kwargs,
+):
+    """Render a Semantic table with given data, in Python.
+
+    This is a faster version of the ``render_ui_table`` macro returning
+    the very same markup: it accepts the same arguments, hoists the markup
+    that doesn't depend on the rows out of the row loop and reads the
+    cells with precomputed accessors.
+
+    Parameters
+    ----------
+    data: ``list``
+        The rows of the table, ORM objects, dicts or any object.
+    titles: ``list``
+        Tuples in the ``(prop, label)`` format, detected from ``data``
+        when not given.
+    primary_key: ``str``
+        Primary key identifier for a single row.
+    primary_key_title: ``str``
+        Primary key title for a single row.
+    kwargs:
+        The other keyword arguments of ``render_ui_table``.
+
+    Return
+    ------
+        The table markup.
+    """
+    kwargs.pop("action_pk_placeholder", None)
+    if not titles:
+        titles = get_table_titles(data, primary_key, primary_key_title)
+    renderer = _TableRenderer(titles, primary_key, **kwargs)
+    return Markup(renderer.render(data))
+
+
+def stream_table(
+    data,
+    titles=None,
+    primary_key="id",
+    primary_key_title="#",
+    chunk_size=100,
+    **kwargs,
+):
+    """Render a Semantic table with given data, chunk by chunk.
+
+    Like :func:`render_table` but ``data`` may be any iterable, e.g. a
+    generator or a SQLAlchemy query using ``yield_per``. The markup up to
+    ``<tbody>`` is yielded first and then the rows in chunks of
+    ``chunk_size``, so only one chunk of rows is held in memory at a time.
+    The records needed by the action URLs are prefetched chunk by chunk.
+
+    Use it with :func:`~flask.stream_with_context`, the rows are rendered
+    while the response is sent::
+
+        @app.route("/messages")
+        def messages():
+            rows = Message.query.yield_per(500)
+            return Response(
+                stream_with_context(stream_table(rows, chunk_size=500))
+            )
+
+    Parameters
+    ----------
+    data: ``iterable``
+        The rows of the table.
+    titles: ``list``
+        Tuples in the ``(prop, label)`` format, detected from the first
+        row when not given.
+    primary_key: ``str``
+        Primary key identifier for a single row.
+    primary_key_title: ``str``
+        Primary key title for a single row.
+    chunk_size: ``int``
+        Number of rows rendered per yielded chunk.
+    kwargs:
+        The other keyword arguments of ``render_ui_table``.
+
+    Yield
+    -----
+        The table markup, as :class:`~markupsafe.Markup` chunks.
+    """
+    kwargs.pop("action_pk_placeholder", None)
+    rows = iter(data)
+    if not titles:
+        first = next(rows, None)
+        if first is None:
+            titles = []
+        else:
+            titles = get_table_titles([first], primary_key, primary_key_title)
+            rows = itertools.chain([first], rows)
+    renderer = _TableRenderer(titles, primary_key, **kwargs)
+    yield Markup(renderer.head())
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            break
+        yield Markup("".join(renderer.rows(chunk, renderer.records(chunk))))
+    yield Markup(renderer.foot())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =============================================================================
+# DOCS
+# =============================================================================
+
+"""Flask-SemanticUI.
+
+URL templates built once with :func:`~flask.url_for` and filled many times.
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+
+from urllib.parse import quote_plus
+
+from flask import current_app, request, url_for
+
+from werkzeug.routing import BuildError
+
+
+_STRING_SENTINEL = "SUIURL{}Z"
+
+_NUMBER_SENTINEL = 987654321000000
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def _quote_query(value):
+    """Quote a query string value like :func:`~werkzeug.urls.url_encode`."""
+    return quote_plus(str(value), safe="")
+
+
+def _sentinel(converter, index):
+    """Find a value ``converter`` writes unchanged into the URL.
+
+    Return ``None`` when the converter can't be templated, e.g. when it
+    reformats every value it's given.
+    """
+    for sentinel in (
+        _STRING_SENTINEL.format(index),
+        _NUMBER_SENTINEL + index,
+    ):
+        try:
+            if converter.to_url(sentinel) == str(sentinel):
+                return sentinel
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+def _endpoint_rule(endpoint):
+    """Return the only rule of ``endpoint``, or ``None``."""
+    if endpoint[:1] == ".":
+        blueprint = request.blueprint if request else None
+        if blueprint is None:
+            return None
+        endpoint = blueprint + endpoint
+    try:
+        rules = list(current_app.url_map.iter_rules(endpoint))
+    except KeyError:
+        return None
+    return rules[0] if len(rules) == 1 else None
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class UrlTemplate(object):
+    """URL of an endpoint built once and filled with per-call values.
+
+    :func:`~flask.url_for` is called a single time, with a sentinel value
+    for each placeholder. Every :meth:`build` then only joins the static
+    parts of that URL with the placeholder values, escaped by the very
+    converter of the rule (or quoted like the query string).
+
+    The template falls back to :func:`~flask.url_for` on every build when
+    the endpoint has several rules, when a converter can't be templated,
+    or for values :func:`~flask.url_for` treats specially (``None``,
+    lists, tuples and bytes).
+
+    Parameters
+    ----------
+    endpoint: ``str``
+        The endpoint of the URL.
+    values: ``dict``
+        The arguments passed to :func:`~flask.url_for`, in order. The
+        values of the placeholders don't matter.
+    placeholders: ``iterable``
+        The names of the arguments given to each :meth:`build`.
+    """
+
+    def __init__(self, endpoint, values, placeholders):
+        self.endpoint = endpoint
+        self.values = dict(values)
+        self.placeholders = tuple(placeholders)
+        self._parts = None
+        self._quoters = None
+        self._compile()
+
+    def _compile(self):
+        """Build the URL with sentinels and split it around them."""
+        if not self.endpoint:
+            return
+        rule = _endpoint_rule(self.endpoint)
+        if rule is None:
+            return
+        values = dict(self.values)
+        quoters = {}
+        for index, name in enumerate(self.placeholders):
+            if name.startswith("_"):
+                return
+            if name in rule.arguments:
+                converter = rule._converters[name]
+                sentinel = _sentinel(converter, index)
+                if sentinel is None:
+                    return
+                quoters[name] = converter.to_url
+            else:
+                sentinel = _STRING_SENTINEL.format(index)
+                quoters[name] = _quote_query
+            values[name] = sentinel
+        try:
+            url = url_for(self.endpoint, **values)
+        except BuildError:
+            return
+
+        positions = []
+        for name in self.placeholders:
+            sentinel = str(values[name])
+            if url.count(sentinel) != 1:
+                return
+            positions.append((url.index(sentinel), name, sentinel))
+        positions.sort()
+
+        parts, start = [], 0
+        for position, name, sentinel in positions:
+            parts.append(url[start:position])
+            start = position + len(sentinel)
+        parts.append(url[start:])
+        self._parts = parts
+        self._quoters = [(name, quoters[name]) for _, name, _ in positions]
+
+    def build(self, params):
+        """Return the URL for the placeholder values in ``params``."""
+        if self._parts is not None:
+            parts = self._parts
+            html = [parts[0]]
+            try:
+                for index, (name, quote) in enumerate(self._quoters, 1):
+                    value = params[name]
+                    if value is None or isinstance(
+                        value, (list, tuple, bytes)
+                    ):
+                        break
+                    html.append(quote(value))
+                    html.append(parts[index])
+                else:
+                    return "".join(html)
+            except (TypeError, ValueError):
+                pass
+        values = dict(self.values)
+        values.update(params)
+        return url_for(self.endpoint, **values)
+
+
+# =============================================================================
+# PAGINATION
+# =============================================================================
+
+
+def page_url_builder(endpoint, values=None, name="page"):
+    """Return a function building the URL of a page number.
+
+    The URL is templated once with :class:`UrlTemplate`, so the links of
+    a pagination widget cost a string join each instead of a
+    :func:`~flask.url_for` call. The arguments keep the order
+    ``url_for(endpoint, **values, page=page)`` would give them.
+
+    Parameters
+    ----------
+    endpoint: ``str``
+        The endpoint of the pages.
+    values: ``dict``
+        The other arguments passed to :func:`~flask.url_for`.
+    name: ``str``
+        The name of the page number argument.
+
+    Return
+    ------
+        A function taking a page number and returning its URL.
+    """
+    values = dict(values or {})
+    values.setdefault(name, None)
+    template = UrlTemplate(endpoint, values, [name])
+
+    def page_url(page):
+        return template.build({name: page})
+
+    return page_url
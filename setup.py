@@ -31,6 +31,11 @@ PATH = pathlib.Path(os.path.abspath(os.path.dirname(__file__)))
 
 REQUIREMENTS = ["Flask>=2.0.2"]
 
+EXTRAS_REQUIREMENTS = {
+    "brotli": ["Brotli>=1.0.9"],
+    "icons": ["fonttools>=4.0", "Brotli>=1.0.9"],
+}
+
 with open(PATH / "flask_semanticui" / "__init__.py") as fp:
     for line in fp.readlines():
         if line.startswith("__version__ = "):
@@ -60,6 +65,7 @@ setup(
     platforms="any",
     license="The MIT License",
     install_requires=REQUIREMENTS,
+    extras_require=EXTRAS_REQUIREMENTS,
     keywords=["Semantic-UI", "Flask", "Framework CSS"],
     classifiers=[
         "Development Status :: 4 - Beta",
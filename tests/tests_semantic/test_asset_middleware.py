@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import gzip
+import re
+
+import flask
+
+from flask_semanticui import SemanticUI
+from flask_semanticui.assets import get_manifest
+from flask_semanticui.fonts import LOCAL_STYLESHEET
+from flask_semanticui.middleware import AssetMiddleware, accepted_encodings
+
+import pytest as pt
+
+from werkzeug.test import Client
+
+
+@pt.fixture
+def semantic():
+    # Installing the middleware needs the settings before init_app.
+    return None
+
+
+@pt.fixture
+def hooks():
+    return []
+
+
+@pt.fixture
+def app(hooks):
+    app = flask.Flask(__name__)
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    app.config["SEMANTIC_FINGERPRINT"] = True
+    app.config["SEMANTIC_ASSET_MIDDLEWARE"] = True
+    SemanticUI(app)
+
+    @app.before_request
+    def count():
+        hooks.append(flask.request.path)
+
+    @app.route("/")
+    def index():
+        return flask.render_template_string("{{ semantic.load_css() }}")
+
+    return app
+
+
+@pt.mark.parametrize(
+    "header, expected",
+    [
+        ("", ()),
+        ("gzip", ("gzip",)),
+        ("gzip;q=0.5, br", ("br", "gzip")),
+        ("*;q=0.1, br;q=0", ("gzip",)),
+    ],
+)
+def test_accepted_encodings(header, expected):
+    if "br" in expected:
+        pt.importorskip("brotli")
+    assert accepted_encodings(header)[: len(expected)] == expected
+
+
+def test_middleware_serves_assets_without_flask(app, hooks):
+    assert isinstance(app.wsgi_app, AssetMiddleware)
+    client = app.test_client()
+    css_url = re.search(
+        r'href="([^"]+)"', client.get("/").get_data(as_text=True)
+    ).group(1)
+    assert hooks == ["/"]
+
+    response = client.get(css_url)
+    assert response.status_code == 200
+    assert response.content_type == "text/css; charset=utf-8"
+    assert response.cache_control.immutable
+    assert response.vary.as_set() == {"accept-encoding"}
+    manifest = get_manifest()
+    name = manifest.url_path(LOCAL_STYLESHEET)
+    assert response.get_data() == manifest.files[name].data
+    assert response.content_length == len(response.get_data())
+
+    etag = response.headers["ETag"]
+    response = client.get(css_url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert response.headers["ETag"] == etag
+
+    response = client.head(css_url)
+    assert response.get_data() == b""
+    assert int(response.headers["Content-Length"]) > 0
+
+    response = client.get(css_url, headers={"Accept-Encoding": "gzip"})
+    assert response.content_encoding == "gzip"
+    assert gzip.decompress(response.get_data()) == manifest.files[name].data
+    assert response.headers["ETag"] != etag
+
+    response = client.get("/static/semantic/js/semantic/jquery.min.js")
+    assert response.status_code == 200
+    assert response.cache_control.no_cache
+    assert response.content_type.endswith("javascript; charset=utf-8")
+    assert hooks == ["/"]
+
+
+def test_middleware_falls_back_to_flask(app, hooks):
+    client = app.test_client()
+    url = "/static/semantic/css/semantic.min.css"
+    response = client.get(url, headers={"Range": "bytes=0-9"})
+    assert response.status_code == 206
+    assert response.get_data() == b" /*\n * # S"
+    assert client.post(url).status_code == 405
+    assert client.get("/static/semantic/missing.css").status_code == 404
+    assert hooks == [url, url, "/static/semantic/missing.css"]
+
+
+def test_middleware_plain_max_age():
+    calls = []
+
+    def wsgi_app(environ, start_response):
+        calls.append(environ["PATH_INFO"])
+        start_response("404 NOT FOUND", [])
+        return []
+
+    middleware = AssetMiddleware(wsgi_app, "/assets/", max_age=60)
+    client = Client(middleware, flask.Response)
+    response = client.get("/assets/css/semantic.min.css")
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    response = client.get("/static/semantic/css/semantic.min.css")
+    assert response.status_code == 404
+    assert calls == ["/static/semantic/css/semantic.min.css"]
+
+
+def test_middleware_exclude():
+    middleware = AssetMiddleware(
+        lambda environ, start_response: [],
+        "/assets",
+        exclude=lambda path: path.endswith(".eot"),
+    )
+    assert "/assets/css/semantic.min.css" in middleware.table
+    assert not [path for path in middleware.table if path.endswith(".eot")]
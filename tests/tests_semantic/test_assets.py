@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import gzip
+import hashlib
+import json
+import re
+
+import flask
+
+from flask_semanticui import SemanticUI, assets
+from flask_semanticui.assets import (
+    AssetManifest,
+    MANIFEST_NAME,
+    STATIC_ROOT,
+    collect_assets,
+    compress_assets,
+    get_manifest,
+    hashed_name,
+    rewrite_css_urls,
+)
+from flask_semanticui.sri import integrity
+
+import pytest as pt
+
+
+@pt.fixture
+def static(tmp_path):
+    fonts = tmp_path / "css" / "fonts"
+    fonts.mkdir(parents=True)
+    (fonts / "icons.woff2").write_bytes(b"woff2")
+    (fonts / "icons.eot").write_bytes(b"eot")
+    (tmp_path / "css" / "site.css").write_text(
+        "@import url(https://fonts.example.com/css);"
+        "a{src:url(fonts/icons.eot?#iefix),url('fonts/icons.woff2')}"
+        "b{background:url(data:image/png;base64,AA==)}"
+    )
+    (tmp_path / "app.js").write_bytes(b"var a = 1;" * 100)
+    return tmp_path
+
+
+@pt.mark.parametrize(
+    "path, expected",
+    [
+        ("css/semantic.min.css", "css/semantic.min.0123abcd.css"),
+        ("js/jquery", "js/jquery.0123abcd"),
+        ("v1.2/LICENSE", "v1.2/LICENSE.0123abcd"),
+    ],
+)
+def test_hashed_name(path, expected):
+    assert hashed_name(path, "0123abcdef") == expected
+
+
+def test_rewrite_css_urls():
+    css = (
+        "a{src:url(../fonts/a.eot?#iefix) url( \"b.svg#icons\" )"
+        " url(/c.png) url(//d.png) url(http://e.png) url(data:,x)}"
+    )
+    names = {"fonts/a.eot": "fonts/a.1.eot", "css/b.svg": "css/b.2.svg"}
+    assert rewrite_css_urls(css, "css/site.css", names.get) == (
+        "a{src:url(../fonts/a.1.eot?#iefix) url(\"b.2.svg#icons\")"
+        " url(/c.png) url(//d.png) url(http://e.png) url(data:,x)}"
+    )
+
+
+def test_asset_manifest(static):
+    manifest = AssetManifest(static)
+    woff2 = hashlib.sha256(b"woff2").hexdigest()
+    assert manifest.url_path("css/fonts/icons.woff2") == (
+        f"css/fonts/icons.{woff2[:8]}.woff2"
+    )
+    assert manifest.url_path("missing.css") == "missing.css"
+
+    site = manifest.files[manifest.url_path("css/site.css")]
+    css = site.data.decode("utf-8")
+    assert f"url('fonts/icons.{woff2[:8]}.woff2')" in css
+    assert "url(fonts/icons.eot?#iefix)" not in css
+    assert "url(https://fonts.example.com/css)" in css
+    assert site.digest == hashlib.sha256(site.data).hexdigest()
+    assert site.digest[:8] in manifest.names["css/site.css"]
+    assert manifest.files[manifest.url_path("app.js")].data is None
+
+
+def test_bundled_stylesheet_uses_hashed_fonts():
+    manifest = get_manifest()
+    assert get_manifest(STATIC_ROOT) is manifest
+    name = manifest.url_path("css/semantic.min.css")
+    assert re.fullmatch(r"css/semantic\.min\.[0-9a-f]{8}\.css", name)
+    css = manifest.files[name].data.decode("utf-8")
+    fonts = re.findall(r"url\((themes/[^)?#]+)", css)
+    assert fonts
+    for font in fonts:
+        assert f"css/{font}" in manifest.files
+        assert f"css/{font}" not in manifest.names
+
+
+def test_serve_hashed_assets(app, client):
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    app.config["SEMANTIC_FINGERPRINT"] = True
+    data = client.get("/").get_data(as_text=True)
+    urls = re.findall(r'(?:href|src)="([^"]+)"', data)
+    assert len(urls) == 3
+    for url in urls:
+        assert re.search(r"/static/semantic/.+\.[0-9a-f]{8}\.(css|js)$", url)
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+        assert response.cache_control.max_age == 31536000
+        assert response.cache_control.public
+        etag, weak = response.get_etag()
+        assert not weak
+        response = client.get(url, headers={"If-None-Match": f'"{etag}"'})
+        assert response.status_code == 304
+
+    response = client.get(urls[0])
+    assert response.mimetype == "text/css"
+    css = response.get_data(as_text=True)
+    font = re.search(r"url\((themes/[^)?#]+)", css).group(1)
+    response = client.get(urls[0].rsplit("/", 1)[0] + "/" + font)
+    assert response.status_code == 200
+    assert response.cache_control.immutable
+
+    response = client.get("/static/semantic/css/semantic.min.css")
+    assert response.status_code == 200
+    assert not response.cache_control.immutable
+    assert client.get("/static/semantic/css/nope.css").status_code == 404
+    assert client.get("/static/semantic/../core.py").status_code == 404
+
+
+@pt.mark.parametrize(
+    "accept, encoding",
+    [
+        ("", None),
+        ("gzip, deflate", "gzip"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("*", "gzip"),
+        ("gzip;q=0, identity", None),
+        ("deflate", None),
+    ],
+)
+def test_serve_compressed_assets(app, static, monkeypatch, accept, encoding):
+    monkeypatch.setitem(assets.ENCODINGS, "br", (".br", None))
+    manifest = AssetManifest(static)
+    name = manifest.url_path("css/site.css")
+    with app.test_request_context(headers={"Accept-Encoding": accept}):
+        response = manifest.send(name)
+        response.direct_passthrough = False
+        data = response.get_data()
+    assert response.content_encoding == encoding
+    assert "Accept-Encoding" in response.vary
+    assert response.cache_control.immutable
+    css = manifest.files[name].data
+    if encoding is None:
+        assert data == css
+        assert response.get_etag() == (manifest.files[name].digest, False)
+    else:
+        assert gzip.decompress(data) == css
+        assert response.get_etag()[0].endswith("-gzip")
+
+    with app.test_request_context(headers={"Accept-Encoding": accept}):
+        response = manifest.send(manifest.url_path("css/fonts/icons.woff2"))
+    assert response.content_encoding is None
+    assert "Accept-Encoding" not in response.vary
+
+
+def test_compress_assets_writes_sidecars(
+    app, static, monkeypatch, tmp_path_factory
+):
+    monkeypatch.setitem(assets.ENCODINGS, "br", (".br", None))
+    output = tmp_path_factory.mktemp("sidecars")
+    written = compress_assets(output, static)
+    assert sorted(path.relative_to(output) for path in written) == sorted(
+        path.relative_to(output) for path in output.rglob("*.gz")
+    )
+    assert not list(static.rglob("*.gz"))
+
+    written = compress_assets(static, static)
+    manifest = AssetManifest(static)
+    hashed_css = manifest.url_path("css/site.css").rsplit("/", 1)[1]
+    assert sorted(path.relative_to(static).as_posix() for path in written) == [
+        "app.js.gz",
+        f"css/{hashed_css}.gz",
+        "css/site.css.gz",
+    ]
+    assert "app.js.gz" not in manifest.files
+
+    (static / "app.js.gz").write_bytes(gzip.compress(b"sidecar"))
+    with app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        response = manifest.send("app.js")
+        response.direct_passthrough = False
+        assert gzip.decompress(response.get_data()) == b"sidecar"
+
+        (static / "app.js").write_bytes(b"var b = 2;" * 100)
+        response = AssetManifest(static).send("app.js")
+        response.direct_passthrough = False
+        assert gzip.decompress(response.get_data()) == b"var b = 2;" * 100
+
+
+def test_serve_brotli_assets(app, static):
+    brotli = pt.importorskip("brotli")
+    manifest = AssetManifest(static)
+    with app.test_request_context(headers={"Accept-Encoding": "gzip, br"}):
+        response = manifest.send("app.js")
+        response.direct_passthrough = False
+    assert response.content_encoding == "br"
+    assert brotli.decompress(response.get_data()) == b"var a = 1;" * 100
+
+
+def test_collect_assets(static, tmp_path_factory):
+    output = tmp_path_factory.mktemp("collected")
+    manifest = AssetManifest(static)
+    written = collect_assets(
+        manifest,
+        output,
+        exclude=lambda path: path.endswith(".eot"),
+        encodings=["gzip"],
+    )
+    hashed_css = manifest.url_path("css/site.css")
+    names = json.loads((output / MANIFEST_NAME).read_text())
+    assert names == {
+        "app.js": manifest.url_path("app.js"),
+        "css/fonts/icons.woff2": manifest.url_path("css/fonts/icons.woff2"),
+        "css/site.css": hashed_css,
+    }
+    assert len(written) == 2 * 3 + 2 * 2 + 1
+    assert not list(output.rglob("*.eot"))
+    assert not (output / "css/fonts/icons.woff2.gz").exists()
+    assert (output / hashed_css).read_bytes() == (
+        manifest.files[hashed_css].read()
+    )
+    assert names["css/fonts/icons.woff2"].split("/")[-1] in (
+        (output / hashed_css).read_text()
+    )
+    app_js = (output / "app.js.gz").read_bytes()
+    assert gzip.decompress(app_js) == b"var a = 1;" * 100
+
+
+def test_cli_collect(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(assets.ENCODINGS, "br", (".br", None))
+    static_url = "https://static.example.com/semantic/"
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    app.config["SEMANTIC_ASSET_PROFILE"] = "modern"
+    app.config["SEMANTIC_ICON_MODE"] = "svg"
+    app.config["SEMANTIC_SVG_ICONS"] = ["github"]
+    app.config["SEMANTIC_JS_MODULES"] = "macros"
+    app.config["SEMANTIC_STATIC_URL"] = static_url
+
+    @app.route("/icon")
+    def icon():
+        return flask.render_template_string(
+            "{{ semantic.load_css() }}{{ semantic.load_js() }}"
+            "{{ semantic.svg_icon('github') }}"
+        )
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["semantic", "collect", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert str(tmp_path) in result.output
+    assert not list(tmp_path.rglob("*.eot"))
+    names = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert (tmp_path / names["js/semantic/jquery.min.js"]).is_file()
+
+    # The tags point at the collected files.
+    page = app.test_client().get("/icon").get_data(as_text=True)
+    *urls, sprite = re.findall(r'(?:href|src)="([^"#]+)', page)
+    assert len(urls) == 3
+    assert "/semantic.macros.min." in urls[-1]
+    for url in urls:
+        assert url.startswith(static_url)
+        path = tmp_path / url.replace(static_url, "", 1)
+        assert re.search(r"\.[0-9a-f]{8}\.(css|js|svg)$", path.name)
+        assert path.is_file()
+        assert path.with_name(path.name + ".gz").is_file()
+    css = (tmp_path / urls[0].replace(static_url, "", 1)).read_bytes()
+    assert f'integrity="{integrity(css)}"' in page
+
+    # <use> only reads sprites of the page origin, the application serves
+    # the sprite unless SEMANTIC_STATIC_URL is on that origin.
+    assert sprite.startswith("/static/semantic/")
+    path = sprite.replace("/static/semantic/", "", 1)
+    assert (tmp_path / path).is_file()
+    app.config["SEMANTIC_STATIC_URL"] = "/assets/semantic/"
+    page = app.test_client().get("/icon").get_data(as_text=True)
+    assert f'<use href="/assets/semantic/{path}#github"/>' in page
+
+
+def test_static_url_auto_modules(app):
+    app.config["SEMANTIC_STATIC_URL"] = "https://static.example.com/semantic/"
+    app.config["SEMANTIC_JS_MODULES"] = "auto"
+    with pt.raises(ValueError):
+        SemanticUI(app)
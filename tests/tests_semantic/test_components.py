@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import re
+
+from flask_semanticui import SemanticUI
+from flask_semanticui.assets import STATIC_ROOT
+from flask_semanticui.components import (
+    COMPONENTS,
+    build_bundle,
+    bundle_path,
+    critical_css,
+    resolve_components,
+    split_components,
+    write_components,
+)
+from flask_semanticui.fonts import use_local_fonts
+from flask_semanticui.sri import integrity
+
+import pytest as pt
+
+
+FULL = (STATIC_ROOT / "css/semantic.min.css").read_text(encoding="utf-8")
+
+
+@pt.fixture
+def semantic():
+    # The components are set up by init_app.
+    return None
+
+
+def test_split_components():
+    components = split_components(FULL)
+    assert tuple(components) == COMPONENTS
+    assert "".join(components.values()) == FULL
+    assert components["reset"].lstrip().startswith("/*\n * # Semantic UI")
+    assert "@import url(https://fonts.googleapis.com" in components["reset"]
+    assert components["menu"].startswith(".ui.menu{")
+    assert ".ui.grid{" in components["grid"]
+    assert ".ui.menu{" not in components["grid"]
+    assert ".ui.cards>.card{" in components["card"]
+    assert ".ui.cards>.card{" not in components["item"]
+    assert "# Semantic UI 2.4.2 - Video" in components["embed"]
+    with pt.raises(ValueError):
+        split_components("body{}")
+
+
+def test_shipped_components_are_up_to_date(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css/semantic.min.css").write_text(FULL, encoding="utf-8")
+    for path in write_components(tmp_path):
+        shipped = STATIC_ROOT / path.relative_to(tmp_path)
+        assert shipped.read_bytes() == path.read_bytes()
+    icon = (tmp_path / "css/components/icon.min.css").read_text()
+    assert "url(../themes/default/assets/fonts/icons.woff2)" in icon
+
+
+def test_resolve_components():
+    assert resolve_components(["table", "button"]) == (
+        "reset",
+        "site",
+        "button",
+        "table",
+    )
+    assert resolve_components(True) == resolve_components("macros")
+    assert "menu" in resolve_components("macros")
+    for components in ("everything", ["table", "tabel"]):
+        with pt.raises(ValueError):
+            resolve_components(components)
+
+
+def test_build_bundle():
+    assert bundle_path(True) == "css/semantic.macros.min.css"
+    custom = bundle_path(["table"])
+    assert re.fullmatch(r"css/semantic\.custom-[0-9a-f]{8}\.min\.css", custom)
+    assert bundle_path({"site", "table"}) == custom
+
+    path, full = build_bundle(COMPONENTS)
+    assert full == use_local_fonts(FULL, path).encode("utf-8")
+
+    path, css = build_bundle("macros")
+    assert path == "css/semantic.macros.min.css"
+    assert len(css) < len(full) / 2
+    css = css.decode("utf-8")
+    for selector in (".ui.form{", ".ui.table{", ".ui.pagination.menu"):
+        assert selector in css
+    for selector in (".ui.modal{", ".ui.dropdown{display", "}.ui.grid{"):
+        assert selector not in css
+    assert "url(themes/default/assets/fonts/icons.woff2)" in css
+
+
+@pt.mark.parametrize("fingerprint", [False, True])
+def test_load_css_serves_the_components(app, client, fingerprint):
+    app.config["SEMANTIC_COMPONENTS"] = ["table", "icon"]
+    app.config["SEMANTIC_FINGERPRINT"] = fingerprint
+    SemanticUI(app)
+
+    page = client.get("/").get_data(as_text=True)
+    href, sri = re.search(
+        r'<link rel="stylesheet" href="([^"]+)" integrity="([^"]+)"', page
+    ).groups()
+    assert "/static/semantic/css/semantic.custom-" in href
+
+    response = client.get(href)
+    assert response.status_code == 200
+    css = response.get_data()
+    assert sri == integrity(css)
+    assert b".ui.table{" in css
+    assert b".ui.button{" not in css
+    font = re.search(rb"url\((themes/default/assets/fonts/[^)]+)\)", css)
+    font_url = href.rsplit("/", 1)[0] + "/" + font.group(1).decode()
+    assert client.get(font_url).status_code == 200
+
+    assert "cdn.jsdelivr.net/npm/jquery@3.1.1" in page
+
+
+def test_unknown_components_fail_early(app):
+    app.config["SEMANTIC_COMPONENTS"] = "everything"
+    with pt.raises(ValueError):
+        SemanticUI(app)
+
+
+def test_critical_css():
+    css = critical_css()
+    assert css is critical_css(None)
+    assert len(css) < 25 * 1024
+    for selector in (".ui.menu{", ".ui.form .field{", ".ui.message{"):
+        assert selector in css
+    for selector in (".ui.table{", ":hover", "@font-face", "@import"):
+        assert selector not in css
+    assert "url(" not in css
+
+    css = critical_css(["table", "menu"])
+    assert ".ui.menu{" in css
+    assert ".ui.form" not in css
+    assert ".ui.table{" not in css
+
+
+def test_load_css_critical(app, client):
+    app.config["SEMANTIC_COMPONENTS"] = "macros"
+    SemanticUI(app)
+    with app.test_request_context():
+        tags = app.jinja_env.globals["semantic"].load_css(mode="critical")
+        link = app.jinja_env.globals["semantic"].load_css()
+        with pt.raises(ValueError):
+            app.jinja_env.globals["semantic"].load_css(mode="inline")
+
+    url, sri = re.search(r'href="([^"]+)" integrity="([^"]+)"', link).groups()
+    assert tags == (
+        f"<style>{critical_css('macros')}</style>\n"
+        f'<link rel="preload" href="{url}" as="style" integrity="{sri}" '
+        'crossorigin="anonymous" '
+        "onload=\"this.onload=null;this.rel='stylesheet'\">\n"
+        f'<noscript><link rel="stylesheet" href="{url}" integrity="{sri}" '
+        'crossorigin="anonymous"></noscript>'
+    )
+
+
+def test_load_css_critical_from_cdn(app, client):
+    semantic = SemanticUI(app)
+    with app.test_request_context():
+        tags = semantic.load_css(mode="critical")
+    assert tags.startswith(f"<style>{critical_css()}</style>")
+    assert (
+        '<link rel="preload" href="https://cdn.jsdelivr.net/npm/semantic-ui'
+        '@2.4.2/dist/semantic.min.css" as="style" '
+        f'integrity="{semantic.semantic_css_integrity}"'
+    ) in tags
+
+
+def test_load_css_critical_follows_components(app, client):
+    semantic = SemanticUI(app)
+    with app.test_request_context():
+        assert semantic.load_css(mode="critical").startswith(
+            f"<style>{critical_css()}</style>"
+        )
+        app.config["SEMANTIC_COMPONENTS"] = ["table", "menu"]
+        assert semantic.load_css(mode="critical").startswith(
+            f"<style>{critical_css(['table', 'menu'])}</style>"
+        )
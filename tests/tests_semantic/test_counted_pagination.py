@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from flask import render_template_string, request
+
+from flask_semanticui import (
+    CachedCount,
+    CappedCount,
+    CountedPagination,
+    ExactCount,
+    ProbeCount,
+)
+
+from flask_sqlalchemy import SQLAlchemy
+
+import pytest as pt
+
+from sqlalchemy import event, select
+
+from werkzeug.exceptions import NotFound
+
+
+@pt.fixture
+def message_model(app):
+    db = SQLAlchemy(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+
+    with app.app_context():
+        db.create_all()
+        for i in range(1, 101):
+            db.session.add(Message(text="even" if i % 2 else "odd"))
+        db.session.commit()
+    return db, Message
+
+
+@pt.fixture
+def statements(message_model, app):
+    db, _ = message_model
+    statements = []
+    with app.app_context():
+        event.listen(
+            db.engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+    return statements
+
+
+def counts(statements):
+    return sum("count(" in sql.lower() for sql in statements)
+
+
+@pt.mark.parametrize("count", [None, ExactCount(), CachedCount()])
+def test_exact_counts_match_paginate(app, message_model, count):
+    db, Message = message_model  # noqa: N806
+    query = Message.query.order_by(Message.id)
+    with app.test_request_context("/"):
+        for page in (1, 3, 10):
+            expected = query.paginate(page, 10)
+            pagination = CountedPagination(query, page, 10, count=count)
+            assert pagination.items == expected.items
+            assert pagination.total == expected.total
+            assert pagination.total_is_exact
+            assert pagination.total_display == "100"
+            assert list(pagination.iter_pages()) == list(
+                expected.iter_pages()
+            )
+            for name in ("pages", "has_prev", "prev_num", "next_num"):
+                assert getattr(pagination, name) == getattr(expected, name)
+
+
+def test_cached_count_runs_once_per_query(app, message_model, statements):
+    db, Message = message_model  # noqa: N806
+    count = CachedCount(ttl=60, maxsize=1)
+    with app.test_request_context("/"):
+        query = Message.query.order_by(Message.id)
+        for page in (1, 2, 3):
+            CountedPagination(query, page, 10, count=count)
+        assert counts(statements) == 1
+
+        evens = query.filter(Message.text == "even")
+        assert CountedPagination(evens, 1, 10, count=count).total == 50
+        assert CountedPagination(query, 1, 10, count=count).total == 100
+        assert counts(statements) == 3
+
+        count.clear()
+        CountedPagination(select(Message), 1, 10, count, db.session)
+        CountedPagination(select(Message), 2, 10, count, db.session)
+        assert counts(statements) == 4
+
+        count.ttl = 0
+        CountedPagination(query, 1, 10, count=count)
+        CountedPagination(query, 1, 10, count=count)
+        assert counts(statements) == 6
+
+
+def test_probe_count_looks_ahead(app, message_model, statements):
+    db, Message = message_model  # noqa: N806
+    query = Message.query.order_by(Message.id)
+    with app.test_request_context("/"):
+        pagination = CountedPagination(query, 2, 10, count=ProbeCount(3))
+        assert pagination.total == 50
+        assert not pagination.total_is_exact
+        assert pagination.total_display == "50+"
+        assert list(pagination.iter_pages()) == [1, 2, 3, 4, 5, None]
+        assert "LIMIT" in statements[-1]
+
+        pagination = CountedPagination(query, 7, 10, count=ProbeCount(3))
+        assert pagination.total == 100
+        assert pagination.total_is_exact
+        assert pagination.pages == 10
+
+        pagination = CountedPagination(
+            select(Message).order_by(Message.id),
+            9,
+            10,
+            count=ProbeCount(3),
+            session=db.session,
+        )
+        assert pagination.total == 100
+        assert pagination.next_num == 10
+
+
+def test_capped_count(app, message_model, statements):
+    db, Message = message_model  # noqa: N806
+    query = Message.query.order_by(Message.id)
+    with app.test_request_context("/"):
+        pagination = CountedPagination(query, 1, 5, count=CappedCount(30))
+        assert pagination.total_display == "30+"
+        assert pagination.pages == 6
+        assert list(pagination.iter_pages())[-1] is None
+
+        pagination = CountedPagination(query, 9, 5, count=CappedCount(30))
+        assert pagination.total == 46
+        assert pagination.has_next
+
+        pagination = CountedPagination(query, 1, 5, count=CappedCount(500))
+        assert pagination.total_display == "100"
+
+        statements.clear()
+        pagination = CountedPagination(query, 20, 5, count=CappedCount(30))
+        assert pagination.total_display == "100"
+        assert not pagination.has_next
+        assert counts(statements) == 0
+
+
+def test_counted_pagination_out_of_range(app, message_model):
+    db, Message = message_model  # noqa: N806
+    with app.test_request_context("/"):
+        for page in (0, 11):
+            with pt.raises(NotFound):
+                CountedPagination(Message.query, page, 10)
+        pagination = CountedPagination(Message.query, 0, 10, error_out=False)
+        assert pagination.page == 1
+
+
+def test_render_ui_pagination_with_probe_count(app, client, message_model):
+    db, Message = message_model  # noqa: N806
+
+    @app.route("/pagination")
+    def test():
+        pagination = CountedPagination(
+            Message.query.order_by(Message.id),
+            request.args.get("page", 1, type=int),
+            10,
+            count=ProbeCount(2),
+        )
+        return render_template_string(
+            """
+            {% from 'semantic/pagination.html' import render_ui_pagination %}
+            {{ render_ui_pagination(pagination) }}
+            {{ pagination.total_display }} results
+            """,
+            pagination=pagination,
+        )
+
+    data = client.get("/pagination?page=4").get_data(as_text=True)
+    assert '<a class="active item" href="#">4</a>' in data
+    assert 'href="/pagination?page=6"' in data
+    assert 'href="/pagination?page=7"' not in data
+    assert "…" in data
+    assert "60+ results" in data
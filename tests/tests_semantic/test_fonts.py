@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import re
+
+from flask_semanticui.assets import STATIC_ROOT
+from flask_semanticui.components import build_bundle
+from flask_semanticui.fonts import (
+    FONTS_FOLDER,
+    LATO_FACES,
+    LOCAL_STYLESHEET,
+    apply_profile,
+    font_face_css,
+    is_legacy_font,
+    modern_font_faces,
+    profile_path,
+    use_local_fonts,
+)
+
+import pytest as pt
+
+
+def test_fonts_are_bundled():
+    for _, _, _, filename in LATO_FACES:
+        data = (STATIC_ROOT / FONTS_FOLDER / filename).read_bytes()
+        assert data.startswith(b"wOF2")
+    assert (STATIC_ROOT / FONTS_FOLDER / "lato-OFL.txt").is_file()
+
+
+def test_font_face_css():
+    css = font_face_css(LOCAL_STYLESHEET)
+    assert css.count("@font-face{") == len(LATO_FACES)
+    assert css.count("font-display:swap") == len(LATO_FACES)
+    assert "src:local('Lato Regular'),local('Lato-Regular'),url(" in css
+    assert (
+        "url(themes/default/assets/fonts/lato-bold.woff2) format('woff2')"
+        in css
+    )
+    assert "url(../css/themes/" in font_face_css("js/x.css")
+
+
+def test_use_local_fonts():
+    css = (STATIC_ROOT / "css/semantic.min.css").read_text(encoding="utf-8")
+    local = use_local_fonts(css, LOCAL_STYLESHEET)
+    assert "fonts.googleapis.com" in css
+    assert "fonts.googleapis.com" not in local
+    assert font_face_css(LOCAL_STYLESHEET) in local
+    assert use_local_fonts(local, LOCAL_STYLESHEET) == local
+
+    _, bundle = build_bundle("macros")
+    assert b"fonts.googleapis.com" not in bundle
+    assert b"font-display:swap" in bundle
+
+
+def test_serve_local_stylesheet(app, semantic):
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+
+    @app.route("/fonts")
+    def local_fonts():
+        return semantic.load_css()
+
+    client = app.test_client()
+    page = client.get("/fonts").get_data(as_text=True)
+    url = re.search(r'href="([^"]+)"', page)[1]
+    assert url == "/static/semantic/css/semantic.local.min.css"
+    css = client.get(url).get_data(as_text=True)
+    assert "fonts.googleapis.com" not in css
+    fonts = re.findall(r"url\((themes/default/assets/fonts/lato[^)]+)\)", css)
+    assert len(fonts) == len(LATO_FACES)
+    for font in fonts:
+        response = client.get(f"/static/semantic/css/{font}")
+        assert response.status_code == 200
+        assert response.mimetype == "font/woff2"
+
+
+def test_modern_font_faces():
+    css = (STATIC_ROOT / "css/semantic.min.css").read_text(encoding="utf-8")
+    modern = apply_profile(css, "modern")
+    rule = re.search(r"@font-face\{font-family:Icons;[^}]*\}", modern)[0]
+    assert rule == (
+        "@font-face{font-family:Icons;"
+        "src:url(themes/default/assets/fonts/icons.woff2) format('woff2'),"
+        "url(themes/default/assets/fonts/icons.woff) format('woff');"
+        "font-style:normal;font-weight:400;font-variant:normal;"
+        "text-decoration:inherit;text-transform:none;font-display:block}"
+    )
+    for suffix in (".eot", ".ttf", ".svg#icons"):
+        assert f"brand-icons{suffix}" in css
+        assert f"brand-icons{suffix}" not in modern
+    # The inline fonts of the modules and Lato are kept.
+    assert "@font-face{font-family:Dropdown;src:url(data:" in modern
+    lato = font_face_css(LOCAL_STYLESHEET)
+    assert modern_font_faces(lato) == lato
+    assert apply_profile(css, None) == css
+    with pt.raises(ValueError):
+        apply_profile(css, "legacy")
+
+
+def test_profile_paths():
+    assert profile_path(LOCAL_STYLESHEET, None) == LOCAL_STYLESHEET
+    assert (
+        profile_path(LOCAL_STYLESHEET, "modern")
+        == "css/semantic.local.modern.min.css"
+    )
+    path, css = build_bundle("macros", profile="modern")
+    assert path == "css/semantic.macros.modern.min.css"
+    assert b"icons.eot" not in css
+    assert is_legacy_font(f"{FONTS_FOLDER}/icons.3f9a1c2b.svg")
+    assert not is_legacy_font(f"{FONTS_FOLDER}/icons.woff2")
+    assert not is_legacy_font("css/themes/default/assets/images/flags.png")
+
+
+def test_modern_profile_leaves_legacy_fonts_out(app, semantic):
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    app.config["SEMANTIC_ASSET_PROFILE"] = "modern"
+
+    @app.route("/modern")
+    def modern():
+        return semantic.load_css()
+
+    client = app.test_client()
+    page = client.get("/modern").get_data(as_text=True)
+    url = re.search(r'href="([^"]+)"', page)[1]
+    assert url == "/static/semantic/css/semantic.local.modern.min.css"
+    css = client.get(url).get_data(as_text=True)
+    assert "font-display:block" in css
+    assert ".eot" not in css
+    prefix = f"/static/semantic/{FONTS_FOLDER}"
+    assert client.get(f"{prefix}/icons.woff2").status_code == 200
+    assert client.get(f"{prefix}/icons.eot").status_code == 404
+
+    app.config["SEMANTIC_ASSET_PROFILE"] = None
+    assert client.get(f"{prefix}/icons.eot").status_code == 200
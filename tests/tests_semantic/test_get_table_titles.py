@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from collections import namedtuple
+
+import attr
+
+from flask_semanticui import get_table_titles, tables
+
+from flask_sqlalchemy import SQLAlchemy
+
+import pytest as pt
+
+from sqlalchemy.orm import configure_mappers
+
+
+TITLES = [("id", "#"), ("text", "Text"), ("sender_name", "Sender Name")]
+
+
+try:
+    import dataclasses
+except ImportError:  # Python 3.6
+    DataMessage = None
+else:
+    DataMessage = dataclasses.make_dataclass(
+        "DataMessage", ["id", "text", "sender_name"]
+    )
+
+
+@attr.s
+class AttrsMessage:
+    id = attr.ib()  # noqa: A003
+    text = attr.ib()
+    sender_name = attr.ib()
+
+
+TupleMessage = namedtuple("TupleMessage", ["id", "text", "sender_name"])
+
+
+@pt.mark.parametrize(
+    "row",
+    [
+        {"id": 1, "text": "Test message 1", "sender_name": "me"},
+        TupleMessage(1, "Test message 1", "me"),
+        pt.param(
+            DataMessage and DataMessage(1, "Test message 1", "me"),
+            marks=pt.mark.skipif(
+                DataMessage is None, reason="dataclasses needs Python 3.7"
+            ),
+        ),
+        AttrsMessage(1, "Test message 1", "me"),
+    ],
+)
+def test_get_table_titles_without_orm(row):
+    assert get_table_titles([row], "id", "#") == TITLES
+    assert get_table_titles([row], "text", "Message") == [
+        ("id", "Id"),
+        ("text", "Message"),
+        ("sender_name", "Sender Name"),
+    ]
+
+
+def test_get_table_titles_from_rows(app):
+    db = SQLAlchemy(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+        sender_name = db.Column(db.Text)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(Message(text="Test message 1", sender_name="me"))
+        db.session.commit()
+        result = db.session.execute(db.select(Message.__table__)).all()
+        assert get_table_titles(result, "id", "#") == TITLES
+        result = db.session.execute(db.select(Message.__table__)).mappings()
+        assert get_table_titles(result.all(), "id", "#") == TITLES
+        result = db.session.execute(db.select(Message.id, Message.text))
+        assert get_table_titles(result.all(), "id", "#") == TITLES[:2]
+
+
+def test_get_table_titles_are_cached_per_model(app):
+    db = SQLAlchemy(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+        sender_name = db.Column(db.Text)
+
+    configure_mappers()
+    titles = get_table_titles([Message()], "id", "#")
+    assert titles == TITLES
+    key = (Message, "id", "#")
+    assert key in tables._titles_cache
+
+    titles.append(("extra", "Extra"))
+    assert get_table_titles([Message()], "id", "#") == TITLES
+
+    class Reply(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+
+    configure_mappers()
+    assert key not in tables._titles_cache
+
+
+def test_get_table_titles_of_unknown_rows():
+    with pt.raises(TypeError):
+        get_table_titles([object()], "id", "#")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import re
+
+import flask
+
+from flask_semanticui import SemanticUI
+from flask_semanticui.hints import (
+    Hint,
+    font_hints,
+    hint_tags,
+    link_header,
+    preconnect_hints,
+)
+
+import pytest as pt
+
+
+@pt.fixture
+def semantic():
+    # The Link header hook is registered by init_app.
+    return None
+
+
+CSS = (
+    "@font-face{font-family:Icons;src:url(fonts/icons.eot);"
+    "src:url(fonts/icons.woff2) format('woff2'),"
+    "url(fonts/icons.woff) format('woff')}"
+    "@font-face{font-family:'brand-icons';"
+    "src:url(fonts/brand.woff2) format('woff2')}"
+    "@font-face{font-family:Lato;font-style:italic;"
+    "src:url(fonts/lato-italic.woff2) format('woff2')}"
+    "@font-face{font-family:Lato;font-style:normal;"
+    "src:local('Lato'),url(fonts/lato.woff2) format('woff2')}"
+)
+
+
+def test_font_hints():
+    hints = font_hints(CSS, "https://cdn.test/css/a.css", {"Icons", "Lato"})
+    assert [hint.url for hint in hints] == [
+        "https://cdn.test/css/fonts/icons.woff2",
+        "https://cdn.test/css/fonts/lato.woff2",
+    ]
+    assert all(hint.crossorigin for hint in hints)
+    assert font_hints(CSS, "/a.css", {"brand-icons"})[0].url == (
+        "/fonts/brand.woff2"
+    )
+
+
+def test_preconnect_hints():
+    hints = [
+        Hint("https://cdn.test/a.css", "preload", "style", None, False),
+        Hint("https://cdn.test/a.woff2", "preload", "font", None, True),
+        Hint("https://cdn.test/b.woff2", "preload", "font", None, True),
+        Hint("/static/a.js", "preload", "script", None, True),
+    ]
+    assert preconnect_hints(hints) == [
+        Hint("https://cdn.test", "preconnect", None, None, False),
+        Hint("https://cdn.test", "preconnect", None, None, True),
+    ]
+    css = "@import url(https://fonts.googleapis.com/css?family=Lato);"
+    assert [hint.url for hint in preconnect_hints([], css)] == [
+        "https://fonts.googleapis.com",
+        "https://fonts.gstatic.com",
+    ]
+
+
+def test_hint_formats():
+    hints = [
+        Hint("https://cdn.test", "preconnect", None, None, True),
+        Hint("/a.woff2?v=1&x", "preload", "font", "font/woff2", True),
+        Hint("/a.js", "preload", "script", None, False),
+    ]
+    assert hint_tags(hints) == (
+        '<link rel="preconnect" href="https://cdn.test" '
+        'crossorigin="anonymous">\n'
+        '<link rel="preload" href="/a.woff2?v=1&amp;x" as="font" '
+        'type="font/woff2" crossorigin="anonymous">\n'
+        '<link rel="preload" href="/a.js" as="script">'
+    )
+    assert link_header(hints) == (
+        "<https://cdn.test>; rel=preconnect; crossorigin, "
+        '</a.woff2?v=1&x>; rel=preload; as=font; type="font/woff2"; '
+        "crossorigin, </a.js>; rel=preload; as=script"
+    )
+
+
+def test_resource_hints_cdn(app):
+    semantic = SemanticUI(app)
+
+    @app.route("/hints")
+    def hints():
+        return flask.render_template_string(
+            "{{ semantic.resource_hints() }}"
+            "{{ semantic.load_css() }}{{ semantic.load_js() }}"
+        )
+
+    page = app.test_client().get("/hints").get_data(as_text=True)
+    base = f"https://cdn.jsdelivr.net/npm/semantic-ui@{semantic.semantic_version}/dist"  # noqa: E501
+    assert page.startswith(
+        '<link rel="preconnect" href="https://cdn.jsdelivr.net" '
+        'crossorigin="anonymous">'
+    )
+    assert 'href="https://fonts.gstatic.com" crossorigin' in page
+    preloads = re.findall(r'rel="preload" href="([^"]+)" as="(\w+)"', page)
+    assert preloads[0] == (f"{base}/semantic.min.css", "style")
+    assert (f"{base}/themes/default/assets/fonts/icons.woff2", "font") in (
+        preloads
+    )
+    assert "outline-icons.woff2" not in page
+    assert "lato" not in page
+    assert preloads[-1] == (f"{base}/semantic.min.js", "script")
+    for url, _ in preloads:
+        if not url.endswith(".woff2"):
+            assert f'src="{url}"' in page or f'href="{url}"' in page
+    assert "Link" not in app.test_client().get("/hints").headers
+
+
+def test_resource_hints_local(app):
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    app.config["SEMANTIC_FINGERPRINT"] = True
+    app.config["SEMANTIC_ICON_MODE"] = "svg"
+    app.config["SEMANTIC_EARLY_HINTS"] = True
+    SemanticUI(app)
+
+    @app.route("/hints")
+    def hints():
+        return flask.render_template_string("{{ semantic.resource_hints() }}")
+
+    @app.route("/data")
+    def data():
+        return {"data": 1}
+
+    client = app.test_client()
+    response = client.get("/hints")
+    page = response.get_data(as_text=True)
+    assert "preconnect" not in page
+    fonts = re.findall(r'href="([^"]+\.woff2)"', page)
+    assert [font.rsplit("/", 1)[1].split(".")[0] for font in fonts] == [
+        "lato-regular",
+        "lato-bold",
+    ]
+    for font in fonts:
+        assert client.get(font).status_code == 200
+    links = response.headers["Link"].split(", ")
+    assert len(links) == page.count("<link ")
+    assert links[0].startswith("</static/semantic/css/semantic.local.min.")
+    assert links[0].endswith(".css>; rel=preload; as=style; crossorigin")
+    assert "Link" not in client.get("/data").headers
+
+
+@pt.mark.parametrize(
+    "config",
+    [
+        {},
+        {"SEMANTIC_FINGERPRINT": True, "SEMANTIC_JS_MODULES": "macros"},
+        {"SEMANTIC_ASSET_PROFILE": "modern", "SEMANTIC_JS_MODULES": "auto"},
+        {"SEMANTIC_ASSET_MIDDLEWARE": True, "SEMANTIC_JS_STRATEGY": "defer"},
+    ],
+)
+def test_resource_hints_are_served(tmp_path, config):
+    (tmp_path / "index.html").write_text(
+        "{{ semantic.resource_hints() }}{{ semantic.load_css() }}"
+        "{{ semantic.load_js() }}"
+    )
+    app = flask.Flask(__name__, template_folder=str(tmp_path))
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    app.config.update(config)
+    SemanticUI(app)
+    app.add_url_rule(
+        "/", "index", lambda: flask.render_template("index.html")
+    )
+
+    client = app.test_client()
+    page = client.get("/").get_data(as_text=True)
+    preloads = re.findall(r'rel="preload" href="([^"]+)"', page)
+    fonts = [url.rsplit("/", 1)[1].split(".")[0] for url in preloads]
+    # The macros only render icons of the Icons family.
+    assert "icons" in fonts
+    assert "brand-icons" not in fonts
+    assert "outline-icons" not in fonts
+    assert any(url.endswith(".js") for url in preloads)
+    for url in preloads:
+        assert client.get(url).status_code == 200, url
+
+
+def test_resource_hints_icons(tmp_path):
+    (tmp_path / "index.html").write_text(
+        "{% from 'semantic/utils.html' import render_ui_icon %}"
+        "{{ semantic.resource_hints() }}{{ render_ui_icon('github') }}"
+    )
+    app = flask.Flask(__name__, template_folder=str(tmp_path))
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    SemanticUI(app)
+    app.add_url_rule(
+        "/", "index", lambda: flask.render_template("index.html")
+    )
+
+    page = app.test_client().get("/").get_data(as_text=True)
+    assert re.search(r'href="[^"]+/brand-icons\.woff2"', page)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import re
+
+import flask
+
+from flask_semanticui import SemanticUI, assets
+from flask_semanticui.assets import get_manifest
+from flask_semanticui.icons import (
+    IconSprite,
+    IconSubset,
+    build_icon_subset,
+    build_sprite,
+    icon_glyphs,
+    load_icon_subset,
+    render_svg_icon,
+    resolve_icon,
+    used_glyphs,
+)
+
+import pytest as pt
+
+
+@pt.fixture
+def semantic():
+    # The icon subset is picked up by init_app.
+    return None
+
+
+def test_icon_glyphs():
+    glyphs = {selector: (family, cp) for selector, family, cp in icon_glyphs()}
+    assert glyphs["i.icon.plus"] == ("Icons", 0xF067)
+    assert glyphs["i.icon.trash.alternate.outline"][0] == "outline-icons"
+    assert glyphs["i.icon.github"][0] == "brand-icons"
+    assert glyphs["i.icon.heart.empty"][0] == "outline-icons"
+
+
+def test_used_glyphs():
+    used = used_glyphs({"icon", "plus", "angle", "double", "left", "github"})
+    assert used["Icons"][0xF067] == {"plus"}
+    assert used["Icons"][0xF100] == {"angle double left"}
+    assert used["brand-icons"] == {0xF09B: {"github"}}
+    assert "outline-icons" not in used
+
+
+def test_icon_subset(tmp_path):
+    pt.importorskip("fontTools")
+    icons = build_icon_subset({"icon", "plus", "eye", "trash"})
+    assert icons.families == ["Icons"]
+    [(name, data)] = icons.fonts.items()
+    assert re.fullmatch(r"icons\.subset-[0-9a-f]{8}\.woff2?", name)
+    assert len(data) < 4096
+    assert "/* Icons: eye, plus, trash */" in icons.css
+    assert "font-display:block" in icons.css
+
+    css = (
+        "@font-face{font-family:Icons;src:url(themes/default/assets/fonts/"
+        "icons.woff2) format('woff2')}"
+        "@font-face{font-family:brand-icons;src:url(brand.woff2)}"
+        "i.icon.plus:before{content:\"\\f067\"}"
+    )
+    applied = icons.apply(css, "css/semantic.local.min.css")
+    assert f"url(themes/default/assets/fonts/{name})" in applied
+    assert "icons.woff2)" not in applied
+    assert "@font-face{font-family:brand-icons" in applied
+    assert "../css/themes/" in icons.apply(css, "js/a.css")
+    assert icons.apply("i{color:red}", "css/a.css") == "i{color:red}"
+    assert icons.stylesheet_path("css/semantic.local.min.css") == (
+        f"css/semantic.local.icons-{icons.digest[:8]}.min.css"
+    )
+
+    assert load_icon_subset(tmp_path) is None
+    (tmp_path / "icons.subset-00000000.woff2").write_bytes(b"stale")
+    icons.save(tmp_path)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [name, "icons.css"]
+    )
+    loaded = load_icon_subset(tmp_path)
+    assert isinstance(loaded, IconSubset)
+    assert loaded.css == icons.css
+    assert loaded.fonts == icons.fonts
+
+
+def test_cli_icons(app, tmp_path):
+    pt.importorskip("fontTools")
+    output = tmp_path / "instance" / "semantic-icons"
+    app.config["SEMANTIC_ICON_SUBSET"] = str(output)
+    SemanticUI(app)
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["semantic", "icons", "--keep", "github"])
+    assert result.exit_code == 0, result.output
+    assert str(output) in result.output
+    fragment = (output / "icons.css").read_text()
+    assert "@font-face{font-family:Icons;" in fragment
+    assert "@font-face{font-family:brand-icons;" in fragment
+    assert "trash" in fragment
+
+    # A new application serves stylesheets using the subset.
+    app = flask.Flask(__name__)
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    app.config["SEMANTIC_ICON_SUBSET"] = str(output)
+    SemanticUI(app)
+
+    @app.route("/")
+    def index():
+        return flask.render_template_string("{{ semantic.load_css() }}")
+
+    client = app.test_client()
+    href = re.search(r'href="([^"]+)"', client.get("/").get_data(True))[1]
+    assert re.fullmatch(
+        r"/static/semantic/css/semantic\.local\.icons-[0-9a-f]{8}\.min\.css",
+        href,
+    )
+    css = client.get(href).get_data(as_text=True)
+    fonts = re.findall(r"url\((themes/[^)]*\.subset-[^)]*)\)", css)
+    assert len(fonts) == 2
+    for font in fonts:
+        assert client.get(f"/static/semantic/css/{font}").status_code == 200
+    assert "outline-icons.woff2" in css
+
+
+def test_resolve_icon():
+    assert resolve_icon("large red plus") == ("plus", ("large", "red"))
+    assert resolve_icon("angle double left")[0] == "angle-double-left"
+    assert resolve_icon("trash alternate outline")[0] == (
+        "trash-alternate-outline"
+    )
+    assert resolve_icon("unknown") == (None, ("unknown",))
+
+
+def test_build_sprite():
+    sprite = build_sprite(["plus", "github", "trash-alternate-outline"])
+    svg = sprite.decode("utf-8")
+    assert svg.startswith("<!--")
+    assert svg.count("<symbol ") == 3
+    for symbol in ("plus", "github", "trash-alternate-outline"):
+        assert f'<symbol id="{symbol}" viewBox=' in svg
+    assert build_sprite([]).count(b"<symbol ") == 0
+
+    sprite = IconSprite(["plus", "nope"])
+    assert re.fullmatch(
+        r"css/themes/default/assets/images/icons\.sprite\.[0-9a-f]{8}\.svg",
+        sprite.path,
+    )
+    assert "plus" in sprite
+    assert "nope" not in sprite
+    assert sprite.path in get_manifest().files
+    assert IconSprite(["plus"]).path == sprite.path
+    assert IconSprite(["eye", "plus"]).path != sprite.path
+
+
+def test_render_svg_icon():
+    html = render_svg_icon("large red plus", None, "/sprite.svg")
+    assert html == (
+        '<i class="large red icon"><svg width="1em" height="1em" '
+        'fill="currentColor" style="vertical-align:-.125em" '
+        'aria-hidden="true"><use href="/sprite.svg#plus"/></svg></i>'
+    )
+    assert '<i class="green icon">' in render_svg_icon("plus", "green", "/s")
+    assert 'style="color: #f00"' in render_svg_icon("plus", "#f00", "/s")
+    assert render_svg_icon("nothing", None, "/s") == (
+        '<i class="nothing icon"></i>'
+    )
+    assert render_svg_icon("plus", "green", None) == (
+        '<i class="plus green icon"></i>'
+    )
+
+
+def test_svg_icon_mode(app, monkeypatch):
+    app.config["SEMANTIC_ICON_MODE"] = "svg"
+    app.config["SEMANTIC_SVG_ICONS"] = ["github"]
+    SemanticUI(app)
+
+    @app.route("/svg")
+    def svg_icons():
+        return flask.render_template_string(
+            "{% from 'semantic/utils.html' import render_ui_icon %}"
+            "{{ render_ui_icon('plus', 'red') }}"
+            "{{ render_ui_icon('github') }}"
+            "{{ render_ui_icon('bug') }}"
+        )
+
+    client = app.test_client()
+    page = client.get("/svg").get_data(as_text=True)
+    assert "<i class=\"plus" not in page
+    assert '<i class="red icon">' in page
+    # Icons outside the sprite are font icons, the sprite doesn't grow.
+    assert '<i class="bug icon"></i>' in page
+    urls = re.findall(r'<use href="([^"#]+)#(\w[\w-]*)"/>', page)
+    assert [symbol for _, symbol in urls] == ["plus", "github"]
+    url = urls[-1][0]
+    assert re.fullmatch(
+        r"/static/semantic/css/themes/default/assets/images/"
+        r"icons\.sprite\.[0-9a-f]{8}\.svg",
+        url,
+    )
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.mimetype == "image/svg+xml"
+    assert "immutable" in response.headers["Cache-Control"]
+    sprite = response.get_data(as_text=True)
+    assert '<symbol id="plus"' in sprite
+    assert '<symbol id="github"' in sprite
+    assert '<symbol id="bug"' not in sprite
+
+    # Another process serves the same sprite, without rendering a page.
+    monkeypatch.setattr(assets, "_manifests", {})
+    other = flask.Flask(app.import_name)
+    other.config["SEMANTIC_ICON_MODE"] = "svg"
+    other.config["SEMANTIC_SVG_ICONS"] = ["github"]
+    other.config["SEMANTIC_ASSET_MIDDLEWARE"] = True
+    SemanticUI(other)
+    other.add_url_rule("/svg", view_func=svg_icons)
+    response = other.test_client().get(url)
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == sprite
+
+
+def test_svg_icon_mode_is_checked(app):
+    app.config["SEMANTIC_ICON_MODE"] = "sprite"
+    with pt.raises(ValueError):
+        SemanticUI(app)
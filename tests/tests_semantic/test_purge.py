@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import re
+
+import flask
+
+from flask_semanticui import SemanticUI, render_table
+from flask_semanticui.icons import used_glyphs
+from flask_semanticui.purge import (
+    collect_tokens,
+    crawl_paths,
+    crawl_tokens,
+    module_tokens,
+    purge_css,
+    selector_is_used,
+    split_selectors,
+    template_tokens,
+)
+from flask_semanticui.sri import integrity
+
+from flask_wtf import CSRFProtect
+
+import pytest as pt
+
+
+@pt.fixture
+def semantic():
+    # The purged stylesheet is picked up by init_app.
+    return None
+
+
+CSS = (
+    "/*\n * Copyright 2014 Contributors\n */"
+    "@import url(https://fonts.googleapis.com/css?family=Lato);"
+    "/*!\n * # Semantic UI 2.4.2 - Modal\n */"
+    "body{margin:0}"
+    ".ui.button,.ui.modal{cursor:pointer}"
+    ".ui.modal>.close{content:'{'}"
+    ".ui.menu:not(.vertical) .item{display:flex}"
+    '.ui.grid>[class*="four wide"].column{width:25%}'
+    '.ui.grid>[class*="five wide"].column{width:20%}'
+    "@font-face{font-family:Icons;src:url(icons.woff2)}"
+    "@media only screen and (max-width:767px){"
+    ".ui.button{font-size:1rem}.ui.modal{width:95%}}"
+    "@media print{.ui.modal{display:none}}"
+    ".ui.button.loading{animation:button-spin .6s linear}"
+    ".ui.modal.scale{animation-name:scaleIn}"
+    "@keyframes button-spin{from{transform:rotate(0)}"
+    "to{transform:rotate(360deg)}}"
+    "@-webkit-keyframes scaleIn{0%{opacity:0}100%{opacity:1}}"
+)
+
+
+def test_split_selectors():
+    assert split_selectors(".a, .b:not(.c,.d) , [title='x,y']") == [
+        ".a",
+        ".b:not(.c,.d)",
+        "[title='x,y']",
+    ]
+
+
+def test_selector_is_used():
+    tokens = {"ui", "menu", "item", "four", "wide", "column"}
+    assert selector_is_used("body", tokens)
+    assert selector_is_used(".ui.menu:not(.vertical) .item", tokens)
+    assert selector_is_used('.ui>[class*="four wide"].column', tokens)
+    assert not selector_is_used('.ui>[class*="five wide"].column', tokens)
+    assert not selector_is_used(".ui.modal", tokens)
+
+
+def test_purge_css():
+    tokens = collect_tokens('<i class="ui button loading"></i>') | {
+        "menu",
+        "item",
+    }
+    assert purge_css(CSS, tokens) == (
+        "/*\n * Copyright 2014 Contributors\n */"
+        "@import url(https://fonts.googleapis.com/css?family=Lato);"
+        "body{margin:0}"
+        ".ui.button{cursor:pointer}"
+        ".ui.menu:not(.vertical) .item{display:flex}"
+        "@font-face{font-family:Icons;src:url(icons.woff2)}"
+        "@media only screen and (max-width:767px){"
+        ".ui.button{font-size:1rem}}"
+        ".ui.button.loading{animation:button-spin .6s linear}"
+        "@keyframes button-spin{from{transform:rotate(0)}"
+        "to{transform:rotate(360deg)}}"
+    )
+    everything = purge_css(CSS, collect_tokens(CSS))
+    assert everything == CSS.replace(
+        "/*!\n * # Semantic UI 2.4.2 - Modal\n */", ""
+    )
+
+
+def test_module_tokens(app):
+    SemanticUI(app)
+    CSRFProtect(app)
+    tokens = module_tokens()
+    assert not tokens & {"github", "python", "flask", "database", "js"}
+    assert "brand-icons" not in used_glyphs(tokens)
+
+    data = [{"id": 1, "text": "Test"}]
+    with app.test_request_context("/"):
+        html = render_table(
+            data,
+            stackable_class="stackable",
+            show_actions=True,
+            new_url="/new",
+            view_url="/view",
+            edit_url="/edit",
+            delete_url="/delete",
+            delete_mode="shared",
+        )
+        html += render_table(data, stackable_class="unstackable")
+    for value in re.findall(r'class="([^"]*)"', html):
+        assert set(value.split()) <= tokens
+
+
+def test_collect_template_and_page_tokens(app):
+    SemanticUI(app)
+
+    @app.route("/segment")
+    def segment():
+        return '<div class="ui raised segment"></div>'
+
+    @app.route("/data.json")
+    def data():
+        return flask.jsonify(["modal"])
+
+    @app.route("/boom")
+    def boom():
+        flask.abort(500)
+
+    @app.route("/user/<name>")
+    def user(name):
+        return name
+
+    assert "pagination" in template_tokens(app)
+    assert "raised" not in template_tokens(app)
+
+    paths = crawl_paths(app)
+    assert "/segment" in paths
+    assert "/user/<name>" not in paths
+    assert not any(path.startswith("/static") for path in paths)
+
+    tokens, failures = crawl_tokens(app, paths)
+    assert {"raised", "segment"} <= tokens
+    assert "modal" not in tokens
+    assert failures == ["/boom", "/data.json"]
+
+
+def test_cli_purge(app, tmp_path):
+    @app.route("/segment")
+    def segment():
+        return '<div class="ui piled segment"></div>'
+
+    output = tmp_path / "instance" / "semantic.purged.min.css"
+    app.config["SEMANTIC_PURGED_CSS"] = str(output)
+    SemanticUI(app)
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=["semantic", "purge", "--keep", "sidebar"])
+    assert result.exit_code == 0, result.output
+    assert str(output) in result.output
+    css = output.read_text()
+    assert ".ui.pagination.menu" in css
+    assert ".ui.sidebar{" in css
+    assert ".ui.piled.segment" not in css
+    assert ".ui.modal{" not in css
+
+    result = runner.invoke(args=["semantic", "purge", "--crawl"])
+    assert result.exit_code == 0, result.output
+    purged = output.read_bytes()
+    assert b".ui.piled.segment" in purged
+    assert b".ui.sidebar{" not in purged
+
+    # A new application serves the purged stylesheet.
+    app = flask.Flask(__name__)
+    app.config["SEMANTIC_PURGED_CSS"] = str(output)
+    SemanticUI(app)
+
+    @app.route("/")
+    def index():
+        return flask.render_template_string("{{ semantic.load_css() }}")
+
+    client = app.test_client()
+    href, sri = re.search(
+        r'href="([^"]+)" integrity="([^"]+)"', client.get("/").get_data(True)
+    ).groups()
+    assert href.startswith("/static/semantic/css/semantic.purged-")
+    assert sri == integrity(purged)
+    assert client.get(href).get_data() == purged
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+from collections import namedtuple
+
+from flask import Response, render_template_string, stream_with_context
+
+from flask_semanticui import render_table, stream_table
+
+from flask_sqlalchemy import SQLAlchemy
+
+from flask_wtf import CSRFProtect
+
+import pytest as pt
+
+from sqlalchemy import event
+
+
+MACRO = """{% from 'semantic/table.html' import render_ui_table %}
+{{- render_ui_table(data, **options) }}"""
+
+Message = namedtuple("Message", ["id", "text"])
+
+
+def render_macro(data, **options):
+    return render_template_string(MACRO, data=data, options=options)
+
+
+@pt.mark.parametrize(
+    "options",
+    [
+        {},
+        {"table_classes": "selectable", "header_classes": "my class"},
+        {"caption": "Messages", "caption_icon": "user", "caption_class": "h"},
+        {"responsive": True, "responsive_class": "scrolling"},
+        {"stackable_class": "unstackable", "primary_key_title": "No."},
+        {"show_actions": True, "new_url": "/new", "view_url": "/view"},
+        {
+            "show_actions": True,
+            "actions_title": "Do",
+            "custom_actions": [
+                ("Run", "play", ("view_message", [("message_id", ":id")]))
+            ],
+            "view_url": ("view_message", [("message_id", ":id")]),
+            "edit_url": ("view_message", [("message_id", ":id")]),
+            "delete_url": ("view_message", [("message_id", ":id")]),
+            "new_url": "new_message",
+        },
+        {
+            "show_actions": True,
+            "responsive": True,
+            "delete_url": ("view_message", [("message_id", ":id")]),
+            "delete_mode": "shared",
+        },
+    ],
+)
+def test_render_table_matches_macro(app, client, options):
+    db = SQLAlchemy(app)
+    CSRFProtect(app)
+    app.config["SEMANTIC_ICON_COLOR"] = "Beige"
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+        sender_name = db.Column(db.Text)
+
+    @app.route("/messages/<int:message_id>")
+    def view_message(message_id):
+        return ""
+
+    @app.route("/messages/new")
+    def new_message():
+        return ""
+
+    with app.test_request_context("/"):
+        db.create_all()
+        for i in range(10):
+            msg = Message(text=f"<b>Test</b> message {i+1}", sender_name="me")
+            db.session.add(msg)
+        db.session.commit()
+        messages = Message.query.all()
+        assert render_table(messages, **options) == render_macro(
+            messages, **options
+        )
+
+
+@pt.mark.parametrize(
+    "data",
+    [
+        [],
+        [{"id": 1, "text": "Test message 1"}, {"id": 2}],
+        [Message(1, "Test message 1"), Message(2, None)],
+    ],
+)
+def test_render_table_matches_macro_without_orm(app, client, data):
+    titles = [("id", "#"), ("text", "Message"), ("missing", "Missing")]
+    with app.test_request_context("/"):
+        assert render_table(data, titles) == render_macro(data, titles=titles)
+
+
+def test_render_table_matches_macro_in_svg_icon_mode(app, client):
+    app.config["SEMANTIC_ICON_MODE"] = "svg"
+    app.config["SEMANTIC_SVG_ICONS"] = ["user"]
+    data = [{"id": 1, "text": "Test message 1"}]
+    options = {
+        "caption": "Messages",
+        "caption_icon": "user",
+        "show_actions": True,
+        "new_url": "/new",
+        "view_url": "/view",
+    }
+    with app.test_request_context("/"):
+        html = render_table(data, **options)
+        assert html == render_macro(data, **options)
+    assert '<i class="user icon"></i>' not in html
+    assert "#user\"/></svg></i>" in html
+    assert "#eye\"/></svg></i>" in html
+
+
+@pt.mark.parametrize("renderer", [render_table, render_macro])
+def test_render_table_prefetches_expired_rows_at_once(app, client, renderer):
+    db = SQLAlchemy(app)
+
+    class Author(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        name = db.Column(db.Text)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+        author_id = db.Column(db.Integer, db.ForeignKey(Author.id))
+        author = db.relationship(Author)
+
+    @app.route("/messages/<name>/<int:message_id>")
+    def view_message(name, message_id):
+        return ""
+
+    with app.test_request_context("/"):
+        db.create_all()
+        author = Author(name="me")
+        for i in range(10):
+            db.session.add(Message(text=f"Test message {i+1}", author=author))
+        db.session.commit()
+        messages = Message.query.all()
+        db.session.expire_all()
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        html = renderer(
+            messages,
+            titles=[("id", "#"), ("text", "Message")],
+            model=Message,
+            show_actions=True,
+            view_url=(
+                "view_message",
+                [("name", ":author.name"), ("message_id", ":id")],
+            ),
+        )
+        event.remove(db.engine, "before_cursor_execute", count)
+    assert len(statements) == 2
+    assert 'href="/messages/me/1"' in html
+    assert 'href="/messages/me/10"' in html
+
+
+def test_render_table_is_exposed(app, client, semantic):
+    data = [{"id": 1, "text": "Test message 1"}]
+
+    @app.route("/table")
+    def test():
+        return render_template_string(
+            """
+            {{ render_table(data, [('id', '#'), ('text', 'Message')]) }}
+            {{ semantic.render_table(data, titles=[('id', '#')]) }}
+            """,
+            data=data,
+        )
+
+    response = client.get("/table")
+    data = response.get_data(as_text=True)
+    assert "<td>Test message 1</td>" in data
+    assert data.count('<td data-label="#">1</td>') == 2
+
+
+def test_stream_table_yields_head_then_row_chunks(app, client):
+    titles = [("id", "#"), ("text", "Message")]
+    data = [{"id": i, "text": f"Test message {i}"} for i in range(1, 26)]
+    with app.test_request_context("/"):
+        chunks = list(
+            stream_table((row for row in data), titles, chunk_size=10)
+        )
+        assert len(chunks) == 5
+        assert "<thead>" in chunks[0]
+        assert "<td" not in chunks[0]
+        assert chunks[1].count("<tr>") == 10
+        assert chunks[3].count("<tr>") == 5
+        assert chunks[4].endswith("</table>")
+        assert "".join(chunks) == render_table(data, titles)
+
+
+def test_stream_table_detects_titles_from_first_row(app, client):
+    db = SQLAlchemy(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+
+    @app.route("/messages/<int:message_id>")
+    def view_message(message_id):
+        return ""
+
+    @app.route("/table")
+    def test():
+        db.drop_all()
+        db.create_all()
+        for i in range(10):
+            msg = Message(text=f"Test message {i+1}")
+            db.session.add(msg)
+        db.session.commit()
+        rows = Message.query.yield_per(3)
+        return Response(
+            stream_with_context(
+                stream_table(
+                    rows,
+                    chunk_size=4,
+                    show_actions=True,
+                    view_url=("view_message", [("message_id", ":id")]),
+                )
+            )
+        )
+
+    response = client.get("/table")
+    assert response.is_streamed
+    data = response.get_data(as_text=True)
+    assert "<th>#</th>" in data
+    assert "<th>Text</th>" in data
+    assert '<td data-label="#">10</td>' in data
+    assert 'href="/messages/10"' in data
+
+
+def test_stream_table_with_empty_data(app, client):
+    with app.test_request_context("/"):
+        html = "".join(stream_table(iter([])))
+    assert "<tbody>\n</tbody>" in html
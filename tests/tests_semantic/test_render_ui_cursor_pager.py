@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import base64
+import datetime as dt
+import decimal
+import json
+import re
+import uuid
+
+from flask import render_template_string, request
+
+from flask_semanticui import CursorPagination
+from flask_semanticui.pagination import decode_cursor, encode_cursor
+
+from flask_sqlalchemy import SQLAlchemy
+
+import pytest as pt
+
+from sqlalchemy import event, select
+
+from werkzeug.exceptions import NotFound
+
+
+@pt.fixture
+def message_model(app):
+    db = SQLAlchemy(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        day = db.Column(db.Date)
+
+    with app.app_context():
+        db.create_all()
+        for i in range(25):
+            db.session.add(Message(day=dt.date(2021, 1, 1 + i % 3)))
+        db.session.commit()
+    return db, Message
+
+
+def ids(pagination):
+    return [message.id for message in pagination.items]
+
+
+def token_of(payload):
+    data = json.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+@pt.mark.parametrize(
+    "values",
+    [
+        [1],
+        ["a", None, 1.5, True],
+        [dt.datetime(2021, 1, 2, 3, 4), dt.date.min],
+        [
+            dt.datetime(2021, 1, 2, 3, 4, 5, 6, dt.timezone.utc),
+            dt.time(3, 4, 5, tzinfo=dt.timezone(-dt.timedelta(hours=3))),
+            dt.time(3, 4, 5, 600),
+        ],
+        [decimal.Decimal("1.10"), uuid.UUID(int=1)],
+    ],
+)
+def test_cursor_round_trip(values):
+    token = encode_cursor("prev", values)
+    assert re.fullmatch(r"[\w-]+", token)
+    assert decode_cursor(token) == ("prev", values)
+
+
+@pt.mark.parametrize(
+    "token",
+    [
+        "",
+        "nope",
+        encode_cursor("x", [1]),
+        "W10",
+        token_of([["n"], [1]]),
+        token_of(["n", {"a": 1}]),
+        token_of(["n", [[1, 2]]]),
+        token_of(["n", [{"a": 1, "b": 2}]]),
+        token_of(["n", [{"dt": ["2021"]}]]),
+        token_of(["n", [{"d": "2021-13-01"}]]),
+        token_of(["n", [{"dec": "abc"}]]),
+        token_of(["n", [{"dec": "NaN"}]]),
+        token_of(["n", [{"dec": "-Infinity"}]]),
+        token_of(["n", [float("nan")]]),
+    ],
+)
+def test_decode_invalid_cursor(token):
+    with pt.raises(ValueError):
+        decode_cursor(token)
+
+
+def test_cursor_pagination_walks_forward_and_back(app, message_model):
+    db, Message = message_model  # noqa: N806
+    statements = []
+
+    with app.test_request_context("/"):
+        event.listen(
+            db.engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        first = CursorPagination(Message.query, [Message.id], per_page=10)
+        assert ids(first) == list(range(1, 11))
+        assert (first.has_prev, first.has_next) == (False, True)
+        assert first.prev_cursor is None
+
+        last = CursorPagination(
+            Message.query, [Message.id], 10, cursor=first.next_cursor
+        )
+        last = CursorPagination(
+            Message.query, [Message.id], 10, cursor=last.next_cursor
+        )
+        assert ids(last) == list(range(21, 26))
+        assert (last.has_prev, last.has_next) == (True, False)
+        assert last.next_cursor is None
+
+        back = CursorPagination(
+            Message.query, [Message.id], 10, cursor=last.prev_cursor
+        )
+        assert ids(back) == list(range(11, 21))
+        assert (back.has_prev, back.has_next) == (True, True)
+
+    assert len(statements) == 4
+    assert not any("count(" in sql.lower() for sql in statements)
+    assert "WHERE message.id > ?" in statements[1]
+    assert "WHERE message.id < ? ORDER BY message.id DESC" in statements[3]
+
+
+def test_cursor_pagination_of_select_with_composite_keys(
+    app, message_model
+):
+    db, Message = message_model  # noqa: N806
+    order_by = [Message.day, Message.id]
+    expected = sorted(range(1, 26), key=lambda i: ((i - 1) % 3, i))[::-1]
+
+    with app.test_request_context("/"):
+        seen, cursor = [], None
+        while True:
+            page = CursorPagination(
+                select(Message),
+                order_by,
+                per_page=7,
+                cursor=cursor,
+                session=db.session,
+                descending=True,
+            )
+            seen.extend(ids(page))
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == expected
+
+        rows = CursorPagination(
+            select(Message.id, Message.day), order_by, 3, session=db.session
+        )
+        assert [row.id for row in rows] == [1, 4, 7]
+        assert decode_cursor(rows.next_cursor) == (
+            "next",
+            [dt.date(2021, 1, 1), 7],
+        )
+
+        with pt.raises(RuntimeError):
+            CursorPagination(select(Message), order_by)
+
+
+def test_cursor_pagination_with_invalid_cursor(app, message_model):
+    db, Message = message_model  # noqa: N806
+    with app.test_request_context("/"):
+        with pt.raises(NotFound):
+            CursorPagination(Message.query, [Message.id], cursor="nope")
+        with pt.raises(NotFound):
+            CursorPagination(
+                Message.query, [Message.id], cursor=encode_cursor("n", [1, 2])
+            )
+        for values in [[[1]], [{"id": 1}], [{"dec": "abc"}]]:
+            with pt.raises(NotFound):
+                CursorPagination(
+                    Message.query,
+                    [Message.id],
+                    cursor=token_of(["n", values]),
+                )
+        page = CursorPagination(
+            Message.query, [Message.id], cursor="nope", error_out=False
+        )
+        assert ids(page) == list(range(1, 21))
+
+
+def test_render_ui_cursor_pager(app, client, message_model):
+    db, Message = message_model  # noqa: N806
+
+    @app.route("/cursor")
+    def test():
+        pagination = CursorPagination(
+            Message.query,
+            [Message.id],
+            per_page=10,
+            cursor=request.args.get("cursor"),
+        )
+        return render_template_string(
+            """
+            {% from 'semantic/pagination.html' import render_ui_cursor_pager %}
+            {{ render_ui_cursor_pager(pagination, fragment='list') }}
+            """,
+            pagination=pagination,
+        )
+
+    data = client.get("/cursor?q=a+b").get_data(as_text=True)
+    assert '<a class="disabled item" href="#">' in data
+    next_cursor = encode_cursor("next", [10])
+    assert f'href="/cursor?q=a+b&amp;cursor={next_cursor}#list"' in data
+
+    data = client.get(f"/cursor?cursor={next_cursor}").get_data(as_text=True)
+    prev_cursor = encode_cursor("prev", [11])
+    assert f'href="/cursor?cursor={prev_cursor}#list"' in data
+    assert f'href="/cursor?cursor={encode_cursor("next", [20])}#list"' in data
+
+    assert client.get("/cursor?cursor=nope").status_code == 404
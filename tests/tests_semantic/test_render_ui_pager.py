@@ -114,3 +114,33 @@ def test_render_pager(app, client):
         '<a class="active teal item" href="/pager-inverted-color?page=1">'
         in data
     )
+
+
+def test_render_pager_with_url_arguments(app, client):
+    db = SQLAlchemy(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+
+    @app.route("/pager")
+    def test():
+        db.drop_all()
+        db.create_all()
+        for i in range(100):
+            msg = Message()
+            db.session.add(msg)
+        db.session.commit()
+        page = request.args.get("page", 1, type=int)
+        pagination = Message.query.paginate(page, per_page=10)
+        return render_template_string(
+            """
+            {% from 'semantic/pagination.html' import render_ui_pager %}
+            {{ render_ui_pager(pagination, fragment='#top', q='a&b') }}
+            """,
+            pagination=pagination,
+        )
+
+    response = client.get("/pager?page=2")
+    data = response.get_data(as_text=True)
+    assert 'href="/pager?page=1&amp;q=a%26b#top"' in data
+    assert 'href="/pager?page=3&amp;q=a%26b#top"' in data
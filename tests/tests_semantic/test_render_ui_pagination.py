@@ -20,7 +20,9 @@
 # TESTS
 # =====================================================================
 
-from flask import render_template_string, request
+from flask import render_template_string, request, url_for
+
+from flask_semanticui import urls
 
 from flask_sqlalchemy import SQLAlchemy
 
@@ -149,3 +151,51 @@ def test_render_ui_pagination_extra_class_and_color_item(app, client):
     assert "1</a>" in data
     assert '<a class="active teal item" href="#">2</a>' in data
     assert "10</a>" in data
+
+
+def test_render_ui_pagination_builds_page_urls_once(
+    app, client, monkeypatch
+):
+    db = SQLAlchemy(app)
+    calls = []
+
+    def counting_url_for(endpoint, **values):
+        calls.append(endpoint)
+        return url_for(endpoint, **values)
+
+    monkeypatch.setattr(urls, "url_for", counting_url_for)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+
+    @app.route("/pagination")
+    def test():
+        db.drop_all()
+        db.create_all()
+        for i in range(100):  # noqa: F841
+            msg = Message()
+            db.session.add(msg)
+        db.session.commit()
+        page = request.args.get("page", 1, type=int)
+        pagination = Message.query.paginate(page, per_page=10)
+        return render_template_string(
+            """
+            {% from 'semantic/pagination.html' import render_ui_pagination %}
+            {{ render_ui_pagination(pagination, fragment='comments',
+                                    args={'q': 'a b'}) }}
+            """,
+            pagination=pagination,
+        )
+
+    response = client.get("/pagination?sort=id&page=5&x=1")
+    data = response.get_data(as_text=True)
+    assert calls == ["test"]
+    assert (
+        'href="/pagination?sort=id&amp;page=4&amp;x=1&amp;q=a+b#comments"'
+        in data
+    )
+    assert (
+        'href="/pagination?sort=id&amp;page=6&amp;x=1&amp;q=a+b#comments"'
+        in data
+    )
+    assert '<a class="active item" href="#">5</a>' in data
@@ -19,6 +19,10 @@ from flask_sqlalchemy import SQLAlchemy
 
 from flask_wtf import CSRFProtect
 
+import pytest as pt
+
+from sqlalchemy import event
+
 
 def test_render_simple_table(app, client):
     db = SQLAlchemy(app)
@@ -194,3 +198,162 @@ def test_customize_icon_title_of_table_actions(app, client):
     assert 'title="Update">' in data
     assert 'title="Remove">' in data
     assert 'title="Create">' in data
+
+
+def test_table_action_urls_resolve_against_rows(app, client):
+    db = SQLAlchemy(app)
+    CSRFProtect(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+
+    @app.route("/messages/<int:message_id>")
+    def view_message(message_id):
+        return f"Message {message_id}"
+
+    @app.route("/table")
+    def test():
+        db.drop_all()
+        db.create_all()
+        for i in range(10):
+            msg = Message(text=f"Test message {i+1}")
+            db.session.add(msg)
+        db.session.commit()
+        messages = Message.query.all()
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        html = render_template_string(
+            """
+            {% from 'semantic/table.html' import render_ui_table %}
+            {{ render_ui_table(messages, show_actions=True,
+            custom_actions=[('Run', 'play', ('view_message',
+                                             [('message_id', ':id')]))],
+            view_url=('view_message', [('message_id', ':id')]),
+            edit_url=('view_message', [('message_id', ':id')]),
+            delete_url=('view_message', [('message_id', ':id')])) }}
+            """,
+            messages=messages,
+        )
+        event.remove(db.engine, "before_cursor_execute", count)
+        assert statements == []
+        return html
+
+    response = client.get("/table")
+    data = response.get_data(as_text=True)
+    assert 'href="/messages/1"' in data
+    assert 'action="/messages/10"' in data
+
+
+def test_table_action_urls_prefetch_missing_fields(app, client):
+    db = SQLAlchemy(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+        slug = db.Column(db.Text)
+
+    @app.route("/messages/<slug>")
+    def view_message(slug):
+        return slug
+
+    @app.route("/table")
+    def test():
+        db.drop_all()
+        db.create_all()
+        for i in range(10):
+            msg = Message(text=f"Test message {i+1}", slug=f"msg-{i+1}")
+            db.session.add(msg)
+        db.session.commit()
+        db.session.expunge_all()
+        rows = [{"id": m.id, "text": m.text} for m in Message.query.all()]
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        html = render_template_string(
+            """
+            {% from 'semantic/table.html' import render_ui_table %}
+            {{ render_ui_table(rows, titles, model=model, show_actions=True,
+            view_url=('view_message', [('slug', ':slug')])) }}
+            """,
+            rows=rows,
+            titles=[("id", "#"), ("text", "Message")],
+            model=Message,
+        )
+        event.remove(db.engine, "before_cursor_execute", count)
+        assert len(statements) == 1
+        return html
+
+    response = client.get("/table")
+    data = response.get_data(as_text=True)
+    assert 'href="/messages/msg-1"' in data
+    assert 'href="/messages/msg-10"' in data
+
+
+def test_table_action_urls_require_model_for_missing_fields(app, client):
+    @app.route("/messages/<slug>")
+    def view_message(slug):
+        return slug
+
+    @app.route("/table")
+    def test():
+        return render_template_string(
+            """
+            {% from 'semantic/table.html' import render_ui_table %}
+            {{ render_ui_table(rows, titles, show_actions=True,
+            view_url=('view_message', [('slug', ':slug')])) }}
+            """,
+            rows=[{"id": 1, "text": "Test message 1"}],
+            titles=[("id", "#"), ("text", "Message")],
+        )
+
+    with pt.raises(RuntimeError):
+        client.get("/table")
+
+
+def test_table_shared_delete_form(app, client):
+    db = SQLAlchemy(app)
+    CSRFProtect(app)
+
+    class Message(db.Model):
+        id = db.Column(db.Integer, primary_key=True)  # noqa: A003
+        text = db.Column(db.Text)
+
+    @app.route("/messages/<int:message_id>/delete", methods=["POST"])
+    def delete_message(message_id):
+        return ""
+
+    @app.route("/table")
+    def test():
+        db.drop_all()
+        db.create_all()
+        for i in range(10):
+            msg = Message(text=f"Test message {i+1}")
+            db.session.add(msg)
+        db.session.commit()
+        messages = Message.query.all()
+        return render_template_string(
+            """
+            {% from 'semantic/table.html' import render_ui_table %}
+            {{ render_ui_table(messages, show_actions=True,
+            delete_url=('delete_message', [('message_id', ':id')]),
+            delete_mode='shared') }}
+            """,
+            messages=messages,
+        )
+
+    response = client.get("/table")
+    data = response.get_data(as_text=True)
+    assert data.count('name="csrf_token"') == 1
+    assert data.count("<form") == 1
+    assert data.count("<script>") == 1
+    assert 'data-action="/messages/1/delete" title="Delete">' in data
+    assert 'data-action="/messages/10/delete"' in data
+    assert "this.closest('form')" not in data
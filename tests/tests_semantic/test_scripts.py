@@ -13,12 +13,36 @@
 # License: MIT
 # Full Text: https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
 
+import gzip
+import json
+import re
+
+import flask
+
 from flask_semanticui import (
+    SemanticUI,
+    assets,
     link_css_with_sri,
     scripts_with_sri,
     simple_link_css,
     simple_scripts_js,
 )
+from flask_semanticui.assets import STATIC_ROOT
+from flask_semanticui.fonts import LOCAL_STYLESHEET, use_local_fonts
+from flask_semanticui.scripts import (
+    MODULES,
+    MODULES_FOLDER,
+    ON_DEMAND_SELECTOR,
+    build_module_bundle,
+    bundle_modules,
+    loader_script,
+    module_bundle_path,
+    resolve_modules,
+    split_modules,
+)
+from flask_semanticui.sri import integrity
+
+import pytest as pt
 
 
 def test_link_css():
@@ -69,17 +93,55 @@ def test_semantic_find_local_resource(app, semantic):
         app.config["SERVER_NAME"] = "localhost"
         url_css = semantic.load_css()
         url_js_and_jquery = semantic.load_js()
-    css = (
-        '<link rel="stylesheet" type="text/css" '
-        + 'href="/static/css/semantic.min.css">'
+    sris = {
+        path: integrity((STATIC_ROOT / path).read_bytes())
+        for path in (
+            "js/semantic/semantic.min.js",
+            "js/semantic/jquery.min.js",
+        )
+    }
+    local_css = use_local_fonts(
+        (STATIC_ROOT / "css/semantic.min.css").read_text("utf-8"),
+        LOCAL_STYLESHEET,
+    )
+    css = link_css_with_sri(
+        "/static/semantic/css/semantic.local.min.css",
+        integrity(local_css.encode("utf-8")),
+    )
+    js = scripts_with_sri(
+        "/static/semantic/js/semantic/semantic.min.js",
+        sris["js/semantic/semantic.min.js"],
+    )
+    jquery = scripts_with_sri(
+        "/static/semantic/js/semantic/jquery.min.js",
+        sris["js/semantic/jquery.min.js"],
     )
-    js = '<script src="/static/js/semantic/semantic.min.js"></script>'
-    jquery = '<script src="/static/js/semantic/jquery.min.js"></script>'
     assert css in url_css
     assert js in url_js_and_jquery
     assert jquery in url_js_and_jquery
 
 
+def test_local_scripts_are_served(app):
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+
+    @app.route("/scripts")
+    def scripts():
+        return flask.render_template_string("{{ semantic.load_js() }}")
+
+    client = app.test_client()
+    page = client.get("/scripts").get_data(as_text=True)
+    urls = re.findall(r'src="([^"]+)"', page)
+    assert len(urls) == 2
+    for url in urls:
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.mimetype.endswith("javascript")
+        assert response.content_encoding == "gzip"
+        path = url.replace("/static/semantic/", "", 1)
+        data = gzip.decompress(response.get_data())
+        assert data == (STATIC_ROOT / path).read_bytes()
+
+
 def test_semantic_find_cdn_resource(app, semantic):
     with app.app_context(), app.test_request_context():
         app.config["SEMANTIC_SERVE_LOCAL"] = False
@@ -106,3 +168,196 @@ def test_semantic_find_cdn_resource(app, semantic):
     assert css in url_css
     assert js in url_js_and_jquery
     assert jquery in url_js_and_jquery
+
+
+def test_loader_script():
+    script = loader_script([("/a.js", "sha384-a"), ("/b.js", None)], ".ui")
+    assert script.startswith("<script>(function(d,s,q){")
+    assert script.endswith(
+        '})(document,[["/a.js", "sha384-a"], ["/b.js", null]],".ui");</script>'
+    )
+    assert "e.async=false;" in script
+    assert loader_script([], None).endswith("(document,[],null);</script>")
+    assert "<\\/script>" in loader_script([("</script>", None)])
+    assert ".ui.dropdown" in ON_DEMAND_SELECTOR
+    assert ".ui.modal" in ON_DEMAND_SELECTOR
+
+
+def test_load_js_strategies(app, semantic):
+    with app.test_request_context():
+        blocking = semantic.load_js()
+        deferred = semantic.load_js(strategy="defer")
+        ordered = semantic.load_js(strategy="async-ordered")
+        on_demand = semantic.load_js(strategy="on-demand")
+        with pt.raises(ValueError):
+            semantic.load_js(strategy="lazy")
+
+    assert deferred.count(" defer integrity=") == 2
+    assert deferred.replace(" defer", "").split() == blocking.split()
+    jquery, sui = re.findall(r'src="([^"]+)" integrity="([^"]+)"', blocking)
+    for loader in (ordered, on_demand):
+        assert loader.count("<script") == 1
+        assert json.dumps([list(jquery), list(sui)]) in loader
+    assert ordered.endswith(",null);</script>")
+    assert on_demand.endswith(f",{json.dumps(ON_DEMAND_SELECTOR)});</script>")
+
+
+def test_js_strategy_setting():
+    app = flask.Flask(__name__)
+    app.config["SEMANTIC_JS_STRATEGY"] = "on-demand"
+    semantic = SemanticUI(app)
+    with app.test_request_context():
+        assert "querySelector" in semantic.load_js()
+        assert " defer " in semantic.load_js(strategy="defer")
+        assert "as=\"script\"" not in semantic.resource_hints()
+    app.config["SEMANTIC_JS_STRATEGY"] = "defer"
+    with app.test_request_context():
+        assert " defer " in semantic.load_js()
+        assert "as=\"script\"" in semantic.resource_hints()
+
+    app = flask.Flask(__name__)
+    app.config["SEMANTIC_JS_STRATEGY"] = "lazy"
+    with pt.raises(ValueError):
+        SemanticUI(app)
+
+
+def test_modules_are_bundled():
+    js = (STATIC_ROOT / "js/semantic/semantic.min.js").read_text("utf-8")
+    modules = split_modules(js)
+    assert tuple(modules) == MODULES
+    for name, script in modules.items():
+        path = STATIC_ROOT / f"{MODULES_FOLDER}/{name}.min.js"
+        assert path.read_text("utf-8") == script
+        assert script.startswith("/*\n * # Semantic UI")
+        assert script.endswith("}(jQuery,window,document);")
+    assert sum(map(len, modules.values())) < len(js) + 250 * len(MODULES)
+    with pt.raises(ValueError):
+        split_modules("!function(){}();")
+
+
+def test_module_bundles():
+    assert resolve_modules("macros") == (
+        "checkbox",
+        "dropdown",
+        "transition",
+        "message",
+    )
+    assert resolve_modules(["modal"]) == ("dimmer", "modal", "transition")
+    with pt.raises(ValueError):
+        resolve_modules(["carousel"])
+    with pt.raises(ValueError):
+        resolve_modules("all")
+    assert module_bundle_path(["message", "dropdown", "checkbox"]) == (
+        "js/semantic/semantic.macros.min.js"
+    )
+    custom = module_bundle_path(["modal"])
+    assert re.fullmatch(
+        r"js/semantic/semantic\.custom-[0-9a-f]+\.min\.js", custom
+    )
+    assert bundle_modules(custom) == resolve_modules(["modal"])
+    assert bundle_modules(custom.replace(".min.", ".min.0123abcd.")) == (
+        resolve_modules(["modal"])
+    )
+    assert bundle_modules("js/semantic/semantic.macros.min.js") == (
+        resolve_modules("macros")
+    )
+    # Aliases, modules without those they use, unknown bits or presets.
+    assert bundle_modules(custom.replace("-", "-0")) is None
+    assert bundle_modules("js/semantic/semantic.custom-10.min.js") is None
+    assert bundle_modules("js/semantic/semantic.custom-ffffff.min.js") is None
+    assert bundle_modules("js/semantic/semantic.all.min.js") is None
+    assert bundle_modules("js/semantic/semantic.min.js") is None
+    path, js = build_module_bundle("macros")
+    assert path == "js/semantic/semantic.macros.min.js"
+    assert js.count(b"Released under the MIT license") == 1
+    for name in ("checkbox", "dropdown", "transition"):
+        assert f".fn.{name}=".encode("ascii") in js
+    assert b".fn.modal=" not in js
+    assert b".message .close" in js
+    assert len(js) < 100 * 1024
+
+
+def test_load_js_preset():
+    app = flask.Flask(__name__)
+    app.config["SEMANTIC_JS_MODULES"] = "macros"
+    app.config["SEMANTIC_JS_STRATEGY"] = "defer"
+    semantic = SemanticUI(app)
+
+    @app.route("/")
+    def index():
+        return flask.render_template_string("{{ semantic.load_js() }}")
+
+    client = app.test_client()
+    page = client.get("/").get_data(as_text=True)
+    [(jquery, _), (url, sri)] = re.findall(
+        r'src="([^"]+)" defer integrity="([^"]+)"', page
+    )
+    assert jquery.startswith("https://cdn.jsdelivr.net/npm/jquery@")
+    assert re.fullmatch(
+        r"/static/semantic/js/semantic/semantic\.macros\.min\.[0-9a-f]{8}\.js",
+        url,
+    )
+    response = client.get(url)
+    assert "immutable" in response.headers["Cache-Control"]
+    assert integrity(response.data) == sri
+    with app.test_request_context():
+        assert url in semantic.resource_hints()
+
+    app = flask.Flask(__name__)
+    app.config["SEMANTIC_JS_MODULES"] = ["carousel"]
+    with pt.raises(ValueError):
+        SemanticUI(app)
+
+
+def test_load_js_auto_modules(app, hello_form, monkeypatch):
+    app.config["SEMANTIC_JS_MODULES"] = "auto"
+    app.config["WTF_CSRF_ENABLED"] = False
+
+    @app.route("/form")
+    def form():
+        return flask.render_template_string(
+            "{% from 'semantic/form_ui.html' import render_ui_form %}"
+            "{{ render_ui_form(form) }}{{ semantic.load_js() }}",
+            form=hello_form(),
+        )
+
+    @app.route("/plain")
+    def plain():
+        return flask.render_template_string(
+            "{% do semantic.require_js('message') %}{{ semantic.load_js() }}"
+        )
+
+    @app.route("/empty")
+    def empty():
+        return flask.render_template_string("{{ semantic.load_js() }}")
+
+    client = app.test_client()
+    page = client.get("/form").get_data(as_text=True)
+    [url] = re.findall(r'src="(/static/semantic/js/[^"]+)"', page)
+    assert "semantic.custom-" in url
+    js = client.get(url).get_data(as_text=True)
+    assert ".fn.checkbox=" in js
+    assert ".fn.transition=" not in js
+
+    page = client.get("/plain").get_data(as_text=True)
+    [url] = re.findall(r'src="(/static/semantic/js/[^"]+)"', page)
+    js = client.get(url).get_data(as_text=True)
+    assert ".fn.transition=" in js
+
+    # Another process serves the bundle without rendering the page.
+    monkeypatch.setattr(assets, "_manifests", {})
+    for middleware in (False, True):
+        other = flask.Flask(app.import_name)
+        other.config["SEMANTIC_JS_MODULES"] = "auto"
+        other.config["SEMANTIC_ASSET_MIDDLEWARE"] = middleware
+        SemanticUI(other)
+        response = other.test_client().get(url)
+        assert response.status_code == 200
+        assert response.get_data(as_text=True) == js
+        assert "immutable" in response.headers["Cache-Control"]
+
+    page = client.get("/empty").get_data(as_text=True)
+    assert page.count("<script") == 1
+    assert "jquery" in page
+    with app.test_request_context(), pt.raises(ValueError):
+        app.extensions["semantic"].require_js("carousel")
@@ -21,9 +21,11 @@
 # =====================================================================
 
 
-from flask import current_app
+from flask import current_app, url_for
 
-from flask_semanticui import cdn_base
+from flask_semanticui import cdn_base, core
+from flask_semanticui.assets import STATIC_ROOT
+from flask_semanticui.sri import cdn_integrity, integrity
 
 import pytest as pt
 
@@ -71,7 +73,57 @@ def test_semantic_get_sri(app, semantic):
             )
             == "sha256-CgSoWC9w5wNmI1aN8dIMK+6DPelUEtvDr+Bc2m/0Nx8="
         )
+        local = (STATIC_ROOT / "js/semantic/semantic.min.js").read_bytes()
+        assert semantic._get_sri(
+            name="semantic_js", version="2.4.2", sri=None
+        ) == integrity(local)
+
+        app.config["SEMANTIC_SERVE_LOCAL"] = False
+        assert (
+            semantic._get_sri(name="semantic_css", version="2.4.2", sri=None)
+            == semantic.semantic_css_integrity
+        )
+        assert semantic._get_sri(
+            name="jquery", version="3.1.1", sri=None
+        ) == cdn_integrity("jquery", "3.1.1", "jquery.min.js")
         assert (
-            semantic._get_sri(name="semantic_js", version="2.4.2", sri=None)
+            semantic._get_sri(name="jquery", version="0.0.0", sri=None)
             is None
         )
+
+
+def test_load_css_and_js_are_cached(app, semantic, monkeypatch):
+    calls = []
+
+    def counting_url_for(endpoint, **values):
+        calls.append(values["filename"])
+        return url_for(endpoint, **values)
+
+    monkeypatch.setattr(core, "url_for", counting_url_for)
+    assert len(semantic._asset_tags[app]) == 2
+
+    with app.test_request_context():
+        cdn_css = semantic.load_css()
+        assert semantic.load_css() is cdn_css
+        assert semantic.load_js() is semantic.load_js()
+        assert len(semantic._asset_tags[app]) == 2
+        assert semantic.load_css("2.4.1") is not cdn_css
+        assert "semantic-ui@2.4.1" in semantic.load_css("2.4.1")
+
+        app.config["SEMANTIC_SERVE_LOCAL"] = True
+        local_css = semantic.load_css()
+        assert "/static/semantic/css/semantic.local.min.css" in local_css
+        assert semantic.load_css() is local_css
+        semantic.load_js()
+        semantic.load_js()
+        assert len(calls) == 3
+
+    with app.test_request_context(base_url="http://localhost/app/"):
+        assert "/app/static/semantic/css/semantic.local.min.css" in (
+            semantic.load_css()
+        )
+
+    with app.test_request_context():
+        app.config["SEMANTIC_SERVE_LOCAL"] = False
+        assert semantic.load_css() is cdn_css
+    assert len(calls) == 4
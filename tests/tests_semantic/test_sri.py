@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import json
+import os
+
+from flask_semanticui import sri
+from flask_semanticui.assets import STATIC_ROOT, get_manifest
+from flask_semanticui.fonts import LOCAL_STYLESHEET
+from flask_semanticui.sri import (
+    REGISTRY_PATH,
+    SriManifest,
+    cdn_integrity,
+    get_sri_manifest,
+    integrity,
+)
+
+
+def test_integrity():
+    assert integrity(b"alert('Hello, world.');") == (
+        "sha384-H8BRh8j48O9oYatfu5AZzq6A9RINhZO5H16dQZngK7T62em8MUt1FLm52t"
+        "+eX6xO"
+    )
+    assert integrity(b"", "sha256") == (
+        "sha256-47DEQpj8HBSa+/TImW+5JCeuQeRkm5NMpJWZG3hSuFU="
+    )
+
+
+def test_cdn_integrity(tmp_path):
+    css = (STATIC_ROOT / "css/semantic.min.css").read_bytes()
+    assert cdn_integrity("semantic-ui", "2.4.2", "semantic.min.css") == (
+        integrity(css)
+    )
+    assert cdn_integrity("semantic-ui", "0.0.0", "semantic.min.css") is None
+    assert cdn_integrity("left-pad", "1.0.0", "index.js") is None
+
+    missing = tmp_path / "missing.json"
+    assert cdn_integrity("jquery", "3.1.1", "jquery.min.js", missing)
+    registry = tmp_path / "registry.json"
+    registry.write_text('{"left-pad": {"1.0.0": {"index.js": "sha384-x"}}}')
+    assert cdn_integrity("left-pad", "1.0.0", "index.js", registry) == (
+        "sha384-x"
+    )
+
+
+def test_sri_manifest_cache(tmp_path, monkeypatch):
+    root = tmp_path / "static"
+    (root / "js").mkdir(parents=True)
+    (root / "js/app.js").write_bytes(b"var a;")
+    (root / "js/app.js.gz").write_bytes(b"")
+    (root / "app.css").write_bytes(b"body{}")
+    cache_path = tmp_path / "sri.json"
+
+    manifest = SriManifest(root, cache_path)
+    assert manifest.local("js/app.js") == integrity(b"var a;")
+    assert manifest.local("js/app.js.gz") is None
+    cache = json.loads(cache_path.read_text())
+    assert sorted(cache) == ["app.css", "js/app.js"]
+
+    hashed = []
+    monkeypatch.setattr(
+        sri, "integrity", lambda data: hashed.append(data) or "sha384-x"
+    )
+    assert SriManifest(root, cache_path).build() == cache
+    assert hashed == []
+
+    (root / "app.css").write_bytes(b"body{margin:0}")
+    manifest = SriManifest(root, cache_path, max_workers=2)
+    assert manifest.local("app.css") == "sha384-x"
+    assert manifest.local("js/app.js") == integrity(b"var a;")
+    assert hashed == [b"body{margin:0}"]
+    assert json.loads(cache_path.read_text())["app.css"]["integrity"] == (
+        "sha384-x"
+    )
+
+
+def test_sri_manifest_without_cache_folder(tmp_path):
+    (tmp_path / "app.js").write_bytes(b"var a;")
+    cache_path = tmp_path / "instance" / "sri.json"
+    manifest = SriManifest(tmp_path, cache_path)
+    assert manifest.local("app.js") == integrity(b"var a;")
+    assert not cache_path.exists()
+    assert manifest.save(create=True)
+    assert cache_path.exists()
+    assert not SriManifest(tmp_path).save()
+
+
+def test_fingerprinted_stylesheet_integrity(app, semantic):
+    app.config["SEMANTIC_SERVE_LOCAL"] = True
+    app.config["SEMANTIC_FINGERPRINT"] = True
+    with app.test_request_context():
+        css = semantic.load_css()
+        js = semantic.load_js()
+    manifest = get_manifest()
+    asset = manifest.files[manifest.url_path(LOCAL_STYLESHEET)]
+    assert integrity(asset.data) in css
+    assert asset.path in css
+    local = (STATIC_ROOT / "js/semantic/jquery.min.js").read_bytes()
+    assert integrity(local) in js
+
+
+def test_cli_sri(app, tmp_path, monkeypatch):
+    cache_path = tmp_path / "instance" / "semantic-sri.json"
+    app.config["SEMANTIC_SRI_CACHE"] = str(cache_path)
+    registry = tmp_path / "registry.json"
+    registry.write_text("{}")
+    monkeypatch.setattr(
+        sri.urllib.request,
+        "urlopen",
+        lambda url: open(os.devnull, "rb"),
+    )
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(
+        args=[
+            "semantic",
+            "sri",
+            "--cdn",
+            "jquery@9.9.9",
+            "--registry",
+            str(registry),
+        ]
+    )
+    assert result.exit_code == 0, result.output
+    assert str(cache_path) in result.output
+    assert "css/semantic.min.css" in json.loads(cache_path.read_text())
+    assert get_sri_manifest(str(cache_path)).local(
+        "css/semantic.min.css"
+    ) == integrity((STATIC_ROOT / "css/semantic.min.css").read_bytes())
+    assert json.loads(registry.read_text()) == {
+        "jquery": {"9.9.9": {"jquery.min.js": integrity(b"")}}
+    }
+
+    # The default registry is in the instance folder, load_js reads it.
+    app.config["SEMANTIC_SRI_REGISTRY"] = str(tmp_path / "instance" / "r.json")
+    result = runner.invoke(args=["semantic", "sri", "--cdn", "jquery@9.9.8"])
+    assert result.exit_code == 0, result.output
+    assert app.config["SEMANTIC_SRI_REGISTRY"] in result.output
+    assert "9.9.8" not in REGISTRY_PATH.read_text()
+    with app.test_request_context():
+        js = app.extensions["semantic"].load_js(jq_version="9.9.8")
+    assert f'integrity="{integrity(b"")}"' in js
+
+    result = runner.invoke(args=["semantic", "sri", "--cdn", "jquery"])
+    assert result.exit_code == 2
+    assert "--cdn" in result.output
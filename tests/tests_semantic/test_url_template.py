@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of the
+#   Flask-SemanticUI Project (
+#                 https://github.com/juniors90/Flask-SemanticUI/
+#    ).
+# Copyright (c) 2021, Ferreira Juan David
+# License: MIT
+# Full Text:
+#    https://github.com/juniors90/Flask-SemanticUI/blob/master/LICENSE
+
+# =====================================================================
+# TESTS
+# =====================================================================
+
+import uuid
+
+from flask import url_for
+
+from flask_semanticui import urls
+from flask_semanticui.urls import UrlTemplate
+
+import pytest as pt
+
+from werkzeug.routing import BaseConverter
+
+
+class UpperConverter(BaseConverter):
+    def to_url(self, value):
+        return str(value).upper()
+
+
+@pt.fixture
+def routes(app):
+    app.url_map.converters["upper"] = UpperConverter
+
+    @app.route("/messages/<int:message_id>")
+    def view_message(message_id):
+        return ""
+
+    @app.route("/files/<path:filename>")
+    def view_file(filename):
+        return ""
+
+    @app.route("/tokens/<uuid:token>")
+    def view_token(token):
+        return ""
+
+    @app.route("/shouting/<upper:word>")
+    def shout(word):
+        return ""
+
+    @app.route("/posts/", defaults={"page": 1})
+    @app.route("/posts/<int:page>")
+    def posts(page):
+        return ""
+
+    @app.route("/search")
+    def search():
+        return ""
+
+
+@pt.fixture
+def url_for_calls(monkeypatch):
+    calls = []
+
+    def counting_url_for(endpoint, **values):
+        calls.append(endpoint)
+        return url_for(endpoint, **values)
+
+    monkeypatch.setattr(urls, "url_for", counting_url_for)
+    return calls
+
+
+@pt.mark.usefixtures("routes")
+@pt.mark.parametrize(
+    "endpoint, values, placeholder, samples",
+    [
+        ("view_message", {}, "message_id", [1, 42, "7"]),
+        ("view_file", {}, "filename", ["a b/c.txt", "ñandú?.png"]),
+        ("view_token", {}, "token", [uuid.uuid4(), uuid.uuid4()]),
+        ("search", {"q": "a&b", "x": 1}, "page", [1, "a b", "ü+/"]),
+        ("search", {"page": 0, "q": "a"}, "page", [3, "&"]),
+        ("view_message", {"next": "/a b"}, "message_id", [1, 2]),
+    ],
+)
+def test_url_template_matches_url_for(
+    app, url_for_calls, endpoint, values, placeholder, samples
+):
+    with app.test_request_context("/"):
+        template = UrlTemplate(endpoint, values, [placeholder])
+        for sample in samples:
+            expected = url_for(endpoint, **{**values, placeholder: sample})
+            assert template.build({placeholder: sample}) == expected
+    assert len(url_for_calls) == 1
+
+
+@pt.mark.usefixtures("routes")
+@pt.mark.parametrize(
+    "endpoint, placeholder, sample",
+    [
+        ("shout", "word", "hey"),
+        ("posts", "page", 2),
+        ("search", "q", None),
+        ("search", "q", ["a", "b"]),
+    ],
+)
+def test_url_template_falls_back_to_url_for(
+    app, url_for_calls, endpoint, placeholder, sample
+):
+    with app.test_request_context("/"):
+        template = UrlTemplate(endpoint, {}, [placeholder])
+        expected = url_for(endpoint, **{placeholder: sample})
+        assert template.build({placeholder: sample}) == expected
+    assert url_for_calls[-1] == endpoint
+
+
+def test_table_action_urls_build_once_per_table(app, client, url_for_calls):
+    @app.route("/messages/<int:message_id>")
+    def view_message(message_id):
+        return ""
+
+    data = [{"id": i, "text": f"Test message {i}"} for i in range(1, 11)]
+    with app.test_request_context("/"):
+        html = app.jinja_env.from_string(
+            """
+            {% from 'semantic/table.html' import render_ui_table %}
+            {{ render_ui_table(data, [('id', '#')], show_actions=True,
+            view_url=('view_message', [('message_id', ':id')]),
+            edit_url=('view_message', [('message_id', ':id')])) }}
+            """
+        ).render(data=data)
+    assert 'href="/messages/10"' in html
+    assert url_for_calls == ["view_message", "view_message"]